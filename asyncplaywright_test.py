@@ -0,0 +1,381 @@
+from test_settings import *
+from testing_scenario import TestingScenario
+from wait_strategy import auto_wait_delays, retry
+from browser_session import parse_script_arguments
+from resource_sampler import ProcessTreeSampler
+from playwright.async_api import async_playwright
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import asyncio
+import json
+import time
+import os
+
+
+class AsyncPlaywrightTestingApp(TestingScenario):
+    framework = ASYNC_PLAYWRIGHT
+    logs_directory = LOGS_ASYNC_PLAYWRIGHT_DIRECTORY
+    screenshots_directory = SCREENSHOTS_ASYNC_PLAYWRIGHT_DIRECTORY
+
+    def __init__(self, *args, concurrent_pages=CONCURRENT_PAGES, **kwargs):
+        """
+        This class runs the test cases with the asynchronous Playwright API. All browser commands
+        are executed on one event loop running on a background thread, and the test cases which
+        only read the page (CONCURRENT_TEST_CASES) are executed at the same time, each one
+        in its own page of the browser. The remaining test cases are executed one after another
+        in the main page. For every repetition the throughput in test cases per second and
+        the resource usage per test case of both phases are reported.
+
+        Args:
+            :concurrent_pages: (int) - The maximum number of test cases executed at the same time.
+            The remaining arguments are described in TestingScenario.
+        """
+        self.concurrent_pages = concurrent_pages
+        self.local = threading.local()
+        self.loop = asyncio.new_event_loop()
+        self.loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.loop_thread.start()
+        self.playwright = None
+        self.context = None
+        self.sampler = ProcessTreeSampler(os.getpid())
+        super().__init__(*args, **kwargs)
+
+    def call(self, coroutine):
+        """
+        Executes the coroutine on the event loop and waits for its result.
+
+        Args:
+            :coroutine: (coroutine) - A call of the asynchronous Playwright API.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    @property
+    def page(self):
+        """
+        The page used by the current thread: the main page or the page of a concurrent test case.
+        """
+        return self.local.page
+
+    def launch_browser(self, headless_mode, browser_endpoint):
+        """
+        Launches Chromium, or connects over CDP to the browser running at the endpoint if one is given.
+
+        Args:
+            :headless_mode: (bool) - Specifies whether the browser should run in headless mode.
+            :browser_endpoint: (str) - Optional remote debugging endpoint of an already running Chrome.
+        """
+        self.playwright = self.call(async_playwright().start())
+        if browser_endpoint:
+            self.browser = self.call(self.playwright.chromium.connect_over_cdp(browser_endpoint))
+        else:
+            self.browser = self.call(self.playwright.chromium.launch(headless=headless_mode))
+
+    def quit_browser(self):
+        """
+        Closes the browser context, the browser, and the Playwright driver, then stops the event loop.
+        The connection to a browser attached through its endpoint is closed, the browser keeps running.
+        """
+        if self.context:
+            self.call(self.context.close())
+        self.call(self.browser.close())
+        self.call(self.playwright.stop())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.loop_thread.join()
+
+    def reset_page(self):
+        """
+        Uses a new browser context for every repetition, shared by the main page and the concurrent pages.
+        """
+        if self.context:
+            self.call(self.context.close())
+        self.context = self.call(self.browser.new_context(viewport={"width": WINDOW_WIDTH, "height": WINDOW_HEIGHT}))
+        self.open_page()
+
+    def open_page(self):
+        """
+        Opens the testing application in a new page used by the current thread.
+        """
+        self.local.page = self.call(self.context.new_page())
+        self.local.cdp_session = None
+        self.call(self.local.page.goto(self.app_url))
+
+    def run_concurrent_test_case(self, test_case):
+        """
+        Executes a test case in its own page, closed afterwards.
+
+        Args:
+            :test_case: (str) - The name of the test case method.
+        """
+        self.open_page()
+        try:
+            self.run_test_case(test_case)
+        finally:
+            self.evict_cached_elements(self.page)
+            self.call(self.local.page.close())
+
+    def run_all_test_cases(self):
+        """
+        Executes the read-only test cases concurrently in separate pages, then the remaining
+        test cases in the main page, and reports the throughput and resource usage of both phases.
+        """
+        test_cases = self.get_test_cases()
+        concurrent_test_cases = [
+            test_case for test_case in test_cases if int(test_case.rsplit("_", 1)[-1]) in CONCURRENT_TEST_CASES
+        ]
+        sequential_test_cases = [test_case for test_case in test_cases if test_case not in concurrent_test_cases]
+
+        before = self.sampler.sample()
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrent_pages) as executor:
+            for future in [executor.submit(self.run_concurrent_test_case, test_case) for test_case in concurrent_test_cases]:
+                future.result()
+        concurrent = self.get_phase_record(concurrent_test_cases, before, start_time)
+
+        before = self.sampler.sample()
+        start_time = time.perf_counter()
+        for test_case in sequential_test_cases:
+            self.run_test_case(test_case)
+        sequential = self.get_phase_record(sequential_test_cases, before, start_time)
+
+        self.log(f"{THROUGHPUT_PREFIX} " + json.dumps({
+            "repetition": self.profiler.repetition,
+            "concurrent_pages": self.concurrent_pages,
+            **{f"concurrent_{key}": value for key, value in concurrent.items()},
+            **{f"sequential_{key}": value for key, value in sequential.items()},
+        }))
+
+    def get_phase_record(self, test_cases, before, start_time):
+        """
+        Returns the throughput and the resource usage per test case of a phase of the repetition.
+
+        Args:
+            :test_cases: (list) - The test cases executed in the phase.
+            :before: (dict) - The counters of the process tree read at the start of the phase.
+            :start_time: (float) - The time.perf_counter() value at the start of the phase.
+        """
+        duration = time.perf_counter() - start_time
+        after = self.sampler.sample()
+        count = max(len(test_cases), 1)
+        return {
+            "cases": len(test_cases),
+            "duration": round(duration, 3),
+            "cases_per_second": round(len(test_cases) / duration, 3) if duration > 0 else 0,
+            "cpu_time_per_case": round((after["cpu_time"] - before["cpu_time"]) / count, 4),
+            "context_switches_per_case": round((after["context_switches"] - before["context_switches"]) / count, 1),
+            "rss_bytes": after["rss_bytes"],
+        }
+
+    def capture_screenshot(self, image_format, quality):
+        """
+        PNG and JPEG screenshots use the Playwright API, WebP screenshots are encoded by Chrome through CDP.
+
+        Args:
+            :image_format: (str) - The image format: png, jpeg or webp.
+            :quality: (int) - The quality of JPEG and WebP screenshots.
+        """
+        if image_format == SCREENSHOT_MODE_PNG:
+            return self.call(self.page.screenshot())
+        if image_format == SCREENSHOT_MODE_JPEG:
+            return self.call(self.page.screenshot(type=SCREENSHOT_MODE_JPEG, quality=quality))
+        if self.local.cdp_session is None:
+            self.local.cdp_session = self.call(self.context.new_cdp_session(self.page))
+        return self.call(self.local.cdp_session.send("Page.captureScreenshot", {"format": image_format, "quality": quality}))["data"]
+
+    def get_title(self):
+        """
+        Returns the title of the current page.
+        """
+        return self.call(self.page.title())
+
+    def reload(self):
+        """
+        Reloads the current page.
+        """
+        self.call(self.page.reload())
+
+    def wait_for_visible(self, selector, timeout):
+        """
+        Waits on the event loop until the element matching the CSS selector is visible,
+        raising Playwright's TimeoutError after the timeout.
+
+        Args:
+            :selector: (str) - The CSS selector of the element.
+            :timeout: (float) - Maximum time to wait, in seconds.
+        """
+        self.call(self.page.wait_for_selector(selector, state=VISIBLE, timeout=timeout * 1000))
+
+    def wait_natively(self, check, timeout):
+        """
+        Repeats the check on the retry schedule of Playwright's auto-waiting assertions,
+        pausing the test thread while the event loop keeps serving the other pages.
+
+        Args:
+            :check: (callable) - Function which reads the state and returns whether it is the expected one.
+            :timeout: (float) - Maximum time to wait, in seconds.
+        """
+        deadline_ns = time.perf_counter_ns() + int(timeout * 1e9)
+        return retry(
+            check, deadline_ns, auto_wait_delays(), lambda seconds: self.call(self.page.wait_for_timeout(seconds * 1000))
+        )
+
+    def locate(self, selector):
+        """
+        Returns a locator of the first element matching the CSS selector, resolved again on every action.
+
+        Args:
+            :selector: (str) - The CSS selector of the element.
+        """
+        return self.page.locator(selector).first
+
+    def get_page_key(self):
+        """
+        Returns the page used by the current thread, so the concurrent pages do not share cached elements.
+        """
+        return self.page
+
+    def click(self, element):
+        """
+        Clicks the centre of the element after Playwright's actionability checks.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+        """
+        self.call(element.click())
+
+    def hover(self, element):
+        """
+        Moves the mouse over the centre of the element.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+        """
+        self.call(element.hover())
+
+    def move_mouse_away(self):
+        """
+        Moves the mouse to the top left corner of the page.
+        """
+        self.call(self.page.mouse.move(0, 0))
+
+    def type_text(self, element, text):
+        """
+        Like the WebDriver clear command, fails at once on an element which is not editable,
+        instead of waiting for it to become editable.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+            :text: (str) - The text to type.
+        """
+        if not self.call(element.is_editable()):
+            raise ValueError("Element is not editable.")
+        self.call(element.fill(""))
+        self.call(element.press_sequentially(text))
+
+    def drag(self, element, x_offset):
+        """
+        Presses the mouse on the centre of the element's bounding box, moves it horizontally
+        by the given offset and releases it.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+            :x_offset: (int) - The horizontal offset in pixels.
+        """
+        box = self.call(element.bounding_box())
+        x, y = box["x"] + box["width"] / 2, box["y"] + box["height"] / 2
+        self.call(self.page.mouse.move(x, y))
+        self.call(self.page.mouse.down())
+        self.call(self.page.mouse.move(x + x_offset, y))
+        self.call(self.page.mouse.up())
+
+    def select_option(self, element, value):
+        """
+        Selects the option with the given value in the select element.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+            :value: (str) - The value of the option.
+        """
+        self.call(element.select_option(value))
+
+    def is_visible(self, element):
+        """
+        Returns whether the element is visible.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+        """
+        return self.call(element.is_visible())
+
+    def is_checked(self, element):
+        """
+        Returns whether the checkbox or radio button is checked.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+        """
+        return self.call(element.is_checked())
+
+    def get_text(self, element):
+        """
+        Returns the rendered text of the element.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+        """
+        return self.call(element.inner_text())
+
+    def get_value(self, element):
+        """
+        Returns the current value property of the element as a string.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+        """
+        return self.call(element.evaluate("element => String(element.value)"))
+
+    def get_attribute(self, element, name):
+        """
+        Returns the value of the HTML attribute of the element.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+            :name: (str) - The name of the attribute.
+        """
+        return self.call(element.get_attribute(name))
+
+    def get_css_property(self, element, name):
+        """
+        Returns the computed value of the CSS property of the element, read with getComputedStyle.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+            :name: (str) - The name of the CSS property.
+        """
+        return self.call(element.evaluate("(element, name) => getComputedStyle(element).getPropertyValue(name)", name))
+
+    def evaluate(self, script, argument):
+        """
+        Executes the JavaScript function in the page and returns its result.
+
+        Args:
+            :script: (str) - The source of a function with one parameter, e.g. "(argument) => ...".
+            :argument: (object) - A JSON-serializable value passed to the function.
+        """
+        return self.call(self.page.evaluate(script, argument))
+
+
+if __name__ == "__main__":
+    arguments = parse_script_arguments()
+
+    app = AsyncPlaywrightTestingApp(
+        arguments.headless_mode, arguments.browser_endpoint, arguments.profile_test_cases,
+        arguments.screenshots, arguments.screenshot_quality, arguments.app_url, arguments.batched_reads,
+        arguments.element_cache, arguments.wait_strategy, arguments.wait_interval, arguments.wait_timeout,
+        concurrent_pages=arguments.concurrent_pages,
+    )
+    app.run_repetitions(arguments.repetitions)
+    if arguments.dom_benchmark:
+        app.run_dom_benchmark(arguments.dom_benchmark)
+    if arguments.wait_benchmark:
+        app.run_wait_benchmark(arguments.wait_benchmark)
+    app.close()
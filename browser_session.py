@@ -0,0 +1,153 @@
+from test_settings import *
+from urllib.request import urlopen
+from urllib.error import URLError
+import subprocess
+import argparse
+import tempfile
+import time
+import json
+
+
+def positive_int(value):
+    """
+    Converts a command line argument to an integer of at least 1, reporting other values as invalid.
+
+    Args:
+        :value: (str) - The value of the argument.
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+def positive_float(value):
+    """
+    Converts a command line argument to a number greater than 0, reporting other values as invalid.
+
+    Args:
+        :value: (str) - The value of the argument.
+    """
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive number")
+    return number
+
+def parse_script_arguments():
+    """
+    Parses the command line arguments shared by all testing scripts.
+    """
+    parser = argparse.ArgumentParser(description="Runs all test cases of the testing application.")
+    parser.add_argument("headless_mode", nargs="?", default="True", help="True or False (default: True)")
+    parser.add_argument("--repetitions", type=positive_int, default=1,
+                        help="number of repetitions of all test cases in the same browser (default: 1)")
+    parser.add_argument("--browser-endpoint",
+                        help="remote debugging endpoint of an already running Chrome, e.g. http://127.0.0.1:9222")
+    parser.add_argument("--profile-test-cases", action="store_true",
+                        help="report the duration and resource usage of every test case")
+    parser.add_argument("--screenshots", choices=SCREENSHOT_MODES, default=SCREENSHOT_MODE_PNG,
+                        help=f"screenshot mode (default: {SCREENSHOT_MODE_PNG})")
+    parser.add_argument("--screenshot-quality", type=int, default=SCREENSHOT_QUALITY,
+                        help=f"quality of JPEG and WebP screenshots (default: {SCREENSHOT_QUALITY})")
+    parser.add_argument("--app-url",
+                        help="URL of the testing application, e.g. served by testing_app_server.py (default: the file:// page)")
+    parser.add_argument("--batched-reads", action="store_true",
+                        help="read the states of groups of elements in a single script round-trip")
+    parser.add_argument("--element-cache", action="store_true",
+                        help="reuse the element handles found on the page until it is reset or reloaded")
+    parser.add_argument("--wait-strategy", choices=WAIT_STRATEGIES, default=WAIT_STRATEGY_DEFAULT,
+                        help=f"how the test cases wait for the state of the page to change after an action (default: {WAIT_STRATEGY_DEFAULT})")
+    parser.add_argument("--wait-interval", type=float, default=WAIT_INTERVAL,
+                        help=f"polling interval, or first interval of the backoff, in seconds (default: {WAIT_INTERVAL})")
+    parser.add_argument("--wait-timeout", type=float, default=WAIT_TIMEOUT,
+                        help=f"maximum time to wait for a single state change, in seconds (default: {WAIT_TIMEOUT})")
+    parser.add_argument("--dom-benchmark", type=positive_int, default=0, metavar="ITERATIONS",
+                        help="after the repetitions, measure the lookup, text and screenshot operations (default: off)")
+    parser.add_argument("--wait-benchmark", type=positive_int, default=0, metavar="ITERATIONS",
+                        help="after the repetitions, measure how quickly every wait strategy notices a change (default: off)")
+    parser.add_argument("--concurrent-pages", type=positive_int, default=CONCURRENT_PAGES,
+                        help=f"number of pages running the read-only test cases at once, async Playwright only (default: {CONCURRENT_PAGES})")
+    return parser.parse_args()
+
+def get_debugger_address(browser_endpoint):
+    """
+    Returns the 'host:port' address expected by ChromeDriver from the browser endpoint URL.
+
+    Args:
+        :browser_endpoint: (str) - The remote debugging endpoint of the browser.
+    """
+    return browser_endpoint.split("://")[-1].rstrip("/")
+
+def wait_for_browser_endpoint(browser_endpoint, timeout=SHARED_BROWSER_START_TIMEOUT):
+    """
+    Waits until the browser accepts remote debugging connections and returns its version information.
+
+    Args:
+        :browser_endpoint: (str) - The remote debugging endpoint of the browser.
+        :timeout: (float) - Maximum time to wait, in seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urlopen(f"{browser_endpoint}/json/version", timeout=1) as response:
+                return json.load(response)
+        except (URLError, ConnectionError):
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Browser did not open the endpoint {browser_endpoint} in {timeout} seconds.")
+            time.sleep(0.1)
+
+def get_chromium_executable_path():
+    """
+    Returns the path of the Chromium browser installed by Playwright.
+    """
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        return p.chromium.executable_path
+
+def launch_shared_browser(headless_mode, port=SHARED_BROWSER_PORT, executable_path=None):
+    """
+    Launches a long-lived Chrome with remote debugging enabled, to which all testing
+    scripts can attach instead of launching their own browser. Returns the browser
+    process and its endpoint.
+
+    Args:
+        :headless_mode: (bool) - Specifies whether the browser should run in headless mode.
+        :port: (int) - The remote debugging port.
+        :executable_path: (str) - Optional path of the Chrome executable, Playwright's Chromium by default.
+    """
+    browser_endpoint = f"http://127.0.0.1:{port}"
+    command = [
+        executable_path or get_chromium_executable_path(),
+        f"--remote-debugging-port={port}",
+        f"--user-data-dir={tempfile.mkdtemp(prefix='shared_browser_')}",
+        f"--window-size={WINDOW_WIDTH},{WINDOW_HEIGHT}",
+        "--no-first-run",
+        "--no-default-browser-check",
+    ]
+    if headless_mode:
+        command.append("--headless=new")
+    command.append("about:blank")
+
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    wait_for_browser_endpoint(browser_endpoint)
+    return process, browser_endpoint
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Launches a shared browser for the testing scripts.")
+    parser.add_argument("headless_mode", nargs="?", default="True", help="True or False (default: True)")
+    parser.add_argument("--port", type=int, default=SHARED_BROWSER_PORT,
+                        help=f"remote debugging port (default: {SHARED_BROWSER_PORT})")
+    parser.add_argument("--executable-path", help="path of the Chrome executable (default: Playwright's Chromium)")
+    arguments = parser.parse_args()
+
+    process, browser_endpoint = launch_shared_browser(
+        arguments.headless_mode == "True", arguments.port, arguments.executable_path
+    )
+    print(f"Shared browser is running, endpoint: {browser_endpoint}")
+    print("Press Ctrl+C to stop it.")
+    try:
+        process.wait()
+    except KeyboardInterrupt:
+        process.terminate()
+        process.wait()
@@ -0,0 +1,130 @@
+from test_settings import *
+import statistics
+import psutil
+import time
+import os
+
+
+class EnvironmentGuard:
+    def __init__(self, cpus=None, system_wide=True, check_stray_processes=True, timeout=IDLE_TIMEOUT):
+        """
+        This class prepares the environment before a measured run. It waits until the CPU usage,
+        the disk IO and the number of processes settle below thresholds, measures a baseline
+        distribution of CPU and memory usage over a few seconds, and checks that no browser or
+        driver processes of earlier runs are left. A run started in a busy environment is
+        marked as contaminated, together with the reasons.
+
+        Args:
+            :cpus: (list) - Optional CPUs whose usage is checked, all CPUs by default.
+                Used when parallel runs are pinned to disjoint CPU slots.
+            :system_wide: (bool) - Specifies whether the system-wide disk IO and number of processes
+                are checked. Disabled for parallel runs, which change them all the time.
+            :check_stray_processes: (bool) - Specifies whether stray browser and driver processes are looked for.
+                Disabled when the runs share a browser which is kept running on purpose.
+            :timeout: (float) - Maximum time of waiting for the environment to settle, in seconds.
+        """
+        self.cpus = cpus
+        self.system_wide = system_wide
+        self.check_stray_processes = check_stray_processes
+        self.timeout = timeout
+
+    def cpu_percentage(self, interval):
+        """
+        Returns the CPU usage of the checked CPUs measured over the interval.
+
+        Args:
+            :interval: (float) - The time of the measurement, in seconds.
+        """
+        percentages = psutil.cpu_percent(interval=interval, percpu=True)
+        if self.cpus:
+            percentages = [percentages[cpu] for cpu in self.cpus if cpu < len(percentages)]
+        return sum(percentages) / len(percentages)
+
+    def find_stray_processes(self):
+        """
+        Returns the names and PIDs of browser and driver processes started by automation tools
+        which are not descendants of the analyser, e.g. a Chrome left behind by an earlier run.
+        """
+        own_pids = {os.getpid()} | {child.pid for child in psutil.Process().children(recursive=True)}
+        stray_processes = []
+        for process in psutil.process_iter(["pid", "name", "cmdline"]):
+            name = (process.info["name"] or "").lower()
+            if process.info["pid"] in own_pids or not any(name.startswith(prefix) for prefix in STRAY_PROCESS_NAMES):
+                continue
+            command_line = " ".join(process.info["cmdline"] or [])
+            if "driver" in name or any(marker in command_line for marker in STRAY_PROCESS_MARKERS):
+                stray_processes.append(f"{name}({process.info['pid']})")
+        return stray_processes
+
+    def wait_for_idle(self):
+        """
+        Waits until the environment has been quiet for IDLE_SETTLE_CHECKS consecutive checks or the timeout expires.
+        Returns whether the environment has settled and the waiting time in seconds.
+        """
+        start_time = time.perf_counter()
+        previous_time = start_time
+        previous_disk_io = psutil.disk_io_counters()
+        previous_process_count = len(psutil.pids())
+        quiet_checks = 0
+        while True:
+            cpu_percentage = self.cpu_percentage(IDLE_CHECK_INTERVAL)
+            current_time = time.perf_counter()
+            disk_io = psutil.disk_io_counters()
+            process_count = len(psutil.pids())
+
+            quiet = cpu_percentage <= IDLE_CPU_THRESHOLD
+            if self.system_wide:
+                if disk_io and previous_disk_io:
+                    io_bytes = (disk_io.read_bytes + disk_io.write_bytes) - (previous_disk_io.read_bytes + previous_disk_io.write_bytes)
+                    quiet = quiet and io_bytes / (current_time - previous_time) <= IDLE_IO_THRESHOLD
+                quiet = quiet and abs(process_count - previous_process_count) <= IDLE_PROCESS_COUNT_THRESHOLD
+            if self.check_stray_processes:
+                quiet = quiet and not self.find_stray_processes()
+            quiet_checks = quiet_checks + 1 if quiet else 0
+
+            if quiet_checks >= IDLE_SETTLE_CHECKS:
+                return True, current_time - start_time
+            if current_time - start_time >= self.timeout:
+                return False, current_time - start_time
+            previous_time, previous_disk_io, previous_process_count = current_time, disk_io, process_count
+
+    def measure_baseline(self):
+        """
+        Returns the CPU and memory usage percentages sampled during BASELINE_DURATION seconds.
+        """
+        cpu_percentages = []
+        memory_percentages = []
+        end_time = time.perf_counter() + BASELINE_DURATION
+        while time.perf_counter() < end_time:
+            cpu_percentages.append(round(self.cpu_percentage(BASELINE_INTERVAL), 1))
+            memory_percentages.append(round(psutil.virtual_memory().percent, 1))
+        return cpu_percentages, memory_percentages
+
+    def prepare(self):
+        """
+        Waits for the environment to settle, measures the baseline and checks for stray processes.
+        Returns the baseline values (medians and distributions), the waiting time,
+        the stray processes and the reasons why the run is contaminated, empty for a clean run.
+        """
+        settled, idle_wait_time = self.wait_for_idle()
+        cpu_percentages, memory_percentages = self.measure_baseline()
+        stray_processes = self.find_stray_processes() if self.check_stray_processes else []
+
+        contamination_reasons = []
+        if not settled:
+            contamination_reasons.append(f"environment not settled within {self.timeout} s")
+        if stray_processes:
+            contamination_reasons.append(f"stray processes: {', '.join(stray_processes)}")
+        cpu_percentile = statistics.quantiles(cpu_percentages, n=10)[-1] if len(cpu_percentages) > 1 else cpu_percentages[0]
+        if cpu_percentile > IDLE_CPU_THRESHOLD:
+            contamination_reasons.append(f"90th percentile of CPU usage {cpu_percentile:.1f}% during the baseline")
+
+        return {
+            "cpu_usage_before": round(statistics.median(cpu_percentages), 1),
+            "memory_usage_before": round(statistics.median(memory_percentages), 1),
+            "baseline_cpu_percentages": cpu_percentages,
+            "baseline_memory_percentages": memory_percentages,
+            "idle_wait_time": round(idle_wait_time, 3),
+            "stray_processes": stray_processes,
+            "contamination_reasons": contamination_reasons,
+        }
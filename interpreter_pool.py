@@ -0,0 +1,161 @@
+from test_settings import *
+from collections import deque
+import subprocess
+import importlib
+import threading
+import runpy
+import json
+import time
+import sys
+import os
+
+
+def get_script_command(script_path, headless_mode, script_arguments=()):
+    """
+    Returns the argument list which executes the test script directly with the current interpreter.
+
+    Args:
+        :script_path: (str) - The path to the script to be executed.
+        :headless_mode: (bool) - Specifies whether the script should run in headless mode.
+        :script_arguments: (list) - Additional command line arguments of the script.
+    """
+    return [sys.executable, script_path, str(headless_mode), *script_arguments]
+
+def get_script_environment():
+    """
+    Returns the environment of the test script process, with unbuffered output,
+    so the script results can be read while it is running.
+    """
+    return {**os.environ, "PYTHONUNBUFFERED": "1"}
+
+
+class WarmInterpreter:
+    def __init__(self, script_path):
+        """
+        This class starts an interpreter which imports the test script module (and therefore
+        the testing framework) in advance and waits for the command to run it.
+        The time from the start of the process until it is ready is the interpreter
+        startup cost, which is measured separately from the test execution.
+
+        Args:
+            :script_path: (str) - The path to the script which the interpreter will execute.
+        """
+        self.script_path = script_path
+        start_time = time.perf_counter()
+        self.process = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), WARM_WORKER_ARGUMENT, script_path],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=get_script_environment(),
+            start_new_session=True,
+        )
+        ready_line = self.process.stdout.readline().decode("utf-8").split()
+        if not ready_line or ready_line[0] != WARM_WORKER_READY_MESSAGE:
+            self.process.kill()
+            self.process.wait()
+            raise RuntimeError(f"Warm interpreter for {script_path} failed to start: {self.process.stderr.read().decode()}")
+        self.startup_time = round(time.perf_counter() - start_time, 3)
+        self.import_time = float(ready_line[1])
+
+    def run(self, headless_mode, script_arguments=()):
+        """
+        Sends the command which starts the test script in the already running interpreter.
+
+        Args:
+            :headless_mode: (bool) - Specifies whether the script should run in headless mode.
+            :script_arguments: (list) - Additional command line arguments of the script.
+        """
+        command = json.dumps([self.script_path, str(headless_mode), *script_arguments])
+        self.process.stdin.write(f"{command}\n".encode("utf-8"))
+        self.process.stdin.close()
+        return self.process
+
+    def close(self):
+        """
+        Stops the interpreter if it has not been used.
+        """
+        if self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+
+
+class WarmInterpreterPool:
+    def __init__(self, scripts, size=1):
+        """
+        This class keeps a number of pre-started interpreters with the testing frameworks
+        already imported for every test script. Every interpreter is used for one run only,
+        and a new one is started after the measured run has finished, so starting
+        interpreters never disturbs the measurement.
+
+        Args:
+            :scripts: (list) - The paths of the test scripts.
+            :size: (int) - The number of ready interpreters kept for every script.
+        """
+        self.size = size
+        self.lock = threading.Lock()
+        self.interpreters = {script: deque() for script in scripts}
+
+    def start(self):
+        """
+        Starts all interpreters of the pool.
+        """
+        for script in self.interpreters:
+            for _ in range(self.size):
+                self.replenish(script)
+
+    def acquire(self, script_path):
+        """
+        Returns a ready interpreter for the given script, starting a new one if the pool is empty.
+
+        Args:
+            :script_path: (str) - The path to the script to be executed.
+        """
+        with self.lock:
+            interpreters = self.interpreters.setdefault(script_path, deque())
+            if interpreters:
+                return interpreters.popleft()
+        return WarmInterpreter(script_path)
+
+    def replenish(self, script_path):
+        """
+        Starts a new interpreter for the given script if the pool is not full.
+
+        Args:
+            :script_path: (str) - The path to the script which the interpreter will execute.
+        """
+        with self.lock:
+            if len(self.interpreters.setdefault(script_path, deque())) >= self.size:
+                return
+        interpreter = WarmInterpreter(script_path)
+        with self.lock:
+            self.interpreters[script_path].append(interpreter)
+
+    def close(self):
+        """
+        Stops all unused interpreters of the pool.
+        """
+        with self.lock:
+            for interpreters in self.interpreters.values():
+                while interpreters:
+                    interpreters.popleft().close()
+
+
+def warm_worker(script_path):
+    """
+    The entry point of a warm interpreter. Imports the test script module, reports
+    that it is ready, and then executes the script as __main__ with the received arguments.
+
+    Args:
+        :script_path: (str) - The path to the script which will be executed.
+    """
+    start_time = time.perf_counter()
+    sys.path.insert(0, os.path.dirname(os.path.abspath(script_path)))
+    importlib.import_module(os.path.splitext(os.path.basename(script_path))[0])
+    import_time = round(time.perf_counter() - start_time, 3)
+    print(f"{WARM_WORKER_READY_MESSAGE} {import_time}", flush=True)
+
+    sys.argv = json.loads(sys.stdin.readline())
+    runpy.run_path(script_path, run_name="__main__")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == WARM_WORKER_ARGUMENT:
+        warm_worker(sys.argv[2])
@@ -0,0 +1,161 @@
+from test_settings import *
+from datetime import datetime as dt
+from logging.handlers import RotatingFileHandler
+import threading
+import logging
+import json
+import time
+import re
+import os
+
+TEST_CASE_PATTERN = re.compile(r"Test case (\d+): (PASSED|FAILED)!?\s*(.*)")
+BROWSER_LAUNCH_PATTERN = re.compile(r"Browser launch time: ([\d.]+) s")
+REPETITION_PATTERN = re.compile(r"Repetition (\d+): ([\d.]+) s")
+
+
+class OutputCapture:
+    def __init__(self, process, log_filename, start_time, on_event=None):
+        """
+        This class drains the standard output and standard error of the test script
+        on background threads, so the child never blocks on a full pipe buffer.
+        Every line is timestamped and written to a rotating log file, and lines
+        reporting a test case result are parsed into structured events.
+
+        Args:
+            :process: (subprocess.Popen) - The test script process with piped stdout and stderr.
+            :log_filename: (str) - The path of the log file for the captured output.
+            :start_time: (float) - The time.perf_counter() value at which the script was started.
+            :on_event: (callable) - Optional function called with every parsed test case event.
+        """
+        self.start_time = start_time
+        self.on_event = on_event
+        self.events = []
+        self.browser_launch_time = ""
+        self.repetition_times = []
+        self.test_case_profiles = []
+        self.screenshot_stats = {}
+        self.throughputs = []
+        self.dom_benchmark = {}
+        self.state_reads = {}
+        self.element_cache = {}
+        self.wait_stats = {}
+        self.wait_benchmark = []
+        self.timeout_screenshot = ""
+        self.last_output_time = start_time
+        self.events_lock = threading.Lock()
+
+        log_directory = os.path.dirname(log_filename)
+        if log_directory and not os.path.exists(log_directory):
+            os.makedirs(log_directory)
+        self.handler = RotatingFileHandler(
+            log_filename, maxBytes=OUTPUT_LOG_MAX_BYTES, backupCount=OUTPUT_LOG_BACKUP_COUNT, encoding="utf-8"
+        )
+        self.handler.setFormatter(logging.Formatter("%(message)s"))
+        self.logger = logging.Logger(f"output_capture.{log_filename}", logging.INFO)
+        self.logger.addHandler(self.handler)
+
+        self.threads = [
+            threading.Thread(target=self.drain, args=(stream, name), daemon=True)
+            for stream, name in [(process.stdout, "stdout"), (process.stderr, "stderr")]
+            if stream is not None
+        ]
+
+    def start(self):
+        """
+        Starts reading both output streams.
+        """
+        for thread in self.threads:
+            thread.start()
+
+    def drain(self, stream, stream_name):
+        """
+        Reads the given stream line by line until it is closed by the child process.
+        A malformed line is logged and skipped, so reading never stops before the stream is closed.
+
+        Args:
+            :stream: (file) - The binary pipe to read from.
+            :stream_name: (str) - The name of the stream written to the log file.
+        """
+        for raw_line in iter(stream.readline, b""):
+            self.last_output_time = time.perf_counter()
+            elapsed_time = self.last_output_time - self.start_time
+            line = raw_line.decode("utf-8", errors="replace").rstrip()
+            timestamp = dt.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            self.logger.info(f"[{timestamp}] [+{elapsed_time:.3f}] [{stream_name}] {line}")
+            if stream_name == "stdout":
+                try:
+                    self.parse_line(line, elapsed_time)
+                except ValueError as e:
+                    self.logger.info(f"[{timestamp}] [+{elapsed_time:.3f}] [capture] Malformed line not parsed: {e}")
+        stream.close()
+
+    def parse_line(self, line, elapsed_time):
+        """
+        Creates a test case event if the line reports the result of a test case
+        and records the browser launch time, repetition durations, test case profiles,
+        throughputs of concurrent test cases, the DOM and wait benchmarks, waits, state reads,
+        the element cache and screenshot statistics.
+
+        Args:
+            :line: (str) - A single line printed by the test script.
+            :elapsed_time: (float) - Seconds elapsed since the script was started.
+        """
+        if TEST_CASE_PROFILE_PREFIX in line:
+            self.test_case_profiles.append(json.loads(line.split(TEST_CASE_PROFILE_PREFIX, 1)[1]))
+            return
+        if THROUGHPUT_PREFIX in line:
+            self.throughputs.append(json.loads(line.split(THROUGHPUT_PREFIX, 1)[1]))
+            return
+        if DOM_BENCHMARK_PREFIX in line:
+            self.dom_benchmark = json.loads(line.split(DOM_BENCHMARK_PREFIX, 1)[1])
+            return
+        if STATE_READS_PREFIX in line:
+            self.state_reads = json.loads(line.split(STATE_READS_PREFIX, 1)[1])
+            return
+        if WAIT_STATS_PREFIX in line:
+            self.wait_stats = json.loads(line.split(WAIT_STATS_PREFIX, 1)[1])
+            return
+        if WAIT_BENCHMARK_PREFIX in line:
+            self.wait_benchmark.append(json.loads(line.split(WAIT_BENCHMARK_PREFIX, 1)[1]))
+            return
+        if ELEMENT_CACHE_PREFIX in line:
+            self.element_cache = json.loads(line.split(ELEMENT_CACHE_PREFIX, 1)[1])
+            return
+        if SCREENSHOT_STATS_PREFIX in line:
+            self.screenshot_stats = json.loads(line.split(SCREENSHOT_STATS_PREFIX, 1)[1])
+            return
+        if WATCHDOG_SCREENSHOT_PREFIX in line:
+            self.timeout_screenshot = line.split(WATCHDOG_SCREENSHOT_PREFIX, 1)[1].strip()
+            return
+        match = BROWSER_LAUNCH_PATTERN.search(line)
+        if match:
+            self.browser_launch_time = float(match.group(1))
+            return
+        match = REPETITION_PATTERN.search(line)
+        if match:
+            self.repetition_times.append(float(match.group(2)))
+            return
+        match = TEST_CASE_PATTERN.search(line)
+        if not match:
+            return
+        event = {
+            "test_case": int(match.group(1)),
+            "status": match.group(2),
+            "time": round(elapsed_time, 3),
+            "message": match.group(3),
+        }
+        with self.events_lock:
+            self.events.append(event)
+        if self.on_event:
+            self.on_event(event)
+
+    def join(self):
+        """
+        Waits until both streams are fully read and closes the log file.
+        Browser processes which outlive the script may keep the pipes open,
+        so the wait is limited by OUTPUT_DRAIN_TIMEOUT.
+        """
+        for thread in self.threads:
+            thread.join(OUTPUT_DRAIN_TIMEOUT)
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
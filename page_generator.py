@@ -0,0 +1,143 @@
+from test_settings import *
+from html.parser import HTMLParser
+from html import escape
+import argparse
+import shutil
+import os
+
+SHADOW_CONTENT = "<div><span>Shadow text</span><input type='text'><button type='button'>Shadow button</button></div>"
+SHADOW_ELEMENTS = 4
+SHADOW_SCRIPT = f"""
+      <script>
+         document.querySelectorAll("stress-host").forEach(function (host) {{
+            host.attachShadow({{mode: "open"}}).innerHTML = "{SHADOW_CONTENT}";
+         }});
+      </script>"""
+
+
+class ElementCounter(HTMLParser):
+    def __init__(self):
+        """
+        This class counts the elements of an HTML document.
+        """
+        super().__init__()
+        self.count = 0
+
+    def handle_starttag(self, tag, attrs):
+        self.count += 1
+
+
+def count_base_elements(directory=TESTING_APP_DIRECTORY):
+    """
+    Returns the number of elements of the original testing application.
+
+    Args:
+        :directory: (str) - The directory with the files of the testing application.
+    """
+    counter = ElementCounter()
+    with open(os.path.join(directory, "index.html"), encoding="utf-8") as index_file:
+        counter.feed(index_file.read())
+    return counter.count
+
+def count_elements(variant):
+    """
+    Returns the number of elements of a variant of the testing application, including
+    the elements in shadow roots and in the documents of iframes.
+
+    Args:
+        :variant: (str) - The name of one of DOM_SIZE_VARIANTS.
+    """
+    parameters = DOM_SIZE_VARIANTS[variant]
+    table_elements = 2 + parameters["rows"] * (1 + DOM_TABLE_COLUMNS) if parameters["rows"] else 0
+    nested_elements = parameters["nested_blocks"] * (parameters["nesting_depth"] + 1)
+    shadow_elements = parameters["shadow_hosts"] * (1 + SHADOW_ELEMENTS)
+    iframe_elements = parameters["iframes"] * (1 + 2 + DOM_IFRAME_ROWS * (1 + DOM_TABLE_COLUMNS))
+    return (
+        count_base_elements() + 1 + table_elements + nested_elements + shadow_elements + iframe_elements
+        + (1 if parameters["shadow_hosts"] else 0)
+    )
+
+def create_table(rows, prefix):
+    """
+    Returns the HTML of a table with the given number of rows of DOM_TABLE_COLUMNS text cells.
+
+    Args:
+        :rows: (int) - The number of rows.
+        :prefix: (str) - The prefix of the cell texts.
+    """
+    cells = "".join(f"<td>{prefix} {{row}}.{column}</td>" for column in range(1, DOM_TABLE_COLUMNS + 1))
+    return (
+        "<table class='stress-table'><tbody>"
+        + "".join(f"<tr>{cells.format(row=row)}</tr>" for row in range(1, rows + 1))
+        + "</tbody></table>"
+    )
+
+def create_stress_content(parameters):
+    """
+    Returns the HTML of the content added to the testing application: a large table, blocks of
+    deeply nested elements, hosts of shadow roots and iframes, each with a table of their own.
+    The content uses none of the ids and tags looked up by the test cases.
+
+    Args:
+        :parameters: (dict) - The parameters of a variant from DOM_SIZE_VARIANTS.
+    """
+    parts = []
+    if parameters["rows"]:
+        parts.append(create_table(parameters["rows"], "Row"))
+    nested_block = (
+        "<div class='stress-nested'>" * parameters["nesting_depth"]
+        + "<span>Nested text</span>" + "</div>" * parameters["nesting_depth"]
+    )
+    parts.extend(nested_block for _ in range(parameters["nested_blocks"]))
+    parts.extend("<stress-host></stress-host>" for _ in range(parameters["shadow_hosts"]))
+    iframe_document = escape(create_table(DOM_IFRAME_ROWS, "Frame row"), quote=True)
+    parts.extend(
+        f"<iframe class='stress-frame' width='400' height='100' srcdoc=\"{iframe_document}\"></iframe>"
+        for _ in range(parameters["iframes"])
+    )
+    content = "\n      <div id='stressContent'>" + "".join(parts) + "</div>"
+    if parameters["shadow_hosts"]:
+        content += SHADOW_SCRIPT
+    return content
+
+def generate_page(variant, output_directory=GENERATED_APPS_DIRECTORY, directory=TESTING_APP_DIRECTORY):
+    """
+    Generates a variant of the testing application with a larger DOM and returns its directory.
+    The original page is kept unchanged, with all the ids used by the test cases, and the generated
+    content is added after it, so the positions of the original elements do not change.
+
+    Args:
+        :variant: (str) - The name of one of DOM_SIZE_VARIANTS.
+        :output_directory: (str) - The directory in which the directories of the variants are created.
+        :directory: (str) - The directory with the files of the testing application.
+    """
+    variant_directory = os.path.abspath(os.path.join(output_directory, variant))
+    if not os.path.exists(variant_directory):
+        os.makedirs(variant_directory)
+    for filename in os.listdir(directory):
+        if filename != "index.html":
+            shutil.copy(os.path.join(directory, filename), variant_directory)
+
+    with open(os.path.join(directory, "index.html"), encoding="utf-8") as index_file:
+        page = index_file.read()
+    body_end = page.rindex("</body>")
+    page = page[:body_end].rstrip() + create_stress_content(DOM_SIZE_VARIANTS[variant]) + "\n   " + page[body_end:]
+    with open(os.path.join(variant_directory, "index.html"), "w", encoding="utf-8") as index_file:
+        index_file.write(page)
+    return variant_directory
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generates variants of the testing application with larger DOMs.")
+    parser.add_argument("variants", nargs="*",
+                        help=f"variants to generate, any of: {', '.join(DOM_SIZE_VARIANTS)} (default: all)")
+    parser.add_argument("--output", default=GENERATED_APPS_DIRECTORY,
+                        help=f"directory of the generated variants (default: {GENERATED_APPS_DIRECTORY})")
+    arguments = parser.parse_args()
+    unknown_variants = [variant for variant in arguments.variants if variant not in DOM_SIZE_VARIANTS]
+    if unknown_variants:
+        parser.error(f"unknown variants: {', '.join(unknown_variants)}")
+
+    for variant in arguments.variants or DOM_SIZE_VARIANTS:
+        variant_directory = generate_page(variant, arguments.output)
+        print(f"{variant}: {count_elements(variant)} elements, {os.path.join(variant_directory, 'index.html')}")
@@ -1,11 +1,27 @@
 from test_settings import *
+import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.ticker import ScalarFormatter
+from result_metrics import ResultMetrics, finite
+from result_ingest import ResultIngest
+from result_store import ResultStore
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import numpy as np
-import statistics
-import csv
+import argparse
+import hashlib
+import inspect
+import json
+import time
 import os
 
+TOOLS = [SELENIUM, PLAYWRIGHT, SPLINTER, ASYNC_PLAYWRIGHT]
+TOOLS_LABELS = ['Selenium', 'Playwright', 'Splinter', 'Playwright (async)']
+MODES = [HEADLESS, NOHEADLESS]
+DOM_OPERATIONS = {
+    "lookup": "Element lookup", "header_text": "Header text", "page_text": "Page text", "screenshot": "Screenshot",
+}
+PLATFORMS = [WINDOWS, LINUX, MACOS]
+
 results = {
     SELENIUM: {
         HEADLESS: {
@@ -43,323 +59,470 @@ results = {
             MACOS: [],
         },
     },
+    ASYNC_PLAYWRIGHT: {
+        HEADLESS: {
+            WINDOWS: [],
+            LINUX: [],
+            MACOS: [],
+        },
+        NOHEADLESS: {
+            WINDOWS: [],
+            LINUX: [],
+            MACOS: [],
+        },
+    },
 }
+metrics = {}
+ingest = None
 
-def process_csv(file_path):
+def read_all_data(verbose=True, directories=None, settle_time=0):
     """
-    Processes a CSV file and stores its contents in the appropriate dictionary.
-
-    The CSV file is identified based on its filename,
-    which includes information about the tool, mode, and system.
+    Reads the results of all runs from the CSV files in the given directories.
+    The directories are ingested incrementally: only new or changed files are parsed,
+    the others are loaded from the ingest cache. The filename of every CSV file contains
+    the necessary information about the tool, mode, and system, so all files can be
+    in one directory. Returns the number of added, changed and removed files.
 
     Args:
-        :file_path: (str) - The path to the CSV file to be processed.
-    """
-    tool, mode, system = os.path.basename(file_path).split('-')[0].replace('_test', '').split('_')
-
-    data = {}
-    with open(file_path, newline='') as csvfile:
-        reader = csv.reader(csvfile, delimiter=';')
-        for row in reader:
-            key = row[0]
-            if len(row) == 2:
-                value = row[1]
-            else:
-                value = row[1:]
-            data[key] = value
-    
-    results[tool][mode][system].append(data)
-
-def read_all_data():
+        :verbose: (bool) - Specifies whether the amount of read data is displayed.
+        :directories: (list) - The directories with the CSV files, ALL_RESULTS_DIRECTORY by default.
+        :settle_time: (float) - Files modified less than this number of seconds ago are left for the next call.
     """
-    Reads all CSV files in a single common directory and processes them.
-    This method assumes that all CSV files are located in one common directory,
-    because the filename contains the necessary information about the tool,
-    mode, and system, so there can be in one directory.
-    """
-    for filename in os.listdir(ALL_RESULTS_DIRECTORY):
-        if filename.endswith(".csv"):
-            file_path = os.path.join(ALL_RESULTS_DIRECTORY, filename)
-            process_csv(file_path)
-
+    global ingest
+    if ingest is None or (directories and ingest.directories != directories):
+        ingest = ResultIngest(directories or [ALL_RESULTS_DIRECTORY])
+    changes = ingest.update(settle_time)
+    if changes or not metrics:
+        set_results(ingest.runs())
+
+    if not verbose:
+        return changes
     print("Total amount of read data:")
 
-    for tool in [SELENIUM, PLAYWRIGHT, SPLINTER]:
-        for mode in [HEADLESS, NOHEADLESS]:
-            for platform in [WINDOWS, LINUX, MACOS]:
+    for tool in TOOLS:
+        for mode in MODES:
+            for platform in PLATFORMS:
                 print(
                     f"{tool} tests in {mode} mode run on {platform}: "
                     f"{len(results[tool][mode][platform])}"
                 )
+    return changes
+
+def set_results(runs):
+    """
+    Replaces the results of all cells with the given runs and forgets the metrics computed from the previous ones.
+
+    Args:
+        :runs: (list) - The runs loaded from the result store.
+    """
+    for tool in TOOLS:
+        for mode in MODES:
+            for platform in PLATFORMS:
+                results[tool][mode][platform] = []
+    for run in runs:
+        results[run["tool"]][run["mode"]][run["system"]].append(run)
+    metrics.clear()
+
+def get_metrics(tool, mode, platform):
+    """
+    Returns the metrics of a single (tool, mode, platform) cell of results.
+    The cell is loaded into arrays once and reused by all plots.
+
+    Args:
+        :tool: (str) - The testing tool.
+        :mode: (str) - headless or noheadless.
+        :platform: (str) - The operating system.
+    """
+    key = (tool, mode, platform)
+    if key not in metrics:
+        metrics[key] = ResultMetrics(results[tool][mode][platform])
+    return metrics[key]
+
+def get_tools_values(mode, platform, metric):
+    """
+    Returns the values of the metric for every tool, without missing values.
+
+    Args:
+        :mode: (str) - headless or noheadless.
+        :platform: (str) - The operating system.
+        :metric: (callable) - Function returning an array of values from the ResultMetrics of a cell.
+    """
+    return [finite(metric(get_metrics(tool, mode, platform))) for tool in TOOLS]
 
 def create_plots_duration_time(mode, platform):
     print(f"Generating a plot comparing the duration of tests in {mode} mode on {platform}.")
-    duration_time_selenium = [float(result['duration_time']) for result in results[SELENIUM][mode][platform]]
-    duration_time_playwright = [float(result['duration_time']) for result in results[PLAYWRIGHT][mode][platform]]
-    duration_time_splinter = [float(result['duration_time']) for result in results[SPLINTER][mode][platform]]
+    durations = get_tools_values(mode, platform, lambda cell: cell.values('duration_time'))
 
-    x = range(1, 51)
     plt.figure(figsize=(15, 6))
-    plt.scatter(x, duration_time_selenium, label='Selenium')
-    plt.scatter(x, duration_time_playwright, label='Playwright')
-    plt.scatter(x, duration_time_splinter, label='Splinter')
+    for duration_time, label in zip(durations, TOOLS_LABELS):
+        plt.scatter(np.arange(1, len(duration_time) + 1), duration_time, label=label)
     plt.xlabel('Test number', fontsize=14) 
     plt.ylabel('Duration (seconds)', fontsize=14)
     plt.legend(loc='upper left', bbox_to_anchor=(1, 1), fontsize=12)
     plt.yticks(np.arange(0, 19, 2))
     plt.gca().yaxis.set_major_formatter(plt.FormatStrFormatter('%.1f'))
     plt.grid(True)
-    plt.show()
+    return plt.gcf()
 
 def create_plots_cpu_usage(mode, platform):
     print(
         f"Generating a plot comparing the CPU usage during tests in {mode} mode on {platform}."
     )
-    results_selenium = [result['cpu_percentages'] for result in results[SELENIUM][mode][platform]]
-    results_playwright = [result['cpu_percentages'] for result in results[PLAYWRIGHT][mode][platform]]
-    results_splinter = [result['cpu_percentages'] for result in results[SPLINTER][mode][platform]]
-    cpu_usage_selenium = [statistics.mean(list(map(float, result))) for result in results_selenium]
-    cpu_usage_playwright = [statistics.mean(list(map(float, result))) for result in results_playwright]
-    cpu_usage_splinter = [statistics.mean(list(map(float, result))) for result in results_splinter]
+    cpu_usage = get_tools_values(mode, platform, lambda cell: cell.mean('cpu_percentages'))
 
     plt.figure(figsize=(10, 6))
-    plt.boxplot(
-        [cpu_usage_selenium, cpu_usage_playwright, cpu_usage_splinter],
-        labels=['Selenium', 'Playwright', 'Splinter'],
-    )
+    plt.boxplot(cpu_usage, labels=TOOLS_LABELS)
     plt.ylabel('CPU usage (percentage)', fontsize=14)
     plt.tick_params(axis='both', which='major', labelsize=12)
     plt.gca().yaxis.set_major_formatter(plt.FormatStrFormatter('%.1f'))
     plt.grid(True)
-    plt.show()
+    return plt.gcf()
 
 def create_plots_initial_spike_cpu_usage(mode, platform):
     print(
         f"Generating a plot comparing the initial CPU usage spike during tests in {mode} mode on {platform}."
     )
-    spike_cpu_selenium = [float(result['cpu_percentages'][0]) - float(result['cpu_usage_before']) for result in results[SELENIUM][mode][platform]]
-    spike_cpu_playwright = [float(result['cpu_percentages'][0]) - float(result['cpu_usage_before']) for result in results[PLAYWRIGHT][mode][platform]]
-    spike_cpu_splinter = [float(result['cpu_percentages'][0]) - float(result['cpu_usage_before']) for result in results[SPLINTER][mode][platform]]
+    spike_cpu = get_tools_values(mode, platform, lambda cell: cell.spike('cpu_percentages', 'cpu_usage_before'))
 
     plt.figure(figsize=(10, 6))
-    plt.boxplot([spike_cpu_selenium, spike_cpu_playwright, spike_cpu_splinter], labels=['Selenium', 'Playwright', 'Splinter'])
+    plt.boxplot(spike_cpu, labels=TOOLS_LABELS)
     plt.ylabel('Initial CPU usage spike (percentage)', fontsize=14)
     plt.tick_params(axis='both', which='major', labelsize=12)
     plt.gca().yaxis.set_major_formatter(plt.FormatStrFormatter('%.1f'))
     plt.grid(True)
-    plt.show()
+    return plt.gcf()
 
 def create_plots_context_switches(mode, platform):
     print(
         f"Generating a plot comparing the number of CPU context switches during tests in {mode} mode on {platform}."
     )
-    results_selenium = [result['cpu_context_switches'] for result in results[SELENIUM][mode][platform]]
-    results_playwright = [result['cpu_context_switches'] for result in results[PLAYWRIGHT][mode][platform]]
-    results_splinter = [result['cpu_context_switches'] for result in results[SPLINTER][mode][platform]]
-    context_switches_selenium = []
-    context_switches_playwright = []
-    context_switches_splinter = []
-    for result in results_selenium:
-        difference_result = [abs(int(result[i]) - int(result[i-1])) for i in range(1, len(result))]
-        context_switches_selenium.append(statistics.mean(list(map(float, difference_result))))
-    for result in results_playwright:
-        difference_result = [abs(int(result[i]) - int(result[i-1])) for i in range(1, len(result))]
-        context_switches_playwright.append(statistics.mean(list(map(float, difference_result))))
-    for result in results_splinter:
-        difference_result = [abs(int(result[i]) - int(result[i-1])) for i in range(1, len(result))]
-        context_switches_splinter.append(statistics.mean(list(map(float, difference_result))))
+    context_switches = get_tools_values(mode, platform, lambda cell: cell.rate('cpu_context_switches'))
 
     plt.figure(figsize=(10, 6))
-    plt.boxplot([context_switches_selenium, context_switches_playwright, context_switches_splinter], labels=['Selenium', 'Playwright', 'Splinter'])
-    plt.ylabel('Number of CPU context switches', fontsize=14)
+    plt.boxplot(context_switches, labels=TOOLS_LABELS)
+    plt.ylabel('Number of CPU context switches per second', fontsize=14)
     plt.tick_params(axis='both', which='major', labelsize=12)
     plt.grid(True)
-    plt.show()
+    return plt.gcf()
 
 def create_plots_cpu_interrupts(mode, platform):
     print(
         f"Generating a plot comparing the number of CPU interrupts during tests in {mode} mode on {platform}."
     )
-    results_selenium = [result['cpu_interrupts'] for result in results[SELENIUM][mode][platform]]
-    results_playwright = [result['cpu_interrupts'] for result in results[PLAYWRIGHT][mode][platform]]
-    results_splinter = [result['cpu_interrupts'] for result in results[SPLINTER][mode][platform]]
-    cpu_interrupts_selenium = []
-    cpu_interrupts_playwright = []
-    cpu_interrupts_splinter = []
-    for result in results_selenium:
-        difference_result = [abs(int(result[i]) - int(result[i-1])) for i in range(1, len(result))]
-        cpu_interrupts_selenium.append(statistics.mean(list(map(float, difference_result))))
-    for result in results_playwright:
-        difference_result = [abs(int(result[i]) - int(result[i-1])) for i in range(1, len(result))]
-        cpu_interrupts_playwright.append(statistics.mean(list(map(float, difference_result))))
-    for result in results_splinter:
-        difference_result = [abs(int(result[i]) - int(result[i-1])) for i in range(1, len(result))]
-        cpu_interrupts_splinter.append(statistics.mean(list(map(float, difference_result))))
+    cpu_interrupts = get_tools_values(mode, platform, lambda cell: cell.rate('cpu_interrupts'))
 
     plt.figure(figsize=(10, 6))
-    plt.boxplot([cpu_interrupts_selenium, cpu_interrupts_playwright, cpu_interrupts_splinter], labels=['Selenium', 'Playwright', 'Splinter'])
-    plt.ylabel('Number of CPU interrupts', fontsize=14)
+    plt.boxplot(cpu_interrupts, labels=TOOLS_LABELS)
+    plt.ylabel('Number of CPU interrupts per second', fontsize=14)
     plt.tick_params(axis='both', which='major', labelsize=12)
     plt.grid(True)
-    plt.show()
+    return plt.gcf()
 
 def create_plots_memory_usage(mode, platform):
     print(
         f"Generating a plot comparing the memory usage during tests in {mode} mode on {platform}."
     )
-    results_selenium = [result['memory_percentages'] for result in results[SELENIUM][mode][platform]]
-    results_playwright = [result['memory_percentages'] for result in results[PLAYWRIGHT][mode][platform]]
-    results_splinter = [result['memory_percentages'] for result in results[SPLINTER][mode][platform]]
-    memory_usage_selenium = [statistics.mean(list(map(float, result))) for result in results_selenium]
-    memory_usage_playwright = [statistics.mean(list(map(float, result))) for result in results_playwright]
-    memory_usage_splinter = [statistics.mean(list(map(float, result))) for result in results_splinter]
+    memory_usage = get_tools_values(mode, platform, lambda cell: cell.mean('memory_percentages'))
 
     plt.figure(figsize=(10, 6))
-    plt.boxplot([memory_usage_selenium, memory_usage_playwright, memory_usage_splinter], labels=['Selenium', 'Playwright', 'Splinter'])
+    plt.boxplot(memory_usage, labels=TOOLS_LABELS)
     plt.ylabel('RAM usage (percentage)', fontsize=14)
     plt.tick_params(axis='both', which='major', labelsize=12)
     plt.gca().yaxis.set_major_formatter(plt.FormatStrFormatter('%.1f'))
     plt.grid(True)
-    plt.show()
+    return plt.gcf()
 
 def create_plots_initial_spike_memory_usage(mode, platform):
     print(
         f"Generating a plot comparing the initial memory usage spike during tests in {mode} mode on {platform}."
     )
-    spike_memory_selenium = [float(result['memory_percentages'][0]) - float(result['memory_usage_before']) for result in results[SELENIUM][mode][platform]]
-    spike_memory_playwright = [float(result['memory_percentages'][0]) - float(result['memory_usage_before']) for result in results[PLAYWRIGHT][mode][platform]]
-    spike_memory_splinter = [float(result['memory_percentages'][0]) - float(result['memory_usage_before']) for result in results[SPLINTER][mode][platform]]
+    spike_memory = get_tools_values(
+        mode, platform, lambda cell: cell.spike('memory_percentages', 'memory_usage_before')
+    )
 
     plt.figure(figsize=(10, 6))
-    plt.boxplot([spike_memory_selenium, spike_memory_playwright, spike_memory_splinter], labels=['Selenium', 'Playwright', 'Splinter'])
+    plt.boxplot(spike_memory, labels=TOOLS_LABELS)
     plt.ylabel('Initial RAM usage spike (percentage)', fontsize=14)
     plt.tick_params(axis='both', which='major', labelsize=12)
     plt.gca().yaxis.set_major_formatter(plt.FormatStrFormatter('%.1f'))
     plt.grid(True)
-    plt.show()
+    return plt.gcf()
 
 def create_plots_rss_size(mode, platform):
     print(
         f"Generating a plot comparing the RAM usage by process during tests in {mode} mode on {platform}."
     )
-    results_selenium = [result['memory_resident_set_size_bytes'] for result in results[SELENIUM][mode][platform]]
-    results_playwright = [result['memory_resident_set_size_bytes'] for result in results[PLAYWRIGHT][mode][platform]]
-    results_splinter = [result['memory_resident_set_size_bytes'] for result in results[SPLINTER][mode][platform]]
-    rss_size_selenium = [statistics.mean(list(map(float, result))) for result in results_selenium]
-    rss_size_playwright = [statistics.mean(list(map(float, result))) for result in results_playwright]
-    rss_size_splinter = [statistics.mean(list(map(float, result))) for result in results_splinter]
+    rss_size = get_tools_values(mode, platform, lambda cell: cell.mean('memory_resident_set_size_bytes'))
 
     plt.figure(figsize=(10, 6))
-    plt.boxplot([rss_size_selenium, rss_size_playwright, rss_size_splinter], labels=['Selenium', 'Playwright', 'Splinter'])
+    plt.boxplot(rss_size, labels=TOOLS_LABELS)
     plt.ylabel('RAM usage by process (bytes)', fontsize=14)
     plt.tick_params(axis='both', which='major', labelsize=12)
     plt.grid(True)
     plt.gca().yaxis.set_major_formatter(ScalarFormatter(useMathText=True))
     plt.gca().ticklabel_format(axis='y', style='sci', scilimits=(0,0))
-    plt.show()
+    return plt.gcf()
 
 def create_plots_disk_io_read(mode, platform):
     print(
         f"Generating a plot comparing the data read from disk during tests in {mode} mode on {platform}."
     )
-    disk_io_read_selenium = [int(result['disk_io_read_bytes']) for result in results[SELENIUM][mode][platform]]
-    disk_io_read_playwright = [int(result['disk_io_read_bytes']) for result in results[PLAYWRIGHT][mode][platform]]
-    disk_io_read_splinter = [int(result['disk_io_read_bytes']) for result in results[SPLINTER][mode][platform]]
+    disk_io_read = get_tools_values(mode, platform, lambda cell: cell.values('disk_io_read_bytes'))
 
     plt.figure(figsize=(10, 6))
-    plt.boxplot([disk_io_read_selenium, disk_io_read_playwright, disk_io_read_splinter], labels=['Selenium', 'Playwright', 'Splinter'])
+    plt.boxplot(disk_io_read, labels=TOOLS_LABELS)
     plt.yscale('symlog')
     plt.ylabel('Data read from disk (bytes)', fontsize=14)
     plt.yticks(np.logspace(0, 9, num=10))
     plt.tick_params(axis='both', which='major', labelsize=12)
     plt.grid(True)
-    plt.show()
+    return plt.gcf()
 
 def create_plots_disk_io_write(mode, platform):
     print(
         f"Generating a plot comparing the data written from disk during tests in {mode} mode on {platform}."
     )
-    disk_io_write_selenium = [int(result['disk_io_write_bytes']) for result in results[SELENIUM][mode][platform]]
-    disk_io_write_playwright = [int(result['disk_io_write_bytes']) for result in results[PLAYWRIGHT][mode][platform]]
-    disk_io_write_splinter = [int(result['disk_io_write_bytes']) for result in results[SPLINTER][mode][platform]]
+    disk_io_write = get_tools_values(mode, platform, lambda cell: cell.values('disk_io_write_bytes'))
 
     plt.figure(figsize=(10, 6))
-    plt.boxplot([disk_io_write_selenium, disk_io_write_playwright, disk_io_write_splinter], labels=['Selenium', 'Playwright', 'Splinter'])
+    plt.boxplot(disk_io_write, labels=TOOLS_LABELS)
     plt.yscale('symlog')
     plt.ylabel('Data written to disk (bytes)', fontsize=14)
     plt.yticks(np.logspace(0, 9, num=10))
     plt.tick_params(axis='both', which='major', labelsize=12)
     plt.grid(True)
-    plt.show()
-
-
-if __name__ == "__main__":
-    read_all_data()
-
-    modes = [HEADLESS, NOHEADLESS]
-    platforms = [WINDOWS, LINUX, MACOS]
+    return plt.gcf()
+
+
+
+PLOTS = [
+    # Duration time
+    create_plots_duration_time,
+    # CPU
+    create_plots_cpu_usage,
+    create_plots_initial_spike_cpu_usage,
+    create_plots_context_switches,
+    create_plots_cpu_interrupts,
+    # Memory
+    create_plots_memory_usage,
+    create_plots_initial_spike_memory_usage,
+    create_plots_rss_size,
+    # Disk
+    create_plots_disk_io_read,
+    create_plots_disk_io_write,
+]
+
+def plot_dom_size_scaling(sweep_results, output_directory=PERFORMANCE_LOGS_DIRECTORY, formats=RENDER_FORMATS):
+    """
+    Saves a figure for every mode and network profile of a sweep over the generated variants
+    of the testing application, showing how the median duration of every operation of the DOM
+    benchmark scales with the number of elements of the page, with one line per tool.
 
+    Args:
+        :sweep_results: (dict) - The statistics of the runs keyed by headless mode, network profile,
+            DOM variant and script, as collected by the performance analyser.
+        :output_directory: (str) - The directory in which the files are saved.
+        :formats: (list) - The output file formats, e.g. png, svg, pdf.
     """
-    Duration time
+    matplotlib.use("Agg")
+    figures = {}
+    for (headless_mode, network_profile, _, script), stats in sweep_results.items():
+        if stats and stats["dom_benchmark"]:
+            points = figures.setdefault((headless_mode, network_profile), {}).setdefault(script.split("_")[0], [])
+            points.append((stats["dom_element_count"], stats["dom_benchmark"]))
+
+    for (headless_mode, network_profile), tools in figures.items():
+        figure, axes = plt.subplots(1, len(DOM_OPERATIONS), figsize=(20, 5))
+        for axis, (operation, title) in zip(axes, DOM_OPERATIONS.items()):
+            for tool, points in tools.items():
+                points.sort(key=lambda point: point[0])
+                axis.plot(
+                    [element_count for element_count, _ in points], [benchmark[operation] for _, benchmark in points],
+                    marker="o", label=TOOLS_LABELS[TOOLS.index(tool)],
+                )
+            axis.set_xscale("log")
+            axis.set_title(title, fontsize=14)
+            axis.set_xlabel("Elements of the page", fontsize=12)
+            axis.set_ylabel("Median duration (ms)", fontsize=12)
+            axis.grid(True)
+        axes[0].legend(fontsize=12)
+
+        name = f"dom_size_scaling_{HEADLESS if headless_mode else NOHEADLESS}" + (f"_{network_profile}" if network_profile else "")
+        for file_format in formats:
+            figure.savefig(os.path.join(output_directory, f"{name}.{file_format}"), bbox_inches="tight")
+        plt.close(figure)
+        print(f"DOM size scaling plot saved: {os.path.join(output_directory, name)}")
+
+def get_plot_name(plot, mode, platform):
     """
-    # Duration time comparison
-    for platform in platforms:
-        for mode in modes:
-            create_plots_duration_time(mode, platform)
+    Returns the name of the files of a single figure, e.g. cpu_usage_headless_Linux.
 
+    Args:
+        :plot: (callable) - The create_plots_* function.
+        :mode: (str) - headless or noheadless.
+        :platform: (str) - The operating system.
     """
-    CPU
+    return f"{plot.__name__.replace('create_plots_', '')}_{mode}_{platform}"
+
+def get_input_hash(plot, mode, platform, formats):
     """
+    Returns the hash of everything a single figure is rendered from: the plot function,
+    the results of all tools in the (mode, platform) cell and the output formats.
 
-    # CPU usage comparison
-    for platform in platforms:
-        for mode in modes:
-            create_plots_cpu_usage(mode, platform)
+    Args:
+        :plot: (callable) - The create_plots_* function.
+        :mode: (str) - headless or noheadless.
+        :platform: (str) - The operating system.
+        :formats: (list) - The output file formats.
+    """
+    cell = [results[tool][mode][platform] for tool in TOOLS]
+    content = json.dumps(
+        [plot.__name__, inspect.getsource(plot), cell, sorted(formats)],
+        sort_keys=True, default=lambda value: np.asarray(value).tolist(),
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
-    # Initial spike in CPU usage comparison
-    for platform in platforms:
-        for mode in modes:
-            create_plots_initial_spike_cpu_usage(mode, platform)
+def init_render_worker(store_directory, run_ids):
+    """
+    Prepares a rendering process: selects the non-interactive backend and loads the runs read
+    by the parent process from the ingest cache, unless they were inherited from it. The workers
+    only read the cache, so they do not write its manifest concurrently.
 
-    # Context switches comparison
-    for platform in platforms:
-        for mode in modes:
-            create_plots_context_switches(mode, platform)
+    Args:
+        :store_directory: (str) - The directory of the result store used as the ingest cache.
+        :run_ids: (list) - The identifiers of the runs read by the parent process.
+    """
+    matplotlib.use("Agg")
+    if not any(results[tool][mode][platform] for tool in TOOLS for mode in MODES for platform in PLATFORMS):
+        set_results(ResultStore(store_directory).load(run_ids=run_ids))
 
-    # CPU interrupts comparison
-    for platform in platforms:
-        for mode in modes:
-            create_plots_cpu_interrupts(mode, platform)
+def render_plot(plot_name, mode, platform, output_directory, formats):
+    """
+    Renders a single figure and saves it in every format. Returns the name of the figure.
 
+    Args:
+        :plot_name: (str) - The name of the create_plots_* function.
+        :mode: (str) - headless or noheadless.
+        :platform: (str) - The operating system.
+        :output_directory: (str) - The directory in which the files are saved.
+        :formats: (list) - The output file formats, e.g. png, svg, pdf.
     """
-    Memory
+    plot = globals()[plot_name]
+    name = get_plot_name(plot, mode, platform)
+    figure = plot(mode, platform)
+    for file_format in formats:
+        figure.savefig(os.path.join(output_directory, f"{name}.{file_format}"), bbox_inches="tight")
+    plt.close(figure)
+    return name
+
+def render_all_plots(output_directory, formats, workers=None, force=False):
     """
+    Renders all figures of the results read by read_all_data to files with the non-interactive
+    backend, spread over a pool of processes. Figures whose input data has not changed since the last rendering
+    (according to the manifest in the output directory) are skipped.
 
-    # Memory usage comparison
-    for platform in platforms:
-        for mode in modes:
-            create_plots_memory_usage(mode, platform)
-
-    # Initial spike in memory usage comparison
-    for platform in platforms:
-        for mode in modes:
-            create_plots_initial_spike_memory_usage(mode, platform)
-
-    # RSS memory size comparison
-    for platform in platforms:
-        for mode in modes:
-            create_plots_rss_size(mode, platform)
+    Args:
+        :output_directory: (str) - The directory in which the files are saved.
+        :formats: (list) - The output file formats, e.g. png, svg, pdf.
+        :workers: (int) - The number of rendering processes, the number of CPUs by default.
+        :force: (bool) - Specifies whether all figures are rendered, even the unchanged ones.
+    """
+    if not os.path.exists(output_directory):
+        os.makedirs(output_directory)
+    manifest_filename = os.path.join(output_directory, RENDER_MANIFEST_FILE)
+    manifest = {}
+    if os.path.exists(manifest_filename):
+        with open(manifest_filename, encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+
+    pending = {}
+    for plot in PLOTS:
+        for platform in PLATFORMS:
+            for mode in MODES:
+                name = get_plot_name(plot, mode, platform)
+                input_hash = get_input_hash(plot, mode, platform, formats)
+                files_exist = all(
+                    os.path.exists(os.path.join(output_directory, f"{name}.{file_format}")) for file_format in formats
+                )
+                if force or manifest.get(name) != input_hash or not files_exist:
+                    pending[name] = (plot.__name__, mode, platform, input_hash)
+
+    print(f"Rendering {len(pending)} figures, {len(PLOTS) * len(PLATFORMS) * len(MODES) - len(pending)} unchanged.")
+    if not pending:
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_render_worker, initargs=(ingest.store.directory, ingest.run_ids())) as executor:
+        futures = {
+            executor.submit(render_plot, plot_name, mode, platform, output_directory, formats): name
+            for name, (plot_name, mode, platform, _) in pending.items()
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            future.result()
+            manifest[name] = pending[name][3]
+            print(f"Saved {name} ({', '.join(formats)})")
+
+    temporary_filename = f"{manifest_filename}.tmp"
+    with open(temporary_filename, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+    os.replace(temporary_filename, manifest_filename)
+
+def watch_results(directories, output_directory, formats, workers=None, interval=WATCH_INTERVAL):
+    """
+    Watches the directories with the CSV files, e.g. PERFORMANCE_LOGS_DIRECTORY directly,
+    and renders the plots again whenever results are added, changed or removed.
+    Only the figures whose data has changed are rendered.
 
+    Args:
+        :directories: (list) - The directories with the CSV files.
+        :output_directory: (str) - The directory in which the files are saved.
+        :formats: (list) - The output file formats, e.g. png, svg, pdf.
+        :workers: (int) - The number of rendering processes, the number of CPUs by default.
+        :interval: (float) - Time between two checks of the directories, in seconds.
+    """
+    print(f"Watching {', '.join(directories)} for new results, press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(interval)
+            changes = read_all_data(verbose=False, directories=directories, settle_time=INGEST_SETTLE_TIME)
+            if changes:
+                print(f"{changes} results files added, changed or removed.")
+                render_all_plots(output_directory, formats, workers)
+    except KeyboardInterrupt:
+        pass
+
+def parse_arguments():
     """
-    Disk
+    Parses the command line arguments of the plot creator.
     """
+    parser = argparse.ArgumentParser(description="Creates plots comparing the results of the testing tools.")
+    parser.add_argument("--output", help="render all plots to files in this directory instead of displaying them")
+    parser.add_argument("--formats", nargs="+", default=RENDER_FORMATS, choices=["png", "svg", "pdf"],
+                        help=f"file formats of rendered plots (default: {' '.join(RENDER_FORMATS)})")
+    parser.add_argument("--workers", type=int, help="number of rendering processes (default: number of CPUs)")
+    parser.add_argument("--force", action="store_true", help="render also the plots whose data has not changed")
+    parser.add_argument("--source", nargs="+", default=[ALL_RESULTS_DIRECTORY],
+                        help=f"directories with the CSV files, e.g. {PERFORMANCE_LOGS_DIRECTORY} (default: {ALL_RESULTS_DIRECTORY})")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep watching the source directories and render the plots of new results (requires --output)")
+    arguments = parser.parse_args()
+    if arguments.watch and not arguments.output:
+        parser.error("--watch requires --output")
+    return arguments
 
-    # Disk IO read bytes comparison
-    for platform in platforms:
-        for mode in modes:
-            create_plots_disk_io_read(mode, platform)
 
-    # Disk IO write bytes comparison
-    for platform in platforms:
-        for mode in modes:
-            create_plots_disk_io_write(mode, platform)
+if __name__ == "__main__":
+    arguments = parse_arguments()
+    if arguments.output:
+        matplotlib.use("Agg")
+    read_all_data(directories=arguments.source)
+
+    if arguments.output:
+        render_all_plots(arguments.output, arguments.formats, arguments.workers, arguments.force)
+        if arguments.watch:
+            watch_results(arguments.source, arguments.output, arguments.formats, arguments.workers)
+    else:
+        for plot in PLOTS:
+            for platform in PLATFORMS:
+                for mode in MODES:
+                    plot(mode, platform)
+                    plt.show()
@@ -0,0 +1,285 @@
+from test_settings import *
+from collections import deque
+import threading
+import psutil
+import time
+
+PROCESS_COUNTERS = ["cpu_time", "context_switches", "io_read_bytes", "io_write_bytes"]
+PROCESS_GAUGES = ["rss_bytes", "uss_bytes", "pss_bytes", "threads", "fds"]
+SAMPLE_KEYS = [
+    "sample_times", "cpu_percentage", "cpu_context_switches", "cpu_interrupts", "memory_percentage",
+    "memory_resident_set_size_bytes", "memory_unique_set_size_bytes", "memory_proportional_set_size_bytes",
+    "process_tree_cpu_percentage", "process_tree_context_switches", "process_tree_threads",
+    "process_tree_fds", "process_tree_processes",
+]
+GAUGE_SAMPLE_KEYS = [
+    "memory_resident_set_size_bytes", "memory_unique_set_size_bytes", "memory_proportional_set_size_bytes",
+    "process_tree_threads", "process_tree_fds", "process_tree_processes",
+]
+
+
+class ProcessTreeSampler:
+    def __init__(self, root_pid):
+        """
+        This class follows the process started by the analyser and all of its
+        descendants (test script, chromedriver, browser renderer/GPU/utility
+        processes, Playwright driver) and reads their resource counters.
+        Counters of processes which have already exited are kept, so the
+        cumulative values of the whole tree never go backwards.
+
+        Args:
+            :root_pid: (int) - PID of the process which starts the tree.
+        """
+        self.root_pid = root_pid
+        self.processes = {}
+        self.last_snapshots = {}
+        self.peak_snapshots = {}
+
+    def discover_processes(self):
+        """
+        Returns a list of currently running processes belonging to the tree.
+        Process objects are cached by PID and creation time, so a reused PID
+        is never mistaken for a process that has already exited.
+        """
+        try:
+            root = self.processes.get(self.root_pid) or psutil.Process(self.root_pid)
+            tree = [root] + root.children(recursive=True)
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            return []
+        except psutil.AccessDenied:
+            tree = [root]
+
+        running = []
+        for process in tree:
+            cached = self.processes.get(process.pid)
+            if cached is not None and cached.create_time() == process.create_time():
+                running.append(cached)
+            else:
+                self.processes[process.pid] = process
+                running.append(process)
+        return running
+
+    def read_process(self, process):
+        """
+        Returns a snapshot of the resource counters of a single process
+        or None if the process has exited in the meantime.
+
+        Args:
+            :process: (psutil.Process) - The process to read.
+        """
+        try:
+            with process.oneshot():
+                cpu_times = process.cpu_times()
+                try:
+                    memory = process.memory_full_info()
+                except psutil.AccessDenied:
+                    memory = process.memory_info()
+                ctx_switches = process.num_ctx_switches()
+                try:
+                    io_counters = process.io_counters()
+                except (AttributeError, psutil.AccessDenied):
+                    io_counters = None
+                if hasattr(process, "num_fds"):
+                    fds = process.num_fds()
+                else:
+                    fds = process.num_handles()
+
+                return {
+                    "pid": process.pid,
+                    "name": process.name(),
+                    "create_time": process.create_time(),
+                    "cpu_time": cpu_times.user + cpu_times.system,
+                    "rss_bytes": memory.rss,
+                    "uss_bytes": getattr(memory, "uss", 0),
+                    "pss_bytes": getattr(memory, "pss", 0),
+                    "context_switches": ctx_switches.voluntary + ctx_switches.involuntary,
+                    "threads": process.num_threads(),
+                    "fds": fds,
+                    "io_read_bytes": io_counters.read_bytes if io_counters else 0,
+                    "io_write_bytes": io_counters.write_bytes if io_counters else 0,
+                }
+        except (psutil.NoSuchProcess, psutil.ZombieProcess, psutil.AccessDenied):
+            return None
+
+    def sample(self):
+        """
+        Reads all processes of the tree and returns the aggregated values.
+        Gauges (memory, threads, file descriptors) are summed over running
+        processes only, counters (CPU time, context switches, IO bytes) also
+        include the last known values of processes which have already exited.
+        """
+        running_keys = set()
+        for process in self.discover_processes():
+            snapshot = self.read_process(process)
+            if snapshot is None:
+                continue
+            key = (snapshot["pid"], snapshot["create_time"])
+            running_keys.add(key)
+            self.last_snapshots[key] = snapshot
+
+            peak = self.peak_snapshots.setdefault(key, dict(snapshot))
+            for gauge in PROCESS_GAUGES:
+                peak[gauge] = max(peak[gauge], snapshot[gauge])
+
+        total = {counter: 0 for counter in PROCESS_COUNTERS + PROCESS_GAUGES}
+        for key, snapshot in self.last_snapshots.items():
+            for counter in PROCESS_COUNTERS:
+                total[counter] += snapshot[counter]
+            if key in running_keys:
+                for gauge in PROCESS_GAUGES:
+                    total[gauge] += snapshot[gauge]
+        total["processes"] = len(running_keys)
+        return total
+
+    def process_summary(self):
+        """
+        Returns a list with the final counters and peak gauges of every process
+        observed in the tree during the measurement.
+        """
+        summary = []
+        for key, snapshot in self.last_snapshots.items():
+            peak = self.peak_snapshots[key]
+            summary.append({
+                "pid": snapshot["pid"],
+                "name": snapshot["name"],
+                "cpu_time": round(snapshot["cpu_time"], 2),
+                "context_switches": snapshot["context_switches"],
+                "io_read_bytes": snapshot["io_read_bytes"],
+                "io_write_bytes": snapshot["io_write_bytes"],
+                "peak_rss_bytes": peak["rss_bytes"],
+                "peak_uss_bytes": peak["uss_bytes"],
+                "peak_pss_bytes": peak["pss_bytes"],
+                "peak_threads": peak["threads"],
+                "peak_fds": peak["fds"],
+            })
+        return sorted(summary, key=lambda process: process["cpu_time"], reverse=True)
+
+
+def cpu_busy_times(cpu_times):
+    """
+    Returns the busy and total CPU time from system-wide cumulative CPU times.
+    Guest time is already included in user time on Linux, so it is not counted twice.
+
+    Args:
+        :cpu_times: (scputimes) - System-wide CPU times returned by psutil.cpu_times().
+    """
+    total = sum(cpu_times)
+    total -= getattr(cpu_times, "guest", 0) + getattr(cpu_times, "guest_nice", 0)
+    idle = cpu_times.idle + getattr(cpu_times, "iowait", 0)
+    return total - idle, total
+
+
+class ResourceMonitor(threading.Thread):
+    def __init__(self, root_pid, interval, writer=None, buffer_size=SAMPLE_BUFFER_SIZE):
+        """
+        This class samples system-wide and process tree resource usage on a dedicated
+        thread with a configurable interval. All percentages are computed as deltas
+        of cumulative counters between two consecutive samples, so sampling never
+        blocks and the test script exit is not delayed by the monitor.
+        Only the most recent samples are kept in memory, in ring buffers used by the console
+        display, all of them are streamed to the sample writer as soon as they are taken.
+        The CPU time of the tree when the monitor is created is kept as the baseline, so the CPU time
+        a warm interpreter spent importing the framework before the run can be excluded.
+
+        Args:
+            :root_pid: (int) - PID of the process which starts the measured tree.
+            :interval: (float) - Time between two consecutive samples, in seconds.
+            :writer: (SampleWriter) - Optional writer to which every sample is streamed.
+            :buffer_size: (int) - Number of the most recent samples kept in memory.
+        """
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.writer = writer
+        self.sampler = ProcessTreeSampler(root_pid)
+        self.stop_event = threading.Event()
+        self.sample_count = 0
+        self.samples = {key: deque(maxlen=buffer_size) for key in SAMPLE_KEYS}
+        self.start_time = time.perf_counter()
+        self.previous_time = self.start_time
+        self.previous_cpu_busy, self.previous_cpu_total = cpu_busy_times(psutil.cpu_times())
+        self.first_disk_io = psutil.disk_io_counters()
+        self.last_disk_io = self.first_disk_io
+        self.process_tree = self.sampler.sample()
+        self.previous_tree_cpu_time = self.process_tree["cpu_time"]
+        self.initial_tree_cpu_time = self.previous_tree_cpu_time
+
+    def run(self):
+        """
+        Takes samples until the monitor is stopped. The next deadline is computed
+        from the start time, so the time spent on sampling does not accumulate as drift.
+        """
+        next_sample_time = self.start_time + self.interval
+        while not self.stop_event.wait(max(0, next_sample_time - time.perf_counter())):
+            self.take_sample()
+            next_sample_time += self.interval
+            if next_sample_time < time.perf_counter():
+                next_sample_time = time.perf_counter() + self.interval
+
+    def take_sample(self):
+        """
+        Reads all counters once, appends their values to the ring buffers and streams them to the writer.
+        When no process of the tree is running any more, e.g. the final sample taken after the script
+        has been reaped, only the counters are recorded, so the gauge series do not end with zeros.
+        """
+        sample_time = time.perf_counter()
+        elapsed_time = max(sample_time - self.previous_time, 1e-9)
+
+        cpu_busy, cpu_total = cpu_busy_times(psutil.cpu_times())
+        cpu_total_diff = cpu_total - self.previous_cpu_total
+        cpu_percentage = (cpu_busy - self.previous_cpu_busy) / cpu_total_diff * 100 if cpu_total_diff > 0 else 0.0
+        self.previous_cpu_busy, self.previous_cpu_total = cpu_busy, cpu_total
+
+        cpu_stats = psutil.cpu_stats()
+        self.process_tree = self.sampler.sample()
+        tree_cpu_percentage = (self.process_tree["cpu_time"] - self.previous_tree_cpu_time) / elapsed_time * 100
+        self.previous_tree_cpu_time = self.process_tree["cpu_time"]
+        self.last_disk_io = psutil.disk_io_counters()
+        self.previous_time = sample_time
+
+        sample = {
+            "sample_times": round(sample_time - self.start_time, 3),
+            "cpu_percentage": round(min(max(cpu_percentage, 0.0), 100.0), 1),
+            "cpu_context_switches": cpu_stats.ctx_switches,
+            "cpu_interrupts": cpu_stats.interrupts,
+            "memory_percentage": round(psutil.virtual_memory().percent, 1),
+            "memory_resident_set_size_bytes": self.process_tree["rss_bytes"],
+            "memory_unique_set_size_bytes": self.process_tree["uss_bytes"],
+            "memory_proportional_set_size_bytes": self.process_tree["pss_bytes"],
+            "process_tree_cpu_percentage": round(tree_cpu_percentage, 1),
+            "process_tree_context_switches": self.process_tree["context_switches"],
+            "process_tree_threads": self.process_tree["threads"],
+            "process_tree_fds": self.process_tree["fds"],
+            "process_tree_processes": self.process_tree["processes"],
+        }
+        if not self.process_tree["processes"]:
+            for key in GAUGE_SAMPLE_KEYS:
+                del sample[key]
+        for key, value in sample.items():
+            self.samples[key].append(value)
+        self.sample_count += 1
+        if self.writer:
+            self.writer.write(sample)
+
+    def stop(self):
+        """
+        Stops the sampling thread and takes one final sample, so counters
+        always cover the whole execution, even if it was shorter than the interval.
+        The script has usually been reaped by then, so the final sample holds only the counters.
+        """
+        self.stop_event.set()
+        if self.is_alive():
+            self.join()
+        self.take_sample()
+        if self.writer:
+            self.writer.close()
+
+    def disk_io_difference(self):
+        """
+        Returns the number of bytes read from and written to disk system-wide while monitoring.
+        """
+        if self.first_disk_io is None or self.last_disk_io is None:
+            return 0, 0
+        return (
+            self.last_disk_io.read_bytes - self.first_disk_io.read_bytes,
+            self.last_disk_io.write_bytes - self.first_disk_io.write_bytes,
+        )
@@ -0,0 +1,124 @@
+from test_settings import *
+from result_store import ResultStore
+import hashlib
+import json
+import time
+import os
+
+
+def get_file_hash(file_path):
+    """
+    Returns the SHA-256 hash of the file content.
+
+    Args:
+        :file_path: (str) - The path to the file.
+    """
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+class ResultIngest:
+    def __init__(self, directories, cache_directory=INGEST_CACHE_DIRECTORY):
+        """
+        This class reads the results CSV files incrementally. A manifest keeps the size,
+        modification time and hash of every file which has been read, together with the
+        identifier of its parsed run in a result store used as the cache. On every update
+        only new or changed files are parsed, and removed files are dropped.
+
+        Args:
+            :directories: (list) - The directories with the results CSV files,
+                e.g. ALL_RESULTS_DIRECTORY or PERFORMANCE_LOGS_DIRECTORY.
+            :cache_directory: (str) - The directory of the manifest and the cached runs.
+        """
+        self.directories = directories
+        self.store = ResultStore(cache_directory)
+        self.manifest_filename = os.path.join(cache_directory, INGEST_MANIFEST_FILE)
+        self.manifest = {}
+        if os.path.exists(self.manifest_filename):
+            with open(self.manifest_filename, encoding="utf-8") as manifest_file:
+                self.manifest = json.load(manifest_file)
+
+    def list_files(self, settle_time=0):
+        """
+        Returns the absolute paths and stats of all results CSV files in the directories.
+
+        Args:
+            :settle_time: (float) - Files modified less than this number of seconds ago are
+                left for the next update, as they may still be written.
+        """
+        files = {}
+        now = time.time()
+        for directory in self.directories:
+            if not os.path.isdir(directory):
+                continue
+            for filename in sorted(os.listdir(directory)):
+                file_path = os.path.abspath(os.path.join(directory, filename))
+                if not filename.endswith(".csv") or not os.path.isfile(file_path):
+                    continue
+                stat = os.stat(file_path)
+                if now - stat.st_mtime >= settle_time:
+                    files[file_path] = stat
+        return files
+
+    def update(self, settle_time=0):
+        """
+        Parses new and changed files and forgets removed ones. A file whose size and
+        modification time are unchanged is not read at all, a file whose content hash
+        is unchanged is not parsed again. Returns the number of added, changed and removed files.
+
+        Args:
+            :settle_time: (float) - Files modified less than this number of seconds ago are skipped.
+        """
+        files = self.list_files(settle_time)
+        changes = 0
+        touched = 0
+        for file_path, stat in files.items():
+            entry = self.manifest.get(file_path)
+            if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+                continue
+            file_hash = get_file_hash(file_path)
+            if entry and entry["hash"] == file_hash:
+                entry["mtime"] = stat.st_mtime
+                touched += 1
+                continue
+            run_id = self.store.import_csv_file(file_path)
+            self.manifest[file_path] = {
+                "size": stat.st_size, "mtime": stat.st_mtime, "hash": file_hash, "run_id": run_id,
+            }
+            changes += 1
+
+        for file_path in list(self.manifest):
+            if not os.path.exists(file_path) or not any(
+                os.path.dirname(file_path) == os.path.abspath(directory) for directory in self.directories
+            ):
+                del self.manifest[file_path]
+                changes += 1
+
+        if changes or touched:
+            self.save_manifest()
+        return changes
+
+    def save_manifest(self):
+        """
+        Saves the manifest atomically, through a temporary file of this process.
+        """
+        temporary_filename = f"{self.manifest_filename}.{os.getpid()}.tmp"
+        with open(temporary_filename, "w", encoding="utf-8") as manifest_file:
+            json.dump(self.manifest, manifest_file, indent=2, sort_keys=True)
+        os.replace(temporary_filename, self.manifest_filename)
+
+    def run_ids(self):
+        """
+        Returns the identifiers of the parsed runs of all files in the manifest, ordered by the file path.
+        """
+        return [entry["run_id"] for _, entry in sorted(self.manifest.items())]
+
+    def runs(self):
+        """
+        Returns the parsed runs of all files in the manifest, ordered by the file path,
+        as loaded from the result store.
+        """
+        return self.store.load(run_ids=self.run_ids())
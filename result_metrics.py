@@ -0,0 +1,150 @@
+from test_settings import *
+import numpy as np
+
+
+class ResultMetrics:
+    def __init__(self, runs):
+        """
+        This class computes the metrics of a single (tool, mode, platform) cell of results.
+        Every series is loaded once into a NaN-padded 2D array (one row per run), and all
+        metrics are computed with vectorized NumPy operations over all runs at once.
+        Arrays and metrics are cached, so every plot reuses them.
+
+        Args:
+            :runs: (list) - Dictionaries with the results of single runs, with values as read
+                from the CSV files (strings) or from the result store (numbers and arrays).
+        """
+        self.runs = runs
+        self.cache = {}
+
+    def cached(self, key, function):
+        """
+        Returns the cached result of the function, computing it on the first call.
+
+        Args:
+            :key: (tuple) - The cache key.
+            :function: (callable) - Function computing the result.
+        """
+        if key not in self.cache:
+            self.cache[key] = function()
+        return self.cache[key]
+
+    def series(self, key):
+        """
+        Returns the series of all runs as a 2D array, padded with NaN to the longest run.
+
+        Args:
+            :key: (str) - The name of the series, e.g. cpu_percentages.
+        """
+        def load():
+            rows = [np.atleast_1d(np.asarray(run.get(key, []), dtype=np.float64)) for run in self.runs]
+            lengths = np.array([len(row) for row in rows], dtype=np.int64)
+            padded = np.full((len(rows), lengths.max(initial=0)), np.nan)
+            padded[np.arange(padded.shape[1]) < lengths[:, None]] = np.concatenate(rows) if rows else []
+            return padded
+        return self.cached(("series", key), load)
+
+    def values(self, key):
+        """
+        Returns a scalar value of all runs as a 1D array, NaN for runs without it.
+
+        Args:
+            :key: (str) - The name of the value, e.g. duration_time.
+        """
+        return self.cached(
+            ("values", key),
+            lambda: np.array([float(run.get(key, np.nan)) for run in self.runs], dtype=np.float64),
+        )
+
+    def sample_times(self, key):
+        """
+        Returns the times of the samples of the series, relative to the start of each run.
+        Results saved before the sample times were recorded get times based on their sampling interval.
+
+        Args:
+            :key: (str) - The name of the series whose samples are timed.
+        """
+        def load():
+            samples = self.series(key)
+            recorded = self.series("sample_times")[:, :samples.shape[1]]
+            times = np.full(samples.shape, np.nan)
+            times[:, :recorded.shape[1]] = recorded
+            intervals = np.nan_to_num(self.values("sampling_interval"), nan=SAMPLING_INTERVAL)
+            estimated = intervals[:, None] * np.arange(1, samples.shape[1] + 1)
+            times = np.where(np.isnan(times), estimated, times)
+            return np.where(np.isnan(samples), np.nan, times)
+        return self.cached(("sample_times", key), load)
+
+    def mean(self, key):
+        """
+        Returns the mean of the series of every run.
+
+        Args:
+            :key: (str) - The name of the series.
+        """
+        return self.cached(("mean", key), lambda: nan_reduce(np.nanmean, self.series(key)))
+
+    def percentile(self, key, q):
+        """
+        Returns the given percentile of the series of every run.
+
+        Args:
+            :key: (str) - The name of the series.
+            :q: (float) - The percentile, from 0 to 100.
+        """
+        return self.cached(("percentile", key, q), lambda: nan_reduce(np.nanpercentile, self.series(key), q))
+
+    def rate(self, key):
+        """
+        Returns the mean per-second change of a cumulative counter series
+        (e.g. cpu_context_switches, cpu_interrupts) of every run.
+
+        Args:
+            :key: (str) - The name of the series.
+        """
+        def compute():
+            counters = self.series(key)
+            times = self.sample_times(key)
+            differences = np.abs(np.diff(counters, axis=1))
+            durations = np.diff(times, axis=1)
+            durations[durations <= 0] = np.nan
+            return nan_reduce(np.nanmean, differences / durations)
+        return self.cached(("rate", key), compute)
+
+    def spike(self, key, baseline_key):
+        """
+        Returns the difference between the first sample of the series and the baseline value of every run.
+
+        Args:
+            :key: (str) - The name of the series, e.g. cpu_percentages.
+            :baseline_key: (str) - The name of the value measured before the run, e.g. cpu_usage_before.
+        """
+        def compute():
+            series = self.series(key)
+            first = series[:, 0] if series.shape[1] else np.full(len(self.runs), np.nan)
+            return first - self.values(baseline_key)
+        return self.cached(("spike", key, baseline_key), compute)
+
+
+def nan_reduce(function, array, *args):
+    """
+    Applies a NaN-ignoring reduction along the rows of the array. Rows without any value give NaN.
+
+    Args:
+        :function: (callable) - The reduction, e.g. np.nanmean.
+        :array: (np.ndarray) - The 2D array.
+    """
+    result = np.full(array.shape[0], np.nan)
+    rows = ~np.isnan(array).all(axis=1) if array.shape[1] else np.zeros(array.shape[0], dtype=bool)
+    if rows.any():
+        result[rows] = function(array[rows], *args, axis=1)
+    return result
+
+def finite(values):
+    """
+    Returns the values without NaN, as expected by the plots.
+
+    Args:
+        :values: (np.ndarray) - The values.
+    """
+    return values[~np.isnan(values)]
@@ -0,0 +1,303 @@
+from test_settings import *
+from itertools import combinations
+import numpy as np
+import argparse
+import math
+
+METRICS = {
+    "duration_time": lambda cell: cell.values('duration_time'),
+    "cpu_usage": lambda cell: cell.mean('cpu_percentages'),
+    "initial_spike_cpu_usage": lambda cell: cell.spike('cpu_percentages', 'cpu_usage_before'),
+    "context_switches_per_second": lambda cell: cell.rate('cpu_context_switches'),
+    "cpu_interrupts_per_second": lambda cell: cell.rate('cpu_interrupts'),
+    "memory_usage": lambda cell: cell.mean('memory_percentages'),
+    "initial_spike_memory_usage": lambda cell: cell.spike('memory_percentages', 'memory_usage_before'),
+    "rss_size": lambda cell: cell.mean('memory_resident_set_size_bytes'),
+    "disk_io_read": lambda cell: cell.values('disk_io_read_bytes'),
+    "disk_io_write": lambda cell: cell.values('disk_io_write_bytes'),
+}
+
+
+def rank_data(values):
+    """
+    Returns the ranks of the values, starting from 1, with tied values getting the average
+    of their ranks, and the sizes of all groups of tied values.
+
+    Args:
+        :values: (np.ndarray) - The values to rank.
+    """
+    order = np.argsort(values, kind="mergesort")
+    sorted_values = values[order]
+    group_starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    group_sizes = np.diff(np.r_[group_starts, len(values)])
+    average_ranks = group_starts + (group_sizes + 1) / 2
+    ranks = np.empty(len(values))
+    ranks[order] = np.repeat(average_ranks, group_sizes)
+    return ranks, group_sizes
+
+def normal_sf(z):
+    """
+    Returns the probability that a standard normal variable is greater than z.
+
+    Args:
+        :z: (float) - The value of the variable.
+    """
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+def chi2_sf(x, degrees_of_freedom):
+    """
+    Returns the probability that a chi-squared variable is greater than x,
+    computed as the regularized upper incomplete gamma function.
+
+    Args:
+        :x: (float) - The value of the variable.
+        :degrees_of_freedom: (int) - The degrees of freedom of the distribution.
+    """
+    a, x = degrees_of_freedom / 2, x / 2
+    if x <= 0:
+        return 1.0
+    log_prefix = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1:
+        term = total = 1 / a
+        for n in range(1, 1000):
+            term *= x / (a + n)
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1 - total * math.exp(log_prefix))
+    b = x + 1 - a
+    c = 1 / 1e-300
+    d = 1 / b
+    fraction = d
+    for n in range(1, 1000):
+        an = -n * (n - a)
+        b += 2
+        d = an * d + b
+        d = 1e-300 if abs(d) < 1e-300 else d
+        c = b + an / c
+        c = 1e-300 if abs(c) < 1e-300 else c
+        d = 1 / d
+        fraction *= d * c
+        if abs(d * c - 1) < 1e-15:
+            break
+    return fraction * math.exp(log_prefix)
+
+def bootstrap_median_ci(values, confidence=CONFIDENCE_LEVEL, resamples=BOOTSTRAP_RESAMPLES, seed=0):
+    """
+    Returns the median of the values and the percentile bootstrap confidence interval of the median.
+
+    Args:
+        :values: (np.ndarray) - The values of the metric, one per run.
+        :confidence: (float) - The confidence level of the interval, e.g. 0.95.
+        :resamples: (int) - The number of bootstrap resamples.
+        :seed: (int) - The seed of the random generator, so the intervals are reproducible.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        return np.nan, np.nan, np.nan
+    indices = np.random.default_rng(seed).integers(0, len(values), size=(resamples, len(values)))
+    medians = np.median(values[indices], axis=1)
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(medians, [alpha, 1 - alpha])
+    return float(np.median(values)), float(low), float(high)
+
+def relative_ci_width(median, low, high):
+    """
+    Returns the width of the confidence interval relative to the median, infinite for a zero median.
+
+    Args:
+        :median: (float) - The median.
+        :low: (float) - The lower bound of the confidence interval.
+        :high: (float) - The upper bound of the confidence interval.
+    """
+    return (high - low) / abs(median) if median else math.inf
+
+def required_repetitions(values, target=TARGET_RELATIVE_CI_WIDTH, confidence=CONFIDENCE_LEVEL):
+    """
+    Returns the estimated number of runs needed for the relative width of the confidence
+    interval of the median to drop to the target. The width shrinks with the square root
+    of the number of runs. Returns None if it cannot be estimated (less than 2 runs or a zero median).
+
+    Args:
+        :values: (np.ndarray) - The values of the metric, one per run.
+        :target: (float) - The target relative width of the confidence interval, e.g. 0.1.
+        :confidence: (float) - The confidence level of the interval.
+    """
+    if len(values) < 2:
+        return None
+    width = relative_ci_width(*bootstrap_median_ci(values, confidence))
+    if math.isinf(width):
+        return None
+    return max(2, math.ceil(len(values) * (width / target) ** 2))
+
+def mann_whitney(first, second):
+    """
+    Returns the U statistic, the two-sided p-value (normal approximation with tie and continuity
+    corrections) and Cliff's delta effect size of the Mann-Whitney U test of two samples.
+    A positive delta means the values of the first sample tend to be greater.
+
+    Args:
+        :first: (np.ndarray) - The values of the first sample.
+        :second: (np.ndarray) - The values of the second sample.
+    """
+    n1, n2 = len(first), len(second)
+    if not n1 or not n2:
+        return np.nan, np.nan, np.nan
+    n = n1 + n2
+    ranks, ties = rank_data(np.concatenate([first, second]))
+    u = ranks[:n1].sum() - n1 * (n1 + 1) / 2
+    delta = 2 * u / (n1 * n2) - 1
+    variance = n1 * n2 / 12 * ((n + 1) - (ties ** 3 - ties).sum() / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0, delta
+    z = max(abs(u - n1 * n2 / 2) - 0.5, 0) / math.sqrt(variance)
+    return u, min(1.0, 2 * normal_sf(z)), delta
+
+def kruskal_wallis(groups):
+    """
+    Returns the H statistic (with tie correction), the p-value and the epsilon-squared
+    effect size of the Kruskal-Wallis test of the groups.
+
+    Args:
+        :groups: (list) - The values of every group, e.g. of every tool.
+    """
+    groups = [group for group in groups if len(group)]
+    n = sum(len(group) for group in groups)
+    if len(groups) < 2 or n < 3:
+        return np.nan, np.nan, np.nan
+    ranks, ties = rank_data(np.concatenate(groups))
+    rank_sums = np.add.reduceat(ranks, np.cumsum([0] + [len(group) for group in groups[:-1]]))
+    h = 12 / (n * (n + 1)) * sum(rank_sum ** 2 / len(group) for rank_sum, group in zip(rank_sums, groups)) - 3 * (n + 1)
+    correction = 1 - (ties ** 3 - ties).sum() / (n ** 3 - n)
+    if correction <= 0:
+        return 0.0, 1.0, 0.0
+    h /= correction
+    return h, chi2_sf(h, len(groups) - 1), h / (n - 1)
+
+def holm_adjust(p_values):
+    """
+    Returns the p-values adjusted for multiple comparisons with the Holm-Bonferroni method.
+
+    Args:
+        :p_values: (list) - The p-values of all comparisons.
+    """
+    p_values = np.asarray(p_values, dtype=np.float64)
+    order = np.argsort(p_values)
+    adjusted = np.maximum.accumulate(p_values[order] * (len(p_values) - np.arange(len(p_values))))
+    result = np.empty(len(p_values))
+    result[order] = np.minimum(adjusted, 1.0)
+    return result
+
+def compare_tools(values, target=TARGET_RELATIVE_CI_WIDTH, confidence=CONFIDENCE_LEVEL):
+    """
+    Compares the values of a single metric between the tools. Returns the median with its
+    confidence interval and the required number of runs of every tool, the Kruskal-Wallis test
+    of all tools, and the Mann-Whitney tests of every pair of tools with Holm-adjusted p-values.
+
+    Args:
+        :values: (dict) - The values of the metric of every tool, without missing values.
+        :target: (float) - The target relative width of the confidence intervals.
+        :confidence: (float) - The confidence level of the intervals.
+    """
+    tools = {}
+    for tool, tool_values in values.items():
+        median, low, high = bootstrap_median_ci(tool_values, confidence)
+        tools[tool] = {
+            "runs": len(tool_values), "median": median, "ci_low": low, "ci_high": high,
+            "relative_ci_width": relative_ci_width(median, low, high) if len(tool_values) else np.nan,
+            "required_runs": required_repetitions(tool_values, target, confidence),
+        }
+
+    h, p, epsilon_squared = kruskal_wallis(list(values.values()))
+    pairs = []
+    for first, second in combinations([tool for tool in values if len(values[tool])], 2):
+        u, pair_p, delta = mann_whitney(values[first], values[second])
+        pairs.append({"tools": (first, second), "u": u, "p": pair_p, "cliffs_delta": delta})
+    for pair, adjusted_p in zip(pairs, holm_adjust([pair["p"] for pair in pairs])):
+        pair["adjusted_p"] = adjusted_p
+    return {
+        "tools": tools,
+        "kruskal_wallis": {"h": h, "p": p, "epsilon_squared": epsilon_squared},
+        "pairs": pairs,
+    }
+
+def describe_effect_size(delta):
+    """
+    Returns the conventional description of the absolute value of Cliff's delta.
+
+    Args:
+        :delta: (float) - Cliff's delta.
+    """
+    delta = abs(delta)
+    if delta < 0.147:
+        return "negligible"
+    if delta < 0.33:
+        return "small"
+    if delta < 0.474:
+        return "medium"
+    return "large"
+
+def print_comparison(metric, mode, platform, comparison, significance=SIGNIFICANCE_LEVEL):
+    """
+    Displays the comparison of a single metric between the tools.
+
+    Args:
+        :metric: (str) - The name of the metric.
+        :mode: (str) - headless or noheadless.
+        :platform: (str) - The operating system.
+        :comparison: (dict) - The comparison returned by compare_tools.
+        :significance: (float) - The significance level of the tests.
+    """
+    print(f"{metric} in {mode} mode on {platform}:")
+    for tool, summary in comparison["tools"].items():
+        if not summary["runs"]:
+            continue
+        print(
+            f"  {tool}: median {summary['median']:.4g} [{summary['ci_low']:.4g}, {summary['ci_high']:.4g}], "
+            f"{summary['runs']} runs, relative CI width {summary['relative_ci_width']:.1%}, "
+            f"runs needed: {summary['required_runs'] if summary['required_runs'] is not None else 'unknown'}"
+        )
+    kruskal = comparison["kruskal_wallis"]
+    if not np.isnan(kruskal["p"]):
+        print(
+            f"  Kruskal-Wallis: H = {kruskal['h']:.3f}, p = {kruskal['p']:.4f}, "
+            f"epsilon squared = {kruskal['epsilon_squared']:.3f}"
+        )
+    for pair in comparison["pairs"]:
+        first, second = pair["tools"]
+        verdict = "significant" if pair["adjusted_p"] < significance else "not significant"
+        print(
+            f"  {first} vs {second}: U = {pair['u']:.1f}, adjusted p = {pair['adjusted_p']:.4f} ({verdict}), "
+            f"Cliff's delta = {pair['cliffs_delta']:.3f} ({describe_effect_size(pair['cliffs_delta'])})"
+        )
+    print()
+
+def parse_arguments():
+    """
+    Parses the command line arguments of the statistical comparison.
+    """
+    parser = argparse.ArgumentParser(description="Compares the results of the testing tools with statistical tests.")
+    parser.add_argument("--source", nargs="+", default=[ALL_RESULTS_DIRECTORY],
+                        help=f"directories with the CSV files, e.g. {PERFORMANCE_LOGS_DIRECTORY} (default: {ALL_RESULTS_DIRECTORY})")
+    parser.add_argument("--metrics", nargs="+", choices=list(METRICS), default=list(METRICS),
+                        help="metrics to compare (default: all)")
+    parser.add_argument("--target-ci-width", type=float, default=TARGET_RELATIVE_CI_WIDTH,
+                        help=f"target relative width of the confidence intervals (default: {TARGET_RELATIVE_CI_WIDTH})")
+    parser.add_argument("--confidence", type=float, default=CONFIDENCE_LEVEL,
+                        help=f"confidence level of the intervals (default: {CONFIDENCE_LEVEL})")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    from plot_creator import TOOLS, MODES, PLATFORMS, read_all_data, get_tools_values
+
+    arguments = parse_arguments()
+    read_all_data(verbose=False, directories=arguments.source)
+    for platform in PLATFORMS:
+        for mode in MODES:
+            for metric in arguments.metrics:
+                values = dict(zip(TOOLS, get_tools_values(mode, platform, METRICS[metric])))
+                if not any(len(tool_values) for tool_values in values.values()):
+                    continue
+                comparison = compare_tools(values, arguments.target_ci_width, arguments.confidence)
+                print_comparison(metric, mode, platform, comparison)
@@ -0,0 +1,233 @@
+from test_settings import *
+from array import array
+import threading
+import argparse
+import json
+import csv
+import os
+
+SERIES_TYPECODE = "d"
+
+
+def parse_results_filename(file_path):
+    """
+    Returns the tool, mode, system and start time encoded in the name of a results file,
+    e.g. 'selenium_test_headless_Linux-6.5.0_20240101_120000_001.csv'.
+
+    Args:
+        :file_path: (str) - The path to the results file.
+    """
+    tool, _, mode, system_release, *start_time = os.path.splitext(os.path.basename(file_path))[0].split('_')
+    return tool, mode, system_release.split('-')[0], "_".join(start_time)
+
+def to_number(value):
+    """
+    Converts a value read from a CSV file to a number, leaving other values unchanged.
+
+    Args:
+        :value: (str) - The value to convert.
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+def is_number(value):
+    """
+    Returns whether the value can be stored in a numeric column.
+
+    Args:
+        :value: (object) - The value to check.
+    """
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class ResultStore:
+    lock = threading.Lock()
+
+    def __init__(self, directory=RESULT_STORE_DIRECTORY):
+        """
+        This class keeps the results of all runs in an append-only columnar store.
+        Every numeric time series (cpu_percentages, sample_times, ...) is appended as raw
+        float64 values to its own column file, and a JSON line per run in the index holds
+        the tool, mode, system, start time, scalar values and the position of each series
+        in the column files. Runs are filtered on the index alone, and their series are read
+        as zero-copy NumPy memmap views, so loading thousands of runs needs no parsing.
+
+        Args:
+            :directory: (str) - The directory of the store.
+        """
+        self.directory = directory
+        self.index_filename = os.path.join(directory, RESULT_STORE_INDEX_FILE)
+        self.columns = {}
+        self.runs = []
+        self.index_size = 0
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self.refresh()
+
+    def refresh(self):
+        """
+        Reads the index again if other store instances have appended runs to it.
+        """
+        index_size = os.path.getsize(self.index_filename) if os.path.exists(self.index_filename) else 0
+        if index_size == self.index_size:
+            return
+        with open(self.index_filename, encoding="utf-8") as index_file:
+            self.runs = [json.loads(line) for line in index_file if line.strip()]
+        self.index_size = index_size
+        self.columns = {}
+
+    def get_column_filename(self, key):
+        """
+        Returns the path of the column file of the given series.
+
+        Args:
+            :key: (str) - The name of the series.
+        """
+        return os.path.join(self.directory, f"{key}.f8")
+
+    def append(self, tool, mode, system, start_time, record, source=None):
+        """
+        Appends a single run to the store. Lists of numbers are written to the column files,
+        the remaining values are kept in the index. The index line is written last,
+        so an interrupted append never leaves a partial run in the store.
+
+        Args:
+            :tool: (str) - The testing tool, e.g. selenium.
+            :mode: (str) - headless or noheadless.
+            :system: (str) - The operating system, e.g. Linux.
+            :start_time: (str) - Start time of the run, as used in the results filenames.
+            :record: (dict) - The results of the run, the same keys and values as in the CSV file.
+            :source: (str) - Optional path of the file from which the run was imported.
+        """
+        entry = {
+            "run_id": None, "tool": tool, "mode": mode, "system": system, "start_time": start_time,
+            "source": source, "values": {}, "series": {},
+        }
+        with self.lock:
+            self.refresh()
+            for key, value in record.items():
+                if isinstance(value, (list, tuple)) and all(is_number(item) for item in value):
+                    with open(self.get_column_filename(key), "ab") as column_file:
+                        offset = column_file.tell() // array(SERIES_TYPECODE).itemsize
+                        array(SERIES_TYPECODE, value).tofile(column_file)
+                    entry["series"][key] = [offset, len(value)]
+                    self.columns.pop(key, None)
+                else:
+                    entry["values"][key] = list(value) if isinstance(value, tuple) else value
+
+            entry["run_id"] = len(self.runs)
+            with open(self.index_filename, "a", encoding="utf-8") as index_file:
+                index_file.write(json.dumps(entry) + "\n")
+            self.runs.append(entry)
+            self.index_size = os.path.getsize(self.index_filename)
+        return entry["run_id"]
+
+    def select(self, tool=None, mode=None, system=None, run_ids=None):
+        """
+        Returns the index entries of the runs matching the given filters.
+
+        Args:
+            :tool: (str) - Optional tool, or a list of tools.
+            :mode: (str) - Optional mode, or a list of modes.
+            :system: (str) - Optional operating system, or a list of systems.
+            :run_ids: (list) - Optional identifiers of the runs.
+        """
+        def matches(value, expected):
+            return expected is None or value == expected or (isinstance(expected, (list, tuple)) and value in expected)
+
+        self.refresh()
+        runs = self.runs if run_ids is None else [self.runs[run_id] for run_id in run_ids]
+        return [
+            run for run in runs
+            if matches(run["tool"], tool) and matches(run["mode"], mode) and matches(run["system"], system)
+        ]
+
+    def get_column(self, key):
+        """
+        Returns the memory-mapped column file of the given series.
+
+        Args:
+            :key: (str) - The name of the series.
+        """
+        import numpy as np
+
+        if key not in self.columns:
+            if not os.path.getsize(self.get_column_filename(key)):
+                return np.empty(0)
+            self.columns[key] = np.memmap(self.get_column_filename(key), dtype=np.float64, mode="r")
+        return self.columns[key]
+
+    def load(self, tool=None, mode=None, system=None, keys=None, run_ids=None):
+        """
+        Returns the runs matching the given filters as dictionaries with the metadata,
+        the scalar values and the series as NumPy arrays.
+
+        Args:
+            :tool: (str) - Optional tool, or a list of tools.
+            :mode: (str) - Optional mode, or a list of modes.
+            :system: (str) - Optional operating system, or a list of systems.
+            :keys: (list) - Optional names of the values and series to load, all by default.
+            :run_ids: (list) - Optional identifiers of the runs.
+        """
+        runs = []
+        for run in self.select(tool, mode, system, run_ids):
+            data = {name: run[name] for name in ("run_id", "tool", "mode", "system", "start_time", "source")}
+            for key, value in run["values"].items():
+                if keys is None or key in keys:
+                    data[key] = value
+            for key, (offset, length) in run["series"].items():
+                if keys is None or key in keys:
+                    data[key] = self.get_column(key)[offset:offset + length]
+            runs.append(data)
+        return runs
+
+    def import_csv_files(self, directory=PERFORMANCE_LOGS_DIRECTORY):
+        """
+        Imports the results CSV files from the given directory, skipping the files
+        which have already been imported. Returns the number of imported runs.
+
+        Args:
+            :directory: (str) - The directory with the results CSV files.
+        """
+        imported = {run["source"] for run in self.runs}
+        count = 0
+        for filename in sorted(os.listdir(directory)):
+            file_path = os.path.join(directory, filename)
+            if not filename.endswith(".csv") or os.path.abspath(file_path) in imported:
+                continue
+            self.import_csv_file(file_path)
+            count += 1
+        return count
+
+    def import_csv_file(self, file_path):
+        """
+        Imports a single results CSV file written by the performance analyser.
+
+        Args:
+            :file_path: (str) - The path to the CSV file.
+        """
+        record = {}
+        with open(file_path, newline='') as csv_file:
+            for row in csv.reader(csv_file, delimiter=';'):
+                if len(row) == 2:
+                    record[row[0]] = to_number(row[1])
+                else:
+                    record[row[0]] = [to_number(value) for value in row[1:]]
+        tool, mode, system, start_time = parse_results_filename(file_path)
+        return self.append(tool, mode, system, start_time, record, source=os.path.abspath(file_path))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Imports results CSV files into the columnar result store.")
+    parser.add_argument("directories", nargs="*", default=[PERFORMANCE_LOGS_DIRECTORY],
+                        help=f"directories with results CSV files (default: {PERFORMANCE_LOGS_DIRECTORY})")
+    parser.add_argument("--store", default=RESULT_STORE_DIRECTORY,
+                        help=f"directory of the result store (default: {RESULT_STORE_DIRECTORY})")
+    arguments = parser.parse_args()
+
+    store = ResultStore(arguments.store)
+    for directory in arguments.directories:
+        print(f"Imported {store.import_csv_files(directory)} runs from {directory}.")
+    print(f"Total amount of runs in the store: {len(store.runs)}")
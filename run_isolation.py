@@ -0,0 +1,310 @@
+from test_settings import *
+import itertools
+import threading
+import signal
+import psutil
+import time
+import os
+
+CGROUP_CONTROLLERS = ["cpu", "memory", "io"]
+CGROUP_ATTACH_SCRIPT = '{ echo $$ > "$0/cgroup.procs"; } 2>/dev/null; exec "$@"'
+
+run_numbers = itertools.count(1)
+cgroup_parent_lock = threading.Lock()
+cgroup_parent = {}
+
+
+def get_cgroup_root():
+    """
+    Returns the directory of the cgroup v2 in which the analyser runs, or None if cgroup v2 is not available.
+    """
+    try:
+        with open("/proc/self/cgroup", encoding="utf-8") as cgroup_file:
+            path = next((line.strip()[3:] for line in cgroup_file if line.startswith("0::")), None)
+        with open("/proc/mounts", encoding="utf-8") as mounts_file:
+            mount_point = next((line.split()[1] for line in mounts_file if line.split()[2] == "cgroup2"), None)
+    except OSError:
+        return None
+    if path is None or mount_point is None:
+        return None
+    return os.path.join(mount_point, path.lstrip("/"))
+
+def enable_controllers(cgroup, controllers):
+    """
+    Enables the given controllers for the children of the cgroup and returns the ones which could not be enabled.
+
+    Args:
+        :cgroup: (str) - The directory of the cgroup.
+        :controllers: (list) - The names of the controllers, e.g. memory.
+    """
+    failed = []
+    for controller in controllers:
+        try:
+            with open(os.path.join(cgroup, "cgroup.subtree_control"), "w", encoding="utf-8") as control_file:
+                control_file.write(f"+{controller}")
+        except OSError:
+            failed.append(controller)
+    return failed
+
+def move_processes(source, destination, attempts=10):
+    """
+    Moves all processes of the source cgroup to the destination cgroup, repeatedly, as the processes
+    may start new ones meanwhile. Returns the identifiers of the processes which could not be moved.
+
+    Args:
+        :source: (str) - The directory of the cgroup whose processes are moved.
+        :destination: (str) - The directory of the cgroup to which they are moved.
+        :attempts: (int) - Maximum number of times the processes of the source cgroup are read.
+    """
+    failed = set()
+    for _ in range(attempts):
+        with open(os.path.join(source, "cgroup.procs"), encoding="utf-8") as procs_file:
+            pids = [int(line) for line in procs_file if line.strip()]
+        if set(pids) <= failed:
+            break
+        for pid in pids:
+            try:
+                with open(os.path.join(destination, "cgroup.procs"), "w", encoding="utf-8") as procs_file:
+                    procs_file.write(str(pid))
+                failed.discard(pid)
+            except OSError:
+                failed.add(pid)
+    return sorted(failed)
+
+def prepare_cgroup_parent():
+    """
+    Returns the cgroup under which the cgroups of the runs are created, with the CPU, memory and IO
+    controllers enabled for its children, or None if cgroup v2 is not available or not writable.
+    cgroup v2 enables controllers for the children only of a cgroup without processes of its own,
+    so if enabling them fails, all processes of the cgroup (the analyser, its shell, warm interpreters
+    started earlier, ...) are moved to a leaf cgroup next to the cgroups of the runs and the controllers
+    are enabled again. The controllers which are still missing are reported with the processes which
+    could not be moved.
+    """
+    root = get_cgroup_root()
+    if root is None or not os.access(root, os.W_OK):
+        return None
+    try:
+        with open(os.path.join(root, "cgroup.controllers"), encoding="utf-8") as controllers_file:
+            available = controllers_file.read().split()
+    except OSError:
+        available = []
+    failed = enable_controllers(root, [controller for controller in CGROUP_CONTROLLERS if controller in available])
+    remaining = []
+    if failed:
+        leaf = os.path.join(root, f"{CGROUP_PREFIX}-analyser")
+        try:
+            if not os.path.exists(leaf):
+                os.mkdir(leaf)
+            remaining = move_processes(root, leaf)
+        except OSError:
+            pass
+        failed = enable_controllers(root, failed)
+    missing = [controller for controller in CGROUP_CONTROLLERS if controller not in available] + failed
+    if missing:
+        reason = f" (processes {', '.join(map(str, remaining))} could not be moved out of it)" if remaining else ""
+        print(
+            f"WARNING: the {', '.join(missing)} cgroup controllers cannot be enabled in {root}{reason}, "
+            f"the cgroup totals of the runs which depend on them are not recorded\n"
+        )
+    return root
+
+def get_cgroup_parent():
+    """
+    Returns the cgroup under which the cgroups of the runs are created, prepared once per analyser process.
+    """
+    with cgroup_parent_lock:
+        if "path" not in cgroup_parent:
+            cgroup_parent["path"] = prepare_cgroup_parent()
+        return cgroup_parent["path"]
+
+def read_key_values(file_path):
+    """
+    Returns the values of a flat keyed cgroup file (e.g. cpu.stat) as a dictionary of integers.
+
+    Args:
+        :file_path: (str) - The path to the cgroup file.
+    """
+    with open(file_path, encoding="utf-8") as cgroup_file:
+        return {key: int(value) for key, value in (line.split() for line in cgroup_file if line.strip())}
+
+
+class RunIsolation:
+    def __init__(self, use_cgroup=True):
+        """
+        This class isolates a single run of a test script, together with the driver and browser
+        processes it starts. The script is started in its own process group (session) and, where
+        cgroup v2 is available and writable, moved to a transient cgroup created for the run.
+        When the run completes, fails or times out, the whole tree is killed, so no orphaned
+        Chrome or ChromeDriver process disturbs later runs. The cgroup also gives the exact CPU time,
+        peak memory and IO bytes of all processes of the run, including the ones which have already exited.
+
+        Args:
+            :use_cgroup: (bool) - Specifies whether a transient cgroup is used when available.
+        """
+        self.cgroup = None
+        self.process = None
+        self.process_group = None
+        if use_cgroup:
+            self.create_cgroup()
+
+    def create_cgroup(self):
+        """
+        Creates the transient cgroup of the run under the prepared parent cgroup,
+        which has the CPU, memory and IO controllers enabled where they are delegated.
+        """
+        parent = get_cgroup_parent()
+        if parent is None:
+            return
+        cgroup = os.path.join(parent, f"{CGROUP_PREFIX}-{os.getpid()}-{next(run_numbers)}")
+        try:
+            os.mkdir(cgroup)
+        except OSError:
+            return
+        self.cgroup = cgroup
+
+    def wrap_command(self, command):
+        """
+        Returns the command which moves the new process to the cgroup of the run before it executes
+        the script, so the processes the script starts right away cannot escape the cgroup.
+
+        Args:
+            :command: (list) - The argument list of the script.
+        """
+        if self.cgroup is None:
+            return command
+        return ["/bin/sh", "-c", CGROUP_ATTACH_SCRIPT, self.cgroup, *command]
+
+    def attach(self, process):
+        """
+        Moves the script process to the cgroup of the run, so all processes it starts are in the cgroup too.
+        A new process is already moved by the command returned by wrap_command, a warm interpreter
+        has to be attached before it is told to run the script.
+
+        Args:
+            :process: (subprocess.Popen) - The test script process.
+        """
+        self.process = process
+        try:
+            self.process_group = os.getpgid(process.pid) if hasattr(os, "getpgid") else None
+        except ProcessLookupError:
+            self.process_group = None
+        if self.cgroup is None:
+            return
+        try:
+            with open(os.path.join(self.cgroup, "cgroup.procs"), "w", encoding="utf-8") as procs_file:
+                procs_file.write(str(process.pid))
+        except OSError:
+            self.remove_cgroup()
+
+    def get_processes(self, known_processes=()):
+        """
+        Returns the processes of the run which are still alive: the members of the cgroup
+        or the process group, and the known descendants of the script.
+
+        Args:
+            :known_processes: (list) - Processes observed in the tree of the script while it was running,
+                found even after they have left the process group and have been reparented.
+        """
+        processes = {}
+        pids = []
+        if self.cgroup:
+            try:
+                with open(os.path.join(self.cgroup, "cgroup.procs"), encoding="utf-8") as procs_file:
+                    pids = [int(line) for line in procs_file if line.strip()]
+            except OSError:
+                pass
+        for pid in pids:
+            try:
+                processes[pid] = psutil.Process(pid)
+            except psutil.Error:
+                pass
+        if self.process_group is not None and self.process_group != os.getpgid(0):
+            for process in psutil.process_iter():
+                try:
+                    if os.getpgid(process.pid) == self.process_group:
+                        processes.setdefault(process.pid, process)
+                except (ProcessLookupError, PermissionError, psutil.Error):
+                    pass
+        for process in known_processes:
+            if process.is_running():
+                processes.setdefault(process.pid, process)
+        processes.pop(os.getpid(), None)
+        return list(processes.values())
+
+    def kill(self, known_processes=(), grace_period=KILL_GRACE_PERIOD):
+        """
+        Terminates all processes of the run, kills the ones which have not exited within
+        the grace period, and returns the number of processes which were still alive.
+
+        Args:
+            :known_processes: (list) - Processes observed in the tree of the script while it was running.
+            :grace_period: (float) - Time given to the processes to exit after SIGTERM, in seconds.
+        """
+        processes = self.get_processes(known_processes)
+        if not processes:
+            return 0
+        for process in processes:
+            try:
+                process.send_signal(signal.SIGTERM)
+            except psutil.Error:
+                pass
+        _, alive = psutil.wait_procs(processes, timeout=grace_period)
+        if alive and self.cgroup and os.path.exists(os.path.join(self.cgroup, "cgroup.kill")):
+            try:
+                with open(os.path.join(self.cgroup, "cgroup.kill"), "w", encoding="utf-8") as kill_file:
+                    kill_file.write("1")
+            except OSError:
+                pass
+        for process in alive:
+            try:
+                process.kill()
+            except psutil.Error:
+                pass
+        psutil.wait_procs(alive, timeout=grace_period)
+        if self.process and self.process.poll() is None:
+            self.process.wait()
+        return len(processes)
+
+    def read_totals(self):
+        """
+        Returns the CPU time, peak memory and IO bytes of all processes of the run read from
+        the cgroup files, with empty values for the ones which are not available.
+        """
+        totals = {
+            "cgroup_cpu_time": "", "cgroup_memory_peak_bytes": "",
+            "cgroup_io_read_bytes": "", "cgroup_io_write_bytes": "",
+        }
+        if self.cgroup is None:
+            return totals
+        try:
+            totals["cgroup_cpu_time"] = round(read_key_values(os.path.join(self.cgroup, "cpu.stat"))["usage_usec"] / 1e6, 3)
+        except (OSError, KeyError, ValueError):
+            pass
+        try:
+            with open(os.path.join(self.cgroup, "memory.peak"), encoding="utf-8") as peak_file:
+                totals["cgroup_memory_peak_bytes"] = int(peak_file.read())
+        except (OSError, ValueError):
+            pass
+        try:
+            with open(os.path.join(self.cgroup, "io.stat"), encoding="utf-8") as io_file:
+                devices = [dict(field.split("=") for field in line.split()[1:]) for line in io_file if line.strip()]
+            totals["cgroup_io_read_bytes"] = sum(int(device.get("rbytes", 0)) for device in devices)
+            totals["cgroup_io_write_bytes"] = sum(int(device.get("wbytes", 0)) for device in devices)
+        except (OSError, ValueError):
+            pass
+        return totals
+
+    def remove_cgroup(self):
+        """
+        Removes the cgroup of the run, waiting shortly for the killed processes to leave it.
+        """
+        if self.cgroup is None:
+            return
+        for _ in range(10):
+            try:
+                os.rmdir(self.cgroup)
+                break
+            except OSError:
+                time.sleep(0.1)
+        self.cgroup = None
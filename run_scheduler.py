@@ -0,0 +1,488 @@
+from test_settings import *
+from tests_performance_analyser import (
+    add_script_arguments, add_timeout_arguments, get_script_arguments, get_result_record, measure_script,
+    validate_sampling_interval,
+)
+from browser_session import positive_float, positive_int
+from interpreter_pool import WarmInterpreterPool
+from environment_guard import EnvironmentGuard
+from result_metrics import ResultMetrics, finite
+from result_statistics import METRICS, bootstrap_median_ci, relative_ci_width
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import threading
+import argparse
+import random
+import queue
+import json
+import math
+import time
+import os
+
+
+def get_cell_id(script, headless_mode):
+    """
+    Returns the identifier of a (tool, mode) cell, the prefix of the identifiers of its runs.
+
+    Args:
+        :script: (str) - The name of the test script.
+        :headless_mode: (bool) - Specifies whether the script is executed in headless mode.
+    """
+    return f"{script}:{HEADLESS if headless_mode else NOHEADLESS}"
+
+def create_job(script, headless_mode, repetition):
+    """
+    Returns a single run of the campaign.
+
+    Args:
+        :script: (str) - The name of the test script.
+        :headless_mode: (bool) - Specifies whether the script is executed in headless mode.
+        :repetition: (int) - The number of the repetition of the (tool, mode) cell, starting from 1.
+    """
+    return {
+        "id": f"{get_cell_id(script, headless_mode)}:{repetition:03d}",
+        "script": script,
+        "headless_mode": headless_mode,
+        "repetition": repetition,
+    }
+
+def create_jobs(scripts, headless_modes, repetitions):
+    """
+    Returns the list of all runs of the campaign, one for every repetition of every (tool, mode) cell.
+
+    Args:
+        :scripts: (list) - The names of the test scripts.
+        :headless_modes: (list) - The headless modes in which every script is executed.
+        :repetitions: (int) - The number of runs of every (tool, mode) cell.
+    """
+    return [
+        create_job(script, headless_mode, repetition)
+        for script in scripts
+        for headless_mode in headless_modes
+        for repetition in range(1, repetitions + 1)
+    ]
+
+def create_cpu_slots(concurrency):
+    """
+    Splits the CPUs available to the analyser into disjoint groups, one per worker slot,
+    so parallel runs never share a CPU. Returns None for every slot if CPU pinning
+    is not supported by the operating system.
+
+    Args:
+        :concurrency: (int) - The number of runs executed at the same time.
+    """
+    if not hasattr(os, "sched_getaffinity"):
+        return [None] * concurrency
+
+    cpus = sorted(os.sched_getaffinity(0))
+    if concurrency > len(cpus):
+        raise ValueError(f"Concurrency {concurrency} is higher than the number of available CPUs ({len(cpus)}).")
+    slot_size = len(cpus) // concurrency
+    return [cpus[slot * slot_size:(slot + 1) * slot_size] for slot in range(concurrency)]
+
+def load_checkpoint(checkpoint_filename):
+    """
+    Returns the saved state of an interrupted campaign or None if there is no checkpoint.
+
+    Args:
+        :checkpoint_filename: (str) - The path of the checkpoint file.
+    """
+    if not os.path.exists(checkpoint_filename):
+        return None
+    with open(checkpoint_filename, encoding="utf-8") as checkpoint_file:
+        return json.load(checkpoint_file)
+
+def save_checkpoint(checkpoint_filename, checkpoint):
+    """
+    Saves the campaign state atomically, so an interruption while writing never corrupts it.
+
+    Args:
+        :checkpoint_filename: (str) - The path of the checkpoint file.
+        :checkpoint: (dict) - The campaign state.
+    """
+    temporary_filename = f"{checkpoint_filename}.tmp"
+    with open(temporary_filename, "w", encoding="utf-8") as checkpoint_file:
+        json.dump(checkpoint, checkpoint_file, indent=2)
+    os.replace(temporary_filename, checkpoint_filename)
+
+
+class RunScheduler:
+    def __init__(self, scripts, headless_modes, repetitions, concurrency=1, seed=None,
+                 sampling_interval=SAMPLING_INTERVAL, pin_cpus=True, checkpoint_filename=SCHEDULER_CHECKPOINT_FILE,
+                 warm_pool=False, script_arguments=(), run_timeout=RUN_TIMEOUT, test_case_timeout=TEST_CASE_TIMEOUT):
+        """
+        This class executes a measurement campaign: N repetitions of every (tool, mode) cell,
+        in a randomized order which removes the ordering bias, with a configurable number
+        of parallel runs pinned to disjoint CPU slots. Completed runs are saved
+        in a checkpoint file, so an interrupted campaign can be resumed.
+
+        Args:
+            :scripts: (list) - The names of the test scripts.
+            :headless_modes: (list) - The headless modes in which every script is executed.
+            :repetitions: (int) - The number of runs of every (tool, mode) cell.
+            :concurrency: (int) - The number of runs executed at the same time.
+            :seed: (int) - The seed of the randomized order, random if not given.
+            :sampling_interval: (float) - Time between two consecutive resource samples, in seconds.
+            :pin_cpus: (bool) - Specifies whether runs are pinned to disjoint CPU slots.
+            :checkpoint_filename: (str) - The path of the checkpoint file.
+            :warm_pool: (bool) - Specifies whether runs use interpreters with the frameworks already imported.
+            :script_arguments: (list) - Additional command line arguments of the scripts.
+            :run_timeout: (float) - Maximum duration of a single run in seconds, 0 disables it.
+            :test_case_timeout: (float) - Maximum time without any output of a run in seconds, 0 disables it.
+        """
+        self.scripts = scripts
+        self.headless_modes = headless_modes
+        self.repetitions = repetitions
+        self.concurrency = concurrency
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.sampling_interval = sampling_interval
+        self.pin_cpus = pin_cpus
+        self.checkpoint_filename = checkpoint_filename
+        self.checkpoint_lock = threading.Lock()
+        self.completed = set()
+        self.script_arguments = script_arguments
+        self.run_timeout = run_timeout
+        self.test_case_timeout = test_case_timeout
+        self.interpreter_pool = WarmInterpreterPool(scripts, concurrency) if warm_pool else None
+
+    def resume(self):
+        """
+        Restores the seed and the completed runs from the checkpoint file.
+        The campaign parameters must be the same as in the interrupted campaign.
+        """
+        checkpoint = load_checkpoint(self.checkpoint_filename)
+        if checkpoint is None:
+            return
+        if checkpoint["repetitions"] != self.repetitions:
+            raise ValueError(
+                f"Checkpoint was created for {checkpoint['repetitions']} repetitions, not {self.repetitions}."
+            )
+        self.seed = checkpoint["seed"]
+        self.completed = set(checkpoint["completed"])
+
+    def checkpoint(self):
+        """
+        Returns the current campaign state saved in the checkpoint file.
+        """
+        return {
+            "seed": self.seed,
+            "repetitions": self.repetitions,
+            "completed": sorted(self.completed),
+        }
+
+    def pending_jobs(self):
+        """
+        Returns the runs which have not been completed yet, in the randomized order.
+        """
+        jobs = create_jobs(self.scripts, self.headless_modes, self.repetitions)
+        random.Random(self.seed).shuffle(jobs)
+        return [job for job in jobs if job["id"] not in self.completed]
+
+    def record_run(self, job, stats):
+        """
+        Records a completed run. Called with the checkpoint lock held, before the checkpoint is saved.
+
+        Args:
+            :job: (dict) - The completed run.
+            :stats: (dict) - Resource usage statistics of the run.
+        """
+        self.completed.add(job["id"])
+
+    def run_job(self, job, cpu_slots, progress):
+        """
+        Executes a single run on a free CPU slot and records it in the checkpoint.
+
+        Args:
+            :job: (dict) - The run to be executed.
+            :cpu_slots: (queue.Queue) - The queue of free CPU slots.
+            :progress: (dict) - The shared counters of the campaign progress.
+        """
+        cpu_slot = cpu_slots.get()
+        environment_guard = None
+        if self.concurrency > 1:
+            environment_guard = EnvironmentGuard(
+                cpus=cpu_slot, system_wide=False, check_stray_processes="--browser-endpoint" not in self.script_arguments,
+            )
+        try:
+            stats = measure_script(
+                job["script"], job["headless_mode"], self.sampling_interval,
+                run_suffix=f"_{job['repetition']:03d}", cpu_affinity=cpu_slot, verbose=False,
+                interpreter_pool=self.interpreter_pool, script_arguments=self.script_arguments,
+                environment_guard=environment_guard, run_timeout=self.run_timeout,
+                test_case_timeout=self.test_case_timeout,
+            )
+        finally:
+            cpu_slots.put(cpu_slot)
+
+        with self.checkpoint_lock:
+            progress["done"] += 1
+            if stats:
+                self.record_run(job, stats)
+                save_checkpoint(self.checkpoint_filename, self.checkpoint())
+                print(
+                    f"[{progress['done']}/{progress['total']}] {job['id']}"
+                    f"{f' on CPUs {cpu_slot}' if cpu_slot else ''}: {stats['execution_time']} s, "
+                    f"{stats['test_cases_passed']} passed, {stats['test_cases_failed']} failed"
+                )
+                if stats["timed_out"]:
+                    print(f"  TIMED OUT: {stats['timeout_reason']}, partial results saved")
+                if stats["contaminated"]:
+                    print(f"  CONTAMINATED: {'; '.join(stats['contamination_reasons'])}")
+            else:
+                print(f"[{progress['done']}/{progress['total']}] {job['id']}: FAILED, will be repeated on resume")
+
+    def create_cpu_slot_queue(self):
+        """
+        Returns the queue of free CPU slots, one per worker.
+        """
+        cpu_slots = queue.Queue()
+        for cpu_slot in (create_cpu_slots(self.concurrency) if self.pin_cpus else [None] * self.concurrency):
+            cpu_slots.put(cpu_slot)
+        return cpu_slots
+
+    def run(self):
+        """
+        Executes all pending runs of the campaign.
+        """
+        jobs = self.pending_jobs()
+        cpu_slots = self.create_cpu_slot_queue()
+
+        print(
+            f"Campaign: {len(jobs)} pending runs ({len(self.completed)} already completed), "
+            f"concurrency {self.concurrency}, seed {self.seed}"
+        )
+        save_checkpoint(self.checkpoint_filename, self.checkpoint())
+        if self.interpreter_pool:
+            self.interpreter_pool.start()
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                self.execute(executor, jobs, cpu_slots)
+        finally:
+            if self.interpreter_pool:
+                self.interpreter_pool.close()
+
+    def execute(self, executor, jobs, cpu_slots):
+        """
+        Executes the given runs and waits until all of them are finished.
+
+        Args:
+            :executor: (ThreadPoolExecutor) - The executor of the runs.
+            :jobs: (list) - The runs to be executed.
+            :cpu_slots: (queue.Queue) - The queue of free CPU slots.
+        """
+        progress = {"done": 0, "total": len(jobs)}
+        for future in [executor.submit(self.run_job, job, cpu_slots, progress) for job in jobs]:
+            future.result()
+
+
+class AdaptiveRunScheduler(RunScheduler):
+    def __init__(self, *args, metrics=ADAPTIVE_METRICS, target_ci_width=TARGET_RELATIVE_CI_WIDTH,
+                 min_repetitions=ADAPTIVE_MIN_REPETITIONS, time_budget=None, **kwargs):
+        """
+        This class executes a campaign in rounds and stops repeating a (tool, mode) cell as soon as
+        its measurements converge: when the relative width of the bootstrap confidence interval
+        of the median of every chosen metric drops below the target. Every cell gets at least
+        min_repetitions runs, and at most the number of repetitions of the campaign.
+        Stable cells take less time, noisy cells get more runs.
+
+        Args:
+            :metrics: (list) - The names of the metrics which have to converge, see result_statistics.METRICS.
+            :target_ci_width: (float) - The target relative width of the confidence intervals, e.g. 0.1.
+            :min_repetitions: (int) - The number of runs of every cell before its convergence is checked.
+            :time_budget: (float) - Optional time in seconds after which no further round is started.
+            The remaining arguments are described in RunScheduler, repetitions is the maximum number of runs of a cell.
+        """
+        super().__init__(*args, **kwargs)
+        self.metrics = metrics
+        self.target_ci_width = target_ci_width
+        self.min_repetitions = min(min_repetitions, self.repetitions)
+        self.time_budget = time_budget
+        self.values = {}
+
+    def resume(self):
+        """
+        Restores the seed, the completed runs and their metric values from the checkpoint file.
+        """
+        super().resume()
+        checkpoint = load_checkpoint(self.checkpoint_filename)
+        if checkpoint:
+            self.values = checkpoint.get("values", {})
+
+    def checkpoint(self):
+        """
+        Returns the current campaign state, including the metric values of the completed runs.
+        """
+        return {**super().checkpoint(), "values": self.values}
+
+    def record_run(self, job, stats):
+        """
+        Records a completed run and the values of the chosen metrics.
+
+        Args:
+            :job: (dict) - The completed run.
+            :stats: (dict) - Resource usage statistics of the run.
+        """
+        super().record_run(job, stats)
+        cell = ResultMetrics([get_result_record(stats)])
+        values = self.values.setdefault(get_cell_id(job["script"], job["headless_mode"]), {})
+        for metric in self.metrics:
+            values.setdefault(metric, []).append(float(METRICS[metric](cell)[0]))
+
+    def completed_repetitions(self, script, headless_mode):
+        """
+        Returns the number of completed runs of the cell.
+
+        Args:
+            :script: (str) - The name of the test script.
+            :headless_mode: (bool) - The headless mode of the cell.
+        """
+        prefix = f"{get_cell_id(script, headless_mode)}:"
+        return sum(job_id.startswith(prefix) for job_id in self.completed)
+
+    def get_ci_widths(self, script, headless_mode):
+        """
+        Returns the relative widths of the confidence intervals of the chosen metrics of the cell.
+
+        Args:
+            :script: (str) - The name of the test script.
+            :headless_mode: (bool) - The headless mode of the cell.
+        """
+        values = self.values.get(get_cell_id(script, headless_mode), {})
+        widths = {}
+        for metric in self.metrics:
+            metric_values = finite(np.array(values.get(metric, []), dtype=np.float64))
+            widths[metric] = relative_ci_width(*bootstrap_median_ci(metric_values)) if len(metric_values) > 1 else math.inf
+        return widths
+
+    def is_converged(self, script, headless_mode):
+        """
+        Returns whether the cell has enough runs and all its confidence intervals are narrower than the target.
+
+        Args:
+            :script: (str) - The name of the test script.
+            :headless_mode: (bool) - The headless mode of the cell.
+        """
+        return (
+            self.completed_repetitions(script, headless_mode) >= self.min_repetitions
+            and all(width <= self.target_ci_width for width in self.get_ci_widths(script, headless_mode).values())
+        )
+
+    def pending_jobs(self):
+        """
+        Returns the runs of the next round in a randomized order: the missing runs up to min_repetitions,
+        and one more run of every cell which has not converged yet and has not used up its repetitions.
+        """
+        jobs = []
+        for script in self.scripts:
+            for headless_mode in self.headless_modes:
+                done = self.completed_repetitions(script, headless_mode)
+                if done >= self.repetitions or self.is_converged(script, headless_mode):
+                    continue
+                count = min(max(self.min_repetitions - done, 1), self.repetitions - done)
+                jobs += [create_job(script, headless_mode, done + offset) for offset in range(1, count + 1)]
+        random.Random(self.seed + len(self.completed)).shuffle(jobs)
+        return jobs
+
+    def print_convergence(self):
+        """
+        Displays the number of runs and the widest confidence interval of every cell.
+        """
+        for script in self.scripts:
+            for headless_mode in self.headless_modes:
+                metric, width = max(self.get_ci_widths(script, headless_mode).items(), key=lambda item: item[1])
+                done = self.completed_repetitions(script, headless_mode)
+                if self.is_converged(script, headless_mode):
+                    state = "converged"
+                else:
+                    state = "maximum repetitions reached" if done >= self.repetitions else "not converged"
+                print(
+                    f"  {get_cell_id(script, headless_mode)}: {done} runs, "
+                    f"widest relative CI {width:.1%} ({metric}), {state}"
+                )
+
+    def execute(self, executor, jobs, cpu_slots):
+        """
+        Executes rounds of runs until every cell has converged or used up its repetitions,
+        or the time budget is exhausted.
+
+        Args:
+            :executor: (ThreadPoolExecutor) - The executor of the runs.
+            :jobs: (list) - The runs of the first round.
+            :cpu_slots: (queue.Queue) - The queue of free CPU slots.
+        """
+        start_time = time.perf_counter()
+        round_number = 1
+        while jobs:
+            completed = len(self.completed)
+            print(f"Round {round_number}: {len(jobs)} runs")
+            super().execute(executor, jobs, cpu_slots)
+            self.print_convergence()
+            if len(self.completed) == completed:
+                print("No run of the round has completed, stopping the campaign.")
+                break
+            if self.time_budget is not None and time.perf_counter() - start_time >= self.time_budget:
+                print("Time budget exhausted, stopping the campaign.")
+                break
+            jobs = self.pending_jobs()
+            round_number += 1
+
+
+def parse_arguments():
+    """
+    Parses the command line arguments of the run scheduler.
+    """
+    parser = argparse.ArgumentParser(description="Runs a measurement campaign of all testing scripts.")
+    parser.add_argument("--repetitions", type=positive_int, default=SCHEDULER_REPETITIONS,
+                        help=f"number of runs of every (tool, mode) cell (default: {SCHEDULER_REPETITIONS})")
+    parser.add_argument("--concurrency", type=positive_int, default=1, help="number of runs executed at the same time")
+    parser.add_argument("--seed", type=int, help="seed of the randomized order of runs")
+    parser.add_argument("--sampling-interval", type=float, default=SAMPLING_INTERVAL,
+                        help=f"time between two consecutive resource samples in seconds (default: {SAMPLING_INTERVAL})")
+    parser.add_argument("--no-cpu-pinning", action="store_true", help="do not pin runs to disjoint CPU slots")
+    parser.add_argument("--warm-pool", action="store_true",
+                        help="run scripts in pre-started interpreters with the frameworks already imported")
+    parser.add_argument("--resume", action="store_true", help="resume an interrupted campaign from the checkpoint")
+    parser.add_argument("--checkpoint", default=SCHEDULER_CHECKPOINT_FILE, help="path of the checkpoint file")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="stop repeating a cell when its measurements converge, --repetitions is then the maximum")
+    parser.add_argument("--min-repetitions", type=positive_int, default=ADAPTIVE_MIN_REPETITIONS,
+                        help=f"runs of every cell before its convergence is checked (default: {ADAPTIVE_MIN_REPETITIONS})")
+    parser.add_argument("--target-ci-width", type=positive_float, default=TARGET_RELATIVE_CI_WIDTH,
+                        help=f"target relative width of the confidence intervals (default: {TARGET_RELATIVE_CI_WIDTH})")
+    parser.add_argument("--metrics", nargs="+", choices=list(METRICS), default=ADAPTIVE_METRICS,
+                        help=f"metrics which have to converge (default: {' '.join(ADAPTIVE_METRICS)})")
+    parser.add_argument("--time-budget", type=positive_float, help="time in seconds after which no further round is started")
+    add_timeout_arguments(parser)
+    add_script_arguments(parser)
+    arguments = parser.parse_args()
+    validate_sampling_interval(parser, arguments)
+    return arguments
+
+
+if __name__ == "__main__":
+    arguments = parse_arguments()
+    if not os.path.exists(PERFORMANCE_LOGS_DIRECTORY):
+        os.makedirs(PERFORMANCE_LOGS_DIRECTORY)
+
+    scheduler_arguments = (
+        SCRIPTS_FILENAMES, [True, False], arguments.repetitions, arguments.concurrency, arguments.seed,
+        arguments.sampling_interval, not arguments.no_cpu_pinning, arguments.checkpoint, arguments.warm_pool,
+        get_script_arguments(arguments), arguments.run_timeout, arguments.test_case_timeout,
+    )
+    if arguments.adaptive:
+        scheduler = AdaptiveRunScheduler(
+            *scheduler_arguments, metrics=arguments.metrics, target_ci_width=arguments.target_ci_width,
+            min_repetitions=arguments.min_repetitions, time_budget=arguments.time_budget,
+        )
+    else:
+        scheduler = RunScheduler(*scheduler_arguments)
+    if arguments.resume:
+        scheduler.resume()
+    else:
+        checkpoint = load_checkpoint(arguments.checkpoint)
+        if checkpoint is not None:
+            print(
+                f"WARNING: discarding the checkpoint {arguments.checkpoint} with {len(checkpoint['completed'])} "
+                f"completed runs, use --resume to continue the previous campaign instead\n"
+            )
+    scheduler.run()
@@ -0,0 +1,103 @@
+from test_settings import *
+import subprocess
+import threading
+import shutil
+import signal
+import time
+
+
+class RunWatchdog(threading.Thread):
+    def __init__(self, process, isolation, output_capture, start_time, run_timeout=RUN_TIMEOUT,
+                 test_case_timeout=TEST_CASE_TIMEOUT, stack_dump_filename=None):
+        """
+        This class enforces the timeouts of a single run on a dedicated thread. A run expires
+        when it takes longer than the run timeout, or when the script prints nothing for longer
+        than the test case timeout (every test case reports its result, so a silent script is
+        stuck in a test case). On expiry, the script is asked to dump the stacks of all its threads
+        and to take a final screenshot, its stacks are also dumped with py-spy if it is installed,
+        and after a grace period the whole process tree is killed. The samples collected
+        until then are kept, and the run is marked as timed out.
+
+        Args:
+            :process: (subprocess.Popen) - The test script process.
+            :isolation: (RunIsolation) - The isolation of the run, used to kill the whole tree.
+            :output_capture: (OutputCapture) - The capture of the script output, which records the time of the last line.
+            :start_time: (float) - The time.perf_counter() value at which the script was started.
+            :run_timeout: (float) - Maximum duration of the run in seconds, 0 disables it.
+            :test_case_timeout: (float) - Maximum time without any output in seconds, 0 disables it.
+            :stack_dump_filename: (str) - Optional path of the file for the py-spy stack dump.
+        """
+        super().__init__(daemon=True)
+        self.process = process
+        self.isolation = isolation
+        self.output_capture = output_capture
+        self.start_time = start_time
+        self.run_timeout = run_timeout
+        self.test_case_timeout = test_case_timeout
+        self.stack_dump_filename = stack_dump_filename
+        self.stop_event = threading.Event()
+        self.timeout_reason = ""
+
+    def get_timeout_reason(self):
+        """
+        Returns the reason why the run has expired, or an empty string if it has not.
+        """
+        current_time = time.perf_counter()
+        if self.run_timeout and current_time - self.start_time > self.run_timeout:
+            return f"run exceeded {self.run_timeout} s"
+        last_output_time = max(self.output_capture.last_output_time, self.start_time)
+        if self.test_case_timeout and current_time - last_output_time > self.test_case_timeout:
+            return f"no progress for {self.test_case_timeout} s"
+        return ""
+
+    def run(self):
+        """
+        Checks the timeouts until the watchdog is stopped or the run expires.
+        """
+        while not self.stop_event.wait(WATCHDOG_CHECK_INTERVAL):
+            if self.process.poll() is not None:
+                return
+            self.timeout_reason = self.get_timeout_reason()
+            if self.timeout_reason:
+                self.expire()
+                return
+
+    def expire(self):
+        """
+        Captures the state of the expired script and kills its process tree.
+        """
+        if hasattr(signal, WATCHDOG_SIGNAL):
+            try:
+                self.process.send_signal(getattr(signal, WATCHDOG_SIGNAL))
+            except ProcessLookupError:
+                pass
+        self.dump_stacks()
+        deadline = time.perf_counter() + WATCHDOG_GRACE_PERIOD
+        while self.process.poll() is None and time.perf_counter() < deadline and not self.stop_event.wait(0.1):
+            pass
+        self.isolation.kill()
+
+    def dump_stacks(self):
+        """
+        Saves the Python stacks of the script dumped by py-spy, if it is installed.
+        """
+        py_spy = shutil.which("py-spy")
+        if not py_spy or not self.stack_dump_filename:
+            return
+        try:
+            result = subprocess.run(
+                [py_spy, "dump", "--pid", str(self.process.pid)],
+                capture_output=True, text=True, timeout=WATCHDOG_GRACE_PERIOD,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return
+        with open(self.stack_dump_filename, "w", encoding="utf-8") as dump_file:
+            dump_file.write(result.stdout + result.stderr)
+
+    def stop(self):
+        """
+        Stops the watchdog after the script has exited.
+        """
+        self.stop_event.set()
+        if self.is_alive():
+            self.join()
@@ -0,0 +1,79 @@
+from test_settings import *
+import json
+import time
+import os
+
+
+class SampleWriter:
+    def __init__(self, filename, fsync_interval=SAMPLE_FSYNC_INTERVAL):
+        """
+        This class streams resource samples to a file as they are taken, one JSON line
+        per sample. Every line is flushed to the operating system at once and the file
+        is synced to disk periodically, so a long run keeps a constant amount of samples
+        in memory, and the samples taken before a crash are not lost.
+
+        Args:
+            :filename: (str) - The path of the samples file.
+            :fsync_interval: (float) - Minimum time between two syncs of the file to disk, in seconds.
+        """
+        directory = os.path.dirname(filename)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.filename = filename
+        self.fsync_interval = fsync_interval
+        self.file = open(filename, "w", encoding="utf-8")
+        self.last_fsync_time = time.perf_counter()
+        self.count = 0
+
+    def write(self, sample):
+        """
+        Writes a single sample and syncs the file if the fsync interval has passed.
+
+        Args:
+            :sample: (dict) - Names and values of the sample.
+        """
+        self.file.write(json.dumps(sample, separators=(",", ":")) + "\n")
+        self.file.flush()
+        self.count += 1
+        if time.perf_counter() - self.last_fsync_time >= self.fsync_interval:
+            self.sync()
+
+    def sync(self):
+        """
+        Forces the written samples to disk.
+        """
+        os.fsync(self.file.fileno())
+        self.last_fsync_time = time.perf_counter()
+
+    def close(self):
+        """
+        Syncs and closes the file.
+        """
+        if self.file.closed:
+            return
+        self.file.flush()
+        self.sync()
+        self.file.close()
+
+
+def read_samples(filename, keys):
+    """
+    Reads a samples file back as one list of values per name. A partial last line,
+    left by an interrupted run, is skipped. Values missing from a sample, such as the gauges
+    of the final sample taken after the process tree has exited, are skipped too.
+
+    Args:
+        :filename: (str) - The path of the samples file.
+        :keys: (list) - The names of the values to read.
+    """
+    samples = {key: [] for key in keys}
+    with open(filename, encoding="utf-8") as samples_file:
+        for line in samples_file:
+            try:
+                sample = json.loads(line)
+            except ValueError:
+                continue
+            for key in keys:
+                if key in sample:
+                    samples[key].append(sample[key])
+    return samples
@@ -0,0 +1,130 @@
+from test_settings import *
+from datetime import datetime as dt
+import threading
+import base64
+import queue
+import json
+import time
+import os
+
+SCREENSHOT_EXTENSIONS = {
+    SCREENSHOT_MODE_PNG: "png",
+    SCREENSHOT_MODE_JPEG: "jpeg",
+    SCREENSHOT_MODE_WEBP: "webp",
+    SCREENSHOT_MODE_MEMORY: "png",
+}
+
+
+class ScreenshotPipeline:
+    def __init__(self, directory, mode=SCREENSHOT_MODE_PNG, quality=SCREENSHOT_QUALITY,
+                 workers=SCREENSHOT_WRITER_WORKERS, queue_size=SCREENSHOT_QUEUE_SIZE):
+        """
+        This class captures screenshots on the test thread and hands the raw data
+        to a bounded pool of background writers, which decode and save them.
+        The time spent on capturing and on writing is measured separately,
+        so the screenshot cost can be reported apart from the test cases.
+
+        Args:
+            :directory: (str) - The directory in which screenshots are saved.
+            :mode: (str) - One of SCREENSHOT_MODES: off, png, jpeg, webp or memory (captured but not saved).
+            :quality: (int) - The quality of JPEG and WebP screenshots, from 0 to 100.
+            :workers: (int) - The number of background writer threads.
+            :queue_size: (int) - The maximum number of screenshots waiting for a writer.
+        """
+        if mode not in SCREENSHOT_MODES:
+            raise ValueError(f"Unknown screenshot mode: {mode}, expected one of {SCREENSHOT_MODES}.")
+        self.directory = directory
+        self.mode = mode
+        self.quality = quality
+        self.screenshot_id = 1
+        self.in_memory = []
+        self.stats_lock = threading.Lock()
+        self.stats = {"count": 0, "bytes": 0, "capture_time_ns": 0, "write_time_ns": 0, "write_errors": 0}
+
+        if mode in (SCREENSHOT_MODE_OFF, SCREENSHOT_MODE_MEMORY):
+            self.queue = None
+            self.writers = []
+            return
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.writers = [threading.Thread(target=self.write_screenshots, daemon=True) for _ in range(workers)]
+        for writer in self.writers:
+            writer.start()
+
+    @property
+    def image_format(self):
+        """
+        Returns the image format requested from the browser.
+        """
+        return SCREENSHOT_EXTENSIONS.get(self.mode)
+
+    def capture(self, test_name, capture_function):
+        """
+        Captures a screenshot with the given function and queues it for writing.
+        If all writers are busy and the queue is full, the call waits for a free place.
+
+        Args:
+            :test_name: (str) - The name of the test case, used in the filename.
+            :capture_function: (callable) - Function called with the image format and quality,
+                returning the image as bytes or as a base64 encoded string.
+        """
+        if self.mode == SCREENSHOT_MODE_OFF:
+            return
+
+        start_time = time.perf_counter_ns()
+        data = capture_function(self.image_format, self.quality)
+        capture_time_ns = time.perf_counter_ns() - start_time
+
+        datetime = dt.now().strftime("%Y%m%d-%H%M%S")
+        file_path = f"{self.directory}/{self.screenshot_id:02d}_{test_name}_{datetime}.{self.image_format}"
+        self.screenshot_id += 1
+
+        with self.stats_lock:
+            self.stats["count"] += 1
+            self.stats["capture_time_ns"] += capture_time_ns
+        if self.queue is None:
+            self.in_memory.append(data)
+            with self.stats_lock:
+                self.stats["bytes"] += len(data) * 3 // 4 if isinstance(data, str) else len(data)
+        else:
+            self.queue.put((file_path, data))
+
+    def write_screenshots(self):
+        """
+        The loop of a background writer: decodes queued screenshots and saves them to files.
+        A screenshot which cannot be decoded or written is counted as a write error, and the writer
+        goes on with the next one, so the test thread never waits for a writer which has stopped.
+        """
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.queue.task_done()
+                return
+            file_path, data = item
+            start_time = time.perf_counter_ns()
+            try:
+                if isinstance(data, str):
+                    data = base64.b64decode(data)
+                with open(file_path, "wb") as file:
+                    file.write(data)
+                with self.stats_lock:
+                    self.stats["bytes"] += len(data)
+                    self.stats["write_time_ns"] += time.perf_counter_ns() - start_time
+            except (OSError, ValueError):
+                with self.stats_lock:
+                    self.stats["write_errors"] += 1
+            finally:
+                self.queue.task_done()
+
+    def close(self):
+        """
+        Waits until all queued screenshots are written, stops the writers
+        and returns the screenshot statistics record.
+        """
+        if self.queue is not None:
+            for _ in self.writers:
+                self.queue.put(None)
+            for writer in self.writers:
+                writer.join()
+        return f"{SCREENSHOT_STATS_PREFIX} " + json.dumps({"mode": self.mode, **self.stats})
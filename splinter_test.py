@@ -1,480 +1,261 @@
-import os
-import sys
-import inspect
 from test_settings import *
-from datetime import datetime as dt
+from testing_scenario import TestingScenario
+from browser_session import get_debugger_address, parse_script_arguments
 from splinter import Browser
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 
 
-class SplinterTestingApp:
-    def __init__(self, headless_mode):
+class SplinterTestingApp(TestingScenario):
+    framework = SPLINTER
+    logs_directory = LOGS_SPLINTER_DIRECTORY
+    screenshots_directory = SCREENSHOTS_SPLINTER_DIRECTORY
+
+    def launch_browser(self, headless_mode, browser_endpoint):
         """
-        This method sets up the Splinter testing application by creating
-        the necessary directory for storing screenshots, initializing
-        a Chrome WebDriver, and navigating to the specified testing 
-        application URL. It also sets the window size for the WebDriver.
+        Initializes a Splinter Chrome browser, attached to the browser running at the endpoint
+        if one is given, and sets the window size.
 
         Args:
-            :headless_mode: (str) - Specifies whether the script should run in headless mode.
+            :headless_mode: (bool) - Specifies whether the browser should run in headless mode.
+            :browser_endpoint: (str) - Optional remote debugging endpoint of an already running Chrome.
         """
-        if not os.path.exists(SCREENSHOTS_SPLINTER_DIRECTORY):
-            os.makedirs(SCREENSHOTS_SPLINTER_DIRECTORY)
-        self.screenshot_id = 1
-
-        if not os.path.exists(LOGS_SPLINTER_DIRECTORY):
-            os.makedirs(LOGS_SPLINTER_DIRECTORY)
-        current_datetime = dt.now().strftime('%Y%m%d-%H%M%S')
-        log_filename = f"{LOGS_SPLINTER_DIRECTORY}/splinter_test_data_{current_datetime}.txt"
-        self.log_file = open(log_filename, "w", encoding="utf-8")
-
-        if headless_mode == "True":
-            headless_mode = True
+        if browser_endpoint:
+            chrome_options = Options()
+            chrome_options.add_experimental_option("debuggerAddress", get_debugger_address(browser_endpoint))
+            self.browser = Browser("chrome", options=chrome_options)
         else:
-            headless_mode = False
-
-        self.browser = Browser("chrome", headless=headless_mode)
-        self.browser.visit(TESTING_APP_URL)
+            self.browser = Browser("chrome", headless=headless_mode)
         self.browser.driver.set_window_size(WINDOW_WIDTH, WINDOW_HEIGHT)
 
-    def log(self, message):
+    def quit_browser(self):
         """
-        Prints given message to console and log file.
-
-        Args:
-            :message: (str) - A message to display.
+        Quits the browser, or only stops the ChromeDriver service if the browser was attached
+        through its endpoint, so the shared browser keeps running.
         """
-        timestamp = dt.now().strftime("[%Y-%m-%d %H:%M:%S]")
-        log_message = f"{timestamp} {message}"
-        print(log_message)
-        self.log_file.write(f"{log_message}\n")
-
-    def run_all_test_cases(self):
-        """
-        Executes all test case methods whose names start with 'test_case_'.
-        """
-        test_cases = [
-            method_name
-            for method_name, _ in inspect.getmembers(self, predicate=inspect.ismethod)
-            if method_name.startswith('test_case_')
-        ]
-
-        for test_case in test_cases:
-            method = getattr(self, test_case)
-            try:
-                method()
-            except AssertionError as e:
-                self.log(f"{test_case.replace('_', ' ').replace('test', 'Test')}: FAILED! {str(e)}")
-
-        self.log_file.close()
+        if self.browser_endpoint:
+            self.browser.driver.service.stop()
+        else:
+            self.browser.quit()
 
-    def take_screenshot(self):
+    def reset_page(self):
         """
-        The method is used to capture a screenshot and save it to a file.
+        Deletes the cookies and visits the testing application again.
         """
-        method_stacks = inspect.stack()
-        test_name = method_stacks[1].function
-        datetime = dt.now().strftime("%Y%m%d-%H%M%S")
-        file_path = f"{SCREENSHOTS_SPLINTER_DIRECTORY}/{self.screenshot_id:02d}_{test_name}_{datetime}.png"
-        self.browser.driver.save_screenshot(file_path)
-        self.screenshot_id += 1
+        self.browser.cookies.delete_all()
+        self.browser.visit(self.app_url)
 
-    def value_of_css_property(self, style, property):
+    def capture_screenshot(self, image_format, quality):
         """
-        Extracts the value of a specified CSS property from a given style string.
+        PNG screenshots use the WebDriver command, JPEG and WebP screenshots are encoded by Chrome through CDP.
 
         Args:
-            :style: (str) - A string containing CSS styles.
-            :property: (str) - The CSS property whose value needs to be extracted.
+            :image_format: (str) - The image format: png, jpeg or webp.
+            :quality: (int) - The quality of JPEG and WebP screenshots.
         """
-        return style.split(property)[1].split(';')[0].strip()
+        if image_format == SCREENSHOT_MODE_PNG:
+            return self.browser.driver.get_screenshot_as_base64()
+        return self.browser.driver.execute_cdp_cmd(
+            "Page.captureScreenshot", {"format": image_format, "quality": quality}
+        )["data"]
 
-    def test_case_01(self):
+    def get_title(self):
         """
-        Assert the title of the testing web application.
+        Returns the title of the current page.
         """
-        actual_title = self.browser.title
-        assert PAGE_TITLE == actual_title, \
-            f"Expected title: {PAGE_TITLE}, Actual title: {actual_title}."
-
-        self.log("Test case 01: PASSED")
+        return self.browser.title
 
-    def test_case_02(self):
+    def reload(self):
         """
-        Assert the presence of the main table on the page.
+        Reloads the current page.
         """
-        main_table = self.browser.find_by_id(TABLE_ID)
-        assert main_table.visible, \
-            "Main table is not displayed."
-
-        self.log("Test case 02: PASSED")
+        self.browser.reload()
 
-    def test_case_03(self):
+    def wait_for_visible(self, selector, timeout):
         """
-        Assert the content of the header.
-        """
-        header = self.browser.find_by_tag(HEADER_TAG)
-        actual_header_text = header.text
-        assert HEADER_TEXT == actual_header_text, \
-            f"Expected header: {HEADER_TEXT}, Actual header: {actual_header_text}."
-
-        self.log("Test case 03: PASSED")
+        Waits until the element matching the CSS selector is visible, raising TimeoutException
+        after the timeout like the Selenium adapter.
 
-    def test_case_04(self):
-        """
-        Assert the dropdown functionality: display and hide.
+        Args:
+            :selector: (str) - The CSS selector of the element.
+            :timeout: (float) - Maximum time to wait, in seconds.
         """
-        dropdown_button = self.browser.find_by_id(HOVER_DROPDOWN_LIST_ID)
-        dropdown_content = self.browser.find_by_css(f".{HOVER_DROPDOWN_LIST_CONTENT_CLASS}")
-
-        dropdown_button.mouse_over()
-        self.take_screenshot()
-        assert dropdown_content.visible, \
-            "Dropdown content is not displayed after hovering."
+        if not self.browser.is_element_visible_by_css(selector, wait_time=timeout):
+            raise TimeoutException(f"Element {selector} is not visible after {timeout} s.")
 
-        main_table = self.browser.find_by_id(TABLE_ID)
-        main_table.mouse_over()
-        self.take_screenshot()
-        assert not dropdown_content.visible, \
-            "Dropdown content is still displayed after moving away."
-
-        self.log("Test case 04: PASSED")
-
-    def test_case_05(self):
-        """
-        Assert that selecting options from the dropdown list changes the default text.
+    def wait_natively(self, check, timeout):
         """
-        dropdown_button = self.browser.find_by_id(HOVER_DROPDOWN_LIST_ID)
-        dropdown_option_1 = self.browser.find_by_id(HOVER_DROPROWN_OPTION_1_ID)
-        dropdown_option_2 = self.browser.find_by_id(HOVER_DROPROWN_OPTION_2_ID)
-        dropdown_option_3 = self.browser.find_by_id(HOVER_DROPROWN_OPTION_3_ID)
-
-        default_text_element = self.browser.find_by_tag(TEXT_AT_TOP_TAG)
-        initial_default_text = default_text_element.text
-
-        dropdown_button.mouse_over()
-        dropdown_option_1.click()
-        actual_text = default_text_element.text
-        self.take_screenshot()
-        assert actual_text == TEXT_1, \
-            f"Default text not changed after selecting option 1, Actual text: {actual_text}."
-
-        dropdown_button.mouse_over()
-        dropdown_option_2.click()
-        actual_text = default_text_element.text
-        self.take_screenshot()
-        assert actual_text == TEXT_2, \
-            f"Default text not changed after selecting option 2, Actual text: {actual_text}."
+        Repeats the check with WebDriverWait, which polls every half a second.
 
-        dropdown_button.mouse_over()
-        dropdown_option_3.click()
-        actual_text = default_text_element.text
-        self.take_screenshot()
-        assert actual_text == TEXT_3, \
-            f"Default text not changed after selecting option 3, Actual text: {actual_text}."
-
-        dropdown_button.click()
-        self.take_screenshot()
-        assert default_text_element.text == initial_default_text, \
-            "Default text not reset after closing dropdown."
-
-        self.log("Test case 05: PASSED")
-
-    def test_case_06(self):
-        """
-        Assert that entering text in text fields sets the correct values.
+        Args:
+            :check: (callable) - Function which reads the state and returns whether it is the expected one.
+            :timeout: (float) - Maximum time to wait, in seconds.
         """
-        single_line_textbox = self.browser.find_by_id(SINGLE_LINE_TEXTBOX_ID)
-        expected_single_line_text = AUTHOR_NAME
-        single_line_textbox.type(expected_single_line_text)
-        actual_single_line_text = single_line_textbox.value
-        self.take_screenshot()
-        assert actual_single_line_text == expected_single_line_text, \
-            f"Incorrect value in single-line textbox, Actual text: {actual_single_line_text}."
-
-        multi_line_textbox = self.browser.find_by_id(MULTI_LINE_TEXTBOX_ID)
-        expected_multi_line_text = f"{AUTHOR_NAME}\n{AUTHOR_NAME}"
-        multi_line_textbox.type(expected_multi_line_text)
-        actual_multi_line_text = multi_line_textbox.value
-        self.take_screenshot()
-        assert actual_multi_line_text == expected_multi_line_text, \
-            f"Incorrect value in multi-line textbox, Actual text: {actual_multi_line_text}."
-
-        self.log("Test case 06: PASSED")
+        try:
+            return WebDriverWait(self.browser.driver, timeout).until(lambda driver: check())
+        except TimeoutException:
+            return False
 
-    def test_case_07(self):
-        """
-        Assert the text in the placeholder of the textbox.
+    def locate(self, selector):
         """
-        placeholder_textbox = self.browser.find_by_id(PLACEHOLDER_TEXTBOX_ID)
-        actual_placeholder_text = placeholder_textbox[PLACEHOLDER]
-
-        assert actual_placeholder_text == EXPECTED_PLACEHOLDER_TEXT, \
-            (f"Placeholder text is not equal to expected text, "
-             f"Expected: {EXPECTED_PLACEHOLDER_TEXT}, Actual: {actual_placeholder_text}.")
+        Returns the Splinter element of the first element matching the CSS selector.
 
-        self.log("Test case 07: PASSED")
-
-    def test_case_08(self):
-        """
-        Assert that clicking the button changes text and colour in button, text field, and paragraph.
+        Args:
+            :selector: (str) - The CSS selector of the element.
         """
-        button_changing_colour = self.browser.find_by_id(BUTTON_CHANGING_COLOUR_ID)
-        read_only_textbox = self.browser.find_by_id(READ_ONLY_TEXTBOX_ID)
-        paragraph = self.browser.find_by_id(PARAGRAPH_ID)
+        return self.browser.find_by_css(selector).first
 
-        initial_button_colour = self.value_of_css_property(button_changing_colour[STYLE], COLOR)
-        initial_read_only_textbox_text = read_only_textbox.value
-        initial_read_only_textbox_colour = self.value_of_css_property(read_only_textbox[STYLE], COLOR)
-        initial_paragraph_text = paragraph.text
-        initial_paragraph_colour = paragraph[COLOR]
-
-        button_changing_colour.click()
-        self.take_screenshot()
-
-        current_button_colour = self.value_of_css_property(button_changing_colour[STYLE], COLOR)
-        assert current_button_colour != initial_button_colour, \
-            "Button colour not changed after clicking."
-
-        assert read_only_textbox.value != initial_read_only_textbox_text, \
-            "Read only text value not changed after clicking."
-
-        current_read_only_textbox_colour = self.value_of_css_property(read_only_textbox[STYLE], COLOR)
-        assert current_read_only_textbox_colour != initial_read_only_textbox_colour, \
-            "Read only colour value not changed after clicking."
-
-        assert paragraph.text != initial_paragraph_text, \
-            "Paragraph text not changed after clicking."
-
-        afrer_change_paragraph_colour = self.value_of_css_property(paragraph[STYLE], COLOR)
-        assert afrer_change_paragraph_colour != initial_paragraph_colour, \
-            "Paragraph colour not changed after clicking."
-
-        self.log("Test case 08: PASSED")
-
-    def test_case_09(self):
-        """
-        Assert that the read-only text field is not editable.
+    def is_stale_error(self, exception):
         """
-        read_only_text_field = self.browser.find_by_id(READ_ONLY_TEXTBOX_ID)
-        try:
-            read_only_text_field.clear()
-            read_only_text_field.type(AUTHOR_NAME)
-        except:
-            pass
-        assert read_only_text_field.value != AUTHOR_NAME, \
-            "Read-only text field is editable."
-
-        self.log("Test case 09: PASSED")
+        Returns whether the exception is a StaleElementReferenceException of the underlying WebElement.
 
-    def test_case_10(self):
-        """
-        Assert that the pre-filled textbox retains its value after editing other textboxes.
+        Args:
+            :exception: (Exception) - The exception raised by a driver method.
         """
-        pre_filled_textbox = self.browser.find_by_id(PREFILLED_TEXTBOX_ID)
-        other_textbox = self.browser.find_by_id(SINGLE_LINE_TEXTBOX_ID)
-
-        initial_pre_filled_value = pre_filled_textbox.value
-        other_textbox.clear()
-        other_textbox.type(AUTHOR_NAME)
-        self.take_screenshot()
-        assert pre_filled_textbox.value == initial_pre_filled_value, \
-            "Pre-filled textbox value changed after editing another textbox."
+        return isinstance(exception, StaleElementReferenceException)
 
-        self.log("Test case 10: PASSED")
-
-    def test_case_11(self):
-        """
-        Assert that clicking the radio button selects it.
+    def click(self, element):
         """
-        radio_button_1 = self.browser.find_by_id(RADIO_BUTTON_1_ID)
-        radio_button_2 = self.browser.find_by_id(RADIO_BUTTON_2_ID)
-        initial_state_radio_button_2 = radio_button_2.checked
-
-        radio_button_1.click()
-        assert not initial_state_radio_button_2, \
-            "Radio button 2 is not deselected by default."
-        assert radio_button_1.checked, \
-            "Radio button 1 is not selected after clicking."
-        assert not radio_button_2.checked, \
-            "Radio button 2 is selected after clicking on radio button 1."
-
-        radio_button_2.click()
-        self.take_screenshot()
-        assert not radio_button_1.checked, \
-            "Radio button 1 is still selected after clicking on radio button 2."
-        assert radio_button_2.checked, \
-            "Radio button 2 is not selected after clicking."
-
-        self.log("Test case 11: PASSED")
+        Clicks the centre of the element.
 
-    def test_case_12(self):
-        """
-        Assert that the predefined checkbox is initially checked.
+        Args:
+            :element: (object) - The element handle returned by find.
         """
-        predefined_checkbox = self.browser.find_by_id(CHECKBOX_0_ID)
-        assert predefined_checkbox.checked, \
-            "Predefined checkbox is not checked by default."
-
-        self.log("Test case 12: PASSED")
+        element.click()
 
-    def test_case_13(self):
+    def hover(self, element):
         """
-        Assert that clicking the checkbox sets it as checked.
-        """
-        example_checkbox = self.browser.find_by_id(CHECKBOX_2_ID)
-        initial_state_checkbox = example_checkbox.checked
-
-        example_checkbox.click()
-        self.take_screenshot()
-        assert not initial_state_checkbox, \
-            "Example checkbox is not deselected by default."
-        assert example_checkbox.checked, \
-            "Example checkbox is not checked after clicking."
-
-        self.log("Test case 13: PASSED")
+        Moves the mouse over the centre of the element.
 
-    def test_case_14(self):
-        """
-        Assert that the checkbox is unchecked after clicking it twice.
+        Args:
+            :element: (object) - The element handle returned by find.
         """
-        example_checkbox = self.browser.find_by_id(CHECKBOX_1_ID)
-        initial_state_checkbox = example_checkbox.checked
-
-        example_checkbox.click()
-        self.take_screenshot()
-        assert example_checkbox.checked != initial_state_checkbox, \
-            "Checkbox state not changed after the first click."
-
-        example_checkbox.click()
-        self.take_screenshot()
-        assert example_checkbox.checked == initial_state_checkbox, \
-            "Checkbox state not changed back after the second click."
+        element.mouse_over()
 
-        self.log("Test case 14: PASSED")
-
-    def test_case_15(self):
+    def move_mouse_away(self):
         """
-        Assert that clicking multiple checkboxes simultaneously checks them.
+        Moves the mouse to the top left corner of the page with a W3C pointer action.
         """
-        checkbox_1 = self.browser.find_by_id(CHECKBOX_1_ID)
-        checkbox_2 = self.browser.find_by_id(CHECKBOX_2_ID)
-        checkbox_3 = self.browser.find_by_id(CHECKBOX_3_ID)
-        initial_state_checkbox_1 = checkbox_1.checked
-        initial_state_checkbox_2 = checkbox_2.checked
-        initial_state_checkbox_3 = checkbox_3.checked
-
-        checkbox_1.click()
-        checkbox_2.click()
-        checkbox_3.click()
-        self.take_screenshot()
-        assert checkbox_1.checked != initial_state_checkbox_1, \
-            "Checkbox 1 state not changed after simultaneous clicking."
-        assert checkbox_2.checked != initial_state_checkbox_2, \
-            "Checkbox 2 state not changed after simultaneous clicking."
-        assert checkbox_3.checked != initial_state_checkbox_3, \
-            "Checkbox 3 state not changed after simultaneous clicking."
-
-        self.log("Test case 15: PASSED")
+        actions = ActionChains(self.browser.driver)
+        actions.w3c_actions.pointer_action.move_to_location(0, 0)
+        actions.perform()
 
-    def test_case_16(self):
+    def type_text(self, element, text):
         """
-        Assert that moving the slider changes the progress bar.
-        """
-        slider = self.browser.find_by_id(SLIDER_ID)
-        progress_bar = self.browser.find_by_id(PROGRESS_BAR_ID)
-
-        initial_slider_value = slider[VALUE]
-        initial_progress_bar_value = progress_bar[VALUE]
-        assert initial_slider_value == initial_progress_bar_value, \
-            (f"Slider value not equal to progress bar value, "
-             f"Slider: {initial_slider_value}, Progress bar: {initial_progress_bar_value}.")
-
-        self.browser.execute_script("arguments[0].value = arguments[1]", slider._element, int(initial_slider_value) + 10)
-        self.browser.execute_script("arguments[0].oninput()", slider._element)
-        self.take_screenshot()
-        assert progress_bar[VALUE] != initial_progress_bar_value, \
-            "Progress bar value not changed after moving the slider."
+        Clears the text field and types the given text key by key.
 
-        self.log("Test case 16: PASSED")
-
-    def test_case_17(self):
+        Args:
+            :element: (object) - The element handle returned by find.
+            :text: (str) - The text to type.
         """
-        Assert that the progress bar value is updated when the slider is clicked.
+        element.clear()
+        element.type(text)
+
+    def drag(self, element, x_offset):
         """
-        slider = self.browser.find_by_id(SLIDER_ID)
-        progress_bar = self.browser.find_by_id(PROGRESS_BAR_ID)
-        initial_progress_bar_value = progress_bar[VALUE]
+        Drags the element horizontally by the given offset with a Selenium action chain
+        on the underlying WebElement.
 
-        slider.click()
-        self.take_screenshot()
-        progress_bar_value = progress_bar[VALUE]
-        assert progress_bar_value != initial_progress_bar_value, \
-            ("Progress bar value not changed after clicking the slider, "
-             f"Current value: {progress_bar_value}, Initial value: {initial_progress_bar_value}.")
+        Args:
+            :element: (object) - The element handle returned by find.
+            :x_offset: (int) - The horizontal offset in pixels.
+        """
+        ActionChains(self.browser.driver).move_to_element(element._element).click_and_hold() \
+            .move_by_offset(x_offset, 0).release().perform()
 
-        self.log("Test case 17: PASSED")
+    def select_option(self, element, value):
+        """
+        Selects the option with the given value in the select element.
 
-    def test_case_18(self):
+        Args:
+            :element: (object) - The element handle returned by find.
+            :value: (str) - The value of the option.
         """
-        Assert that selecting an option in the select dropdown list changes the percentage indicator.
+        element.select(value)
+
+    def is_visible(self, element):
         """
-        select_dropdown_list = self.browser.find_by_id(SELECT_DROPDOWN_LIST_ID)
-        meter_bar = self.browser.find_by_id(PERCENTAGE_INDICATOR_BAR_ID)
-        meter_label = self.browser.find_by_id(PERCENTAGE_INDICATOR_LABEL_ID)
-        select_options = select_dropdown_list.find_by_tag(PERCENTAGE_INDICATOR_OPTION_TAG)
+        Returns whether the element is visible.
 
-        initial_meter_bar_value = meter_bar[VALUE]
-        initial_meter_label_text = meter_label.text
+        Args:
+            :element: (object) - The element handle returned by find.
+        """
+        return element.visible
 
-        select_options[1].click()
-        self.take_screenshot()
-        assert meter_bar[VALUE] != initial_meter_bar_value, \
-            "Meter bar value not changed after selecting an option."
-        assert meter_label.text != initial_meter_label_text, \
-            "Meter label text not changed after selecting an option."
+    def is_checked(self, element):
+        """
+        Returns whether the checkbox or radio button is checked.
 
-        self.log("Test case 18: PASSED")
+        Args:
+            :element: (object) - The element handle returned by find.
+        """
+        return element.checked
 
-    def test_case_19(self):
+    def get_text(self, element):
         """
-        Assert that the percentage indicator value is not updated after clicking on the indicator.
+        Returns the rendered text of the element.
+
+        Args:
+            :element: (object) - The element handle returned by find.
         """
-        meter_bar = self.browser.find_by_id(PERCENTAGE_INDICATOR_BAR_ID)
-        meter_label = self.browser.find_by_id(PERCENTAGE_INDICATOR_LABEL_ID)
+        return element.text
 
-        initial_meter_bar_value = meter_bar[VALUE]
-        initial_meter_label_text = meter_label.text
+    def get_value(self, element):
+        """
+        Returns the current value property of the underlying WebElement as a string.
 
-        meter_bar.click()
-        self.take_screenshot()
-        assert meter_bar[VALUE] == initial_meter_bar_value, \
-            "Meter bar value not changed after clicking on the meter."
-        assert meter_label.text == initial_meter_label_text, \
-            "Meter label text not changed after clicking on the meter."
+        Args:
+            :element: (object) - The element handle returned by find.
+        """
+        return str(element._element.get_property(VALUE))
 
-        self.log("Test case 19: PASSED")
+    def get_attribute(self, element, name):
+        """
+        Returns the value of the HTML attribute of the element. Splinter's element[name] prefers
+        the DOM property, like Selenium's get_attribute, so the attribute is read with get_dom_attribute
+        of the underlying WebElement to match the Selenium adapter. This relies on Splinter's private
+        _element, as do get_value, get_css_property and drag.
 
-    def test_case_20(self):
+        Args:
+            :element: (object) - The element handle returned by find.
+            :name: (str) - The name of the attribute.
         """
-        Assert that refreshing the page displays the testing web application.
+        return element._element.get_dom_attribute(name)
+
+    def get_css_property(self, element, name):
         """
-        self.browser.reload()
+        Returns the computed value of the CSS property of the underlying WebElement.
 
-        self.browser.is_element_present_by_id(TABLE_ID, wait_time=10)
-        main_table_after_refresh = self.browser.find_by_id(TABLE_ID)
+        Args:
+            :element: (object) - The element handle returned by find.
+            :name: (str) - The name of the CSS property.
+        """
+        return element._element.value_of_css_property(name)
 
-        self.take_screenshot()
-        assert main_table_after_refresh.visible, \
-            "Main table is not displayed after refreshing the page."
+    def evaluate(self, script, argument):
+        """
+        Executes the JavaScript function in the page with execute_script and returns its result.
 
-        self.log("Test case 20: PASSED")
+        Args:
+            :script: (str) - The source of a function with one parameter, e.g. "(argument) => ...".
+            :argument: (object) - A JSON-serializable value passed to the function.
+        """
+        return self.browser.driver.execute_script(f"return ({script})(arguments[0]);", argument)
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        headless_mode = sys.argv[1]
-    else:
-        headless_mode = "True"
-
-    app = SplinterTestingApp(headless_mode)
-    app.run_all_test_cases()
+    arguments = parse_script_arguments()
+
+    app = SplinterTestingApp(
+        arguments.headless_mode, arguments.browser_endpoint, arguments.profile_test_cases,
+        arguments.screenshots, arguments.screenshot_quality, arguments.app_url, arguments.batched_reads,
+        arguments.element_cache, arguments.wait_strategy, arguments.wait_interval, arguments.wait_timeout,
+    )
+    app.run_repetitions(arguments.repetitions)
+    if arguments.dom_benchmark:
+        app.run_dom_benchmark(arguments.dom_benchmark)
+    if arguments.wait_benchmark:
+        app.run_wait_benchmark(arguments.wait_benchmark)
+    app.close()
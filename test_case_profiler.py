@@ -0,0 +1,73 @@
+from test_settings import *
+from resource_sampler import ProcessTreeSampler
+from contextlib import contextmanager
+import threading
+import json
+import time
+import os
+
+
+class TestCaseProfiler:
+    def __init__(self, emit, enabled=True):
+        """
+        This class measures every test case with a high-resolution timer and attributes
+        resource usage to it, as the difference of the counters of the script process
+        tree (the script itself, the driver and the browser processes) read before
+        and after the test case. Test cases may be profiled from several threads at once,
+        then the measurements of overlapping test cases include each other's usage.
+        Every measurement is emitted as a single JSON record,
+        which the performance analyser reads from the script output.
+
+        Args:
+            :emit: (callable) - Function which writes the record, usually the log method of the testing app.
+            :enabled: (bool) - Specifies whether test cases are profiled. When disabled,
+                test cases are executed without any additional work.
+        """
+        self.emit = emit
+        self.enabled = enabled
+        self.repetition = 1
+        self.sampler = ProcessTreeSampler(os.getpid()) if enabled else None
+        self.sampler_lock = threading.Lock()
+
+    @contextmanager
+    def profile(self, test_case):
+        """
+        Measures the code executed inside the context as the given test case.
+        Assertion errors are recorded as a failed test case and raised again.
+
+        Args:
+            :test_case: (str) - The name of the test case method.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        with self.sampler_lock:
+            before = self.sampler.sample()
+        status = "PASSED"
+        start_time = time.perf_counter_ns()
+        try:
+            yield
+        except AssertionError:
+            status = "FAILED"
+            raise
+        except Exception:
+            status = "ERROR"
+            raise
+        finally:
+            duration_ns = time.perf_counter_ns() - start_time
+            with self.sampler_lock:
+                after = self.sampler.sample()
+            self.emit(f"{TEST_CASE_PROFILE_PREFIX} " + json.dumps({
+                "repetition": self.repetition,
+                "test_case": int(test_case.rsplit("_", 1)[-1]),
+                "status": status,
+                "duration_ns": duration_ns,
+                "cpu_time": round(after["cpu_time"] - before["cpu_time"], 4),
+                "rss_delta_bytes": after["rss_bytes"] - before["rss_bytes"],
+                "uss_delta_bytes": after["uss_bytes"] - before["uss_bytes"],
+                "context_switches": after["context_switches"] - before["context_switches"],
+                "io_read_bytes": after["io_read_bytes"] - before["io_read_bytes"],
+                "io_write_bytes": after["io_write_bytes"] - before["io_write_bytes"],
+                "processes": after["processes"],
+            }))
@@ -1,14 +1,41 @@
 import os
 
+ADAPTIVE_METRICS = ["duration_time", "cpu_usage", "rss_size"]
+ADAPTIVE_MIN_REPETITIONS = 5
 ALL_RESULTS_DIRECTORY = "all_results"
+ASYNC_PLAYWRIGHT = "asyncplaywright"
 AUTHOR_NAME = "Piotr Pasławski"
+BASELINE_DURATION = 3.0
+BASELINE_INTERVAL = 0.25
+BOOTSTRAP_RESAMPLES = 10000
 BUTTON_CHANGING_COLOUR_ID = "Button"
+CGROUP_PREFIX = "tests-performance-run"
 CHECKBOX_0_ID = "checkBox0"
 CHECKBOX_1_ID = "checkBox1"
 CHECKBOX_2_ID = "checkBox2"
 CHECKBOX_3_ID = "checkBox3"
+CHECKED = "checked"
 COLOR = "color"
+CONCURRENT_PAGES = 4
+CONCURRENT_TEST_CASES = [1, 2, 3, 7, 12]
+CONFIDENCE_LEVEL = 0.95
+DOM_BENCHMARK_ITERATIONS = 10
+DOM_BENCHMARK_PREFIX = "DOM benchmark:"
+DOM_IFRAME_ROWS = 100
+DOM_SIZE_VARIANTS = {
+    "base": {"rows": 0, "nested_blocks": 0, "nesting_depth": 0, "shadow_hosts": 0, "iframes": 0},
+    "rows-1k": {"rows": 1000, "nested_blocks": 0, "nesting_depth": 0, "shadow_hosts": 0, "iframes": 0},
+    "rows-10k": {"rows": 10000, "nested_blocks": 0, "nesting_depth": 0, "shadow_hosts": 0, "iframes": 0},
+    "rows-50k": {"rows": 50000, "nested_blocks": 0, "nesting_depth": 0, "shadow_hosts": 0, "iframes": 0},
+    "nested": {"rows": 0, "nested_blocks": 200, "nesting_depth": 100, "shadow_hosts": 0, "iframes": 0},
+    "shadow": {"rows": 0, "nested_blocks": 0, "nesting_depth": 0, "shadow_hosts": 2000, "iframes": 0},
+    "iframes": {"rows": 0, "nested_blocks": 0, "nesting_depth": 0, "shadow_hosts": 0, "iframes": 50},
+    "mixed": {"rows": 10000, "nested_blocks": 50, "nesting_depth": 100, "shadow_hosts": 500, "iframes": 10},
+}
+DOM_TABLE_COLUMNS = 5
+ELEMENT_CACHE_PREFIX = "Element cache:"
 EXPECTED_PLACEHOLDER_TEXT = "Hint..."
+GENERATED_APPS_DIRECTORY = "generated_apps"
 HEADER_TAG = "h1"
 HEADER_TEXT = "Sample page for automated tests"
 HEADLESS = "headless"
@@ -17,15 +44,40 @@ HOVER_DROPDOWN_LIST_ID = "Dropdown"
 HOVER_DROPROWN_OPTION_1_ID = "dropOption1"
 HOVER_DROPROWN_OPTION_2_ID = "dropOption2"
 HOVER_DROPROWN_OPTION_3_ID = "dropOption3"
+IDLE_CHECK_INTERVAL = 0.5
+IDLE_CPU_THRESHOLD = 10.0
+IDLE_IO_THRESHOLD = 1024 * 1024
+IDLE_PROCESS_COUNT_THRESHOLD = 2
+IDLE_SETTLE_CHECKS = 3
+IDLE_TIMEOUT = 30
+INGEST_CACHE_DIRECTORY = "performance_logs/ingest_cache"
+INGEST_MANIFEST_FILE = "manifest.json"
+INGEST_SETTLE_TIME = 1.0
+KILL_GRACE_PERIOD = 3
 LINK_ID = "Link"
 LINUX = "Linux"
+LOGS_ASYNC_PLAYWRIGHT_DIRECTORY = "logs/asyncplaywright"
 LOGS_PLAYWRIGHT_DIRECTORY = "logs/playwright"
 LOGS_SELENIUM_DIRECTORY = "logs/selenium"
 LOGS_SPLINTER_DIRECTORY = "logs/splinter"
 MACOS = "Darwin"
+MAX_SAMPLING_INTERVAL = 1.0
+MIN_SAMPLING_INTERVAL = 0.01
 MULTI_LINE_TEXTBOX_ID = "Textarea"
+NETWORK_PROFILE_DEFAULT = "loopback"
+NETWORK_PROFILES = {
+    "loopback": {"latency": 0, "bandwidth": 0, "compression": False, "cache_max_age": 0, "keep_alive": True},
+    "broadband": {"latency": 0.02, "bandwidth": 5 * 1024 * 1024, "compression": True, "cache_max_age": 3600, "keep_alive": True},
+    "3g": {"latency": 0.15, "bandwidth": 200 * 1024, "compression": True, "cache_max_age": 3600, "keep_alive": True},
+    "slow-uncached": {"latency": 0.3, "bandwidth": 50 * 1024, "compression": False, "cache_max_age": 0, "keep_alive": False},
+}
 NOHEADLESS = "noheadless"
 OPTION_50_PERCENT = "50%"
+OUTPUT_DRAIN_TIMEOUT = 5
+OUTPUT_LOGS_DIRECTORY = "performance_logs/output"
+OUTPUT_LOG_BACKUP_COUNT = 5
+OUTPUT_LOG_MAX_BYTES = 1024 * 1024
+PAGE_LOAD_TIMEOUT = 10
 PAGE_TITLE = "Sample page for automated tests"
 PARAGRAPH_ID = "pText"
 PERCENTAGE_INDICATOR_BAR_ID = "meterBar"
@@ -36,31 +88,98 @@ PLACEHOLDER = "placeholder"
 PLACEHOLDER_TEXTBOX_ID = "placeholderText"
 PLAYWRIGHT = "playwright"
 PREFILLED_TEXTBOX_ID = "TextInput2"
+PROCESS_LOGS_DIRECTORY = "performance_logs/processes"
 PROGRESS_BAR_ID = "progressBar"
 RADIO_BUTTON_1_ID = "radioButton1"
 RADIO_BUTTON_2_ID = "radioButton2"
 READ_ONLY_TEXTBOX_ID = "readOnlyText"
+RENDER_FORMATS = ["png"]
+RENDER_MANIFEST_FILE = "render_manifest.json"
+RESULT_STORE_DIRECTORY = "performance_logs/result_store"
+RESULT_STORE_INDEX_FILE = "index.jsonl"
+RUN_TIMEOUT = 900
+SAMPLE_BUFFER_SIZE = 60
+SAMPLE_FSYNC_INTERVAL = 5.0
+SAMPLE_LOGS_DIRECTORY = "performance_logs/samples"
+SAMPLING_INTERVAL = 1.0
+SCHEDULER_CHECKPOINT_FILE = "performance_logs/scheduler_checkpoint.json"
+SCHEDULER_REPETITIONS = 50
+SCREENSHOT_MODE_JPEG = "jpeg"
+SCREENSHOT_MODE_MEMORY = "memory"
+SCREENSHOT_MODE_OFF = "off"
+SCREENSHOT_MODE_PNG = "png"
+SCREENSHOT_MODE_WEBP = "webp"
+SCREENSHOT_MODES = [SCREENSHOT_MODE_OFF, SCREENSHOT_MODE_PNG, SCREENSHOT_MODE_JPEG, SCREENSHOT_MODE_WEBP, SCREENSHOT_MODE_MEMORY]
+SCREENSHOT_QUALITY = 80
+SCREENSHOT_QUEUE_SIZE = 8
+SCREENSHOT_STATS_PREFIX = "Screenshot stats:"
+SCREENSHOT_WRITER_WORKERS = 2
+SCREENSHOTS_ASYNC_PLAYWRIGHT_DIRECTORY = "screenshots/asyncplaywright"
 SCREENSHOTS_PLAYWRIGHT_DIRECTORY = "screenshots/playwright"
 SCREENSHOTS_SELENIUM_DIRECTORY = "screenshots/selenium"
 SCREENSHOTS_SPLINTER_DIRECTORY = "screenshots/splinter"
-SCRIPTS_FILENAMES = ["selenium_test.py", "playwright_test.py", "splinter_test.py"]
+SCRIPTS_FILENAMES = ["selenium_test.py", "playwright_test.py", "splinter_test.py", "asyncplaywright_test.py"]
 SELECT_DROPDOWN_LIST_ID = "Select"
 SELECT_DROPDOWN_OPTIONS_XPATH = "//select[@id = 'Select']//option"
 SELENIUM = "selenium"
+SERVER_HOST = "127.0.0.1"
+SERVER_KEEP_ALIVE_TIMEOUT = 5
+SERVER_PORT = 8000
+SERVER_THROTTLE_INTERVAL = 0.01
+SHARED_BROWSER_PORT = 9222
+SHARED_BROWSER_START_TIMEOUT = 30
+SIGNIFICANCE_LEVEL = 0.05
 SINGLE_LINE_TEXTBOX_ID = "TextInput"
+SLIDER_DRAG_OFFSET = 50
 SLIDER_ID = "Slider"
 SPLINTER = "splinter"
+STATE_READS_PREFIX = "State reads:"
+STRAY_PROCESS_MARKERS = ["--enable-automation", "--remote-debugging", "--test-type=webdriver"]
+STRAY_PROCESS_NAMES = ["chrome", "chromium", "chromedriver", "headless_shell"]
 STYLE = "style"
 TABLE_ID = "Table"
+TARGET_RELATIVE_CI_WIDTH = 0.1
+TESTING_APP_DIRECTORY = os.path.abspath("./testing_app")
 TESTING_APP_URL = "file://" + os.path.abspath("./testing_app/index.html")
+TEST_CASE_LOGS_DIRECTORY = "performance_logs/test_cases"
+TEST_CASE_PROFILE_PREFIX = "Test case profile:"
+TEST_CASE_TIMEOUT = 120
+TEXT = "text"
 TEXTBOX_WITH_HINT_ID = "placeholderText"
 TEXTBOX_WITH_HINT_TEXT = "Hint..."
 TEXT_1 = "Text 1"
 TEXT_2 = "Text 2"
 TEXT_3 = "Text 3"
 TEXT_AT_TOP_TAG = "h3"
+THROUGHPUT_PREFIX = "Throughput:"
 VALUE = "value"
 VISIBLE = "visible"
+WAIT_AUTO_INTERVALS = [0.1, 0.25, 0.5, 1.0]
+WAIT_BACKOFF_FACTOR = 2
+WAIT_BACKOFF_MAX_INTERVAL = 0.5
+WAIT_BENCHMARK_ATTRIBUTE = "data-wait-benchmark"
+WAIT_BENCHMARK_DELAY = 0.1
+WAIT_BENCHMARK_INTERVALS = [0.005, 0.02, 0.05, 0.1]
+WAIT_BENCHMARK_LOGS_DIRECTORY = "performance_logs/wait_benchmark"
+WAIT_BENCHMARK_PREFIX = "Wait benchmark:"
+WAIT_INTERVAL = 0.05
+WAIT_OBSERVER_FALLBACK_INTERVAL = 0.1
+WAIT_STATS_PREFIX = "Waits:"
+WAIT_STRATEGY_AUTO = "auto"
+WAIT_STRATEGY_BACKOFF = "backoff"
+WAIT_STRATEGY_NONE = "none"
+WAIT_STRATEGY_OBSERVER = "observer"
+WAIT_STRATEGY_POLL = "poll"
+WAIT_STRATEGIES = [WAIT_STRATEGY_NONE, WAIT_STRATEGY_POLL, WAIT_STRATEGY_BACKOFF, WAIT_STRATEGY_OBSERVER, WAIT_STRATEGY_AUTO]
+WAIT_STRATEGY_DEFAULT = WAIT_STRATEGY_POLL
+WAIT_TIMEOUT = 5
+WARM_WORKER_ARGUMENT = "--warm-worker"
+WARM_WORKER_READY_MESSAGE = "WARM_INTERPRETER_READY"
+WATCH_INTERVAL = 5.0
+WATCHDOG_CHECK_INTERVAL = 0.5
+WATCHDOG_GRACE_PERIOD = 5
+WATCHDOG_SCREENSHOT_PREFIX = "Watchdog screenshot:"
+WATCHDOG_SIGNAL = "SIGUSR1"
 WINDOWS = "Windows"
 WINDOW_HEIGHT = 1080
 WINDOW_WIDTH = 1440
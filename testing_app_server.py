@@ -0,0 +1,224 @@
+from test_settings import *
+from email.utils import formatdate
+from urllib.parse import unquote, urlsplit
+import mimetypes
+import threading
+import argparse
+import asyncio
+import gzip
+import os
+
+HTTP_REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+COMPRESSIBLE_TYPES = ["text/", "application/javascript", "application/json", "image/svg+xml"]
+
+
+class TestingAppServer:
+    def __init__(self, network_profile=NETWORK_PROFILE_DEFAULT, directory=TESTING_APP_DIRECTORY,
+                 host=SERVER_HOST, port=0):
+        """
+        This class serves the testing application over HTTP on the loopback interface, so the
+        testing frameworks load it like a real web application instead of a file:// page.
+        The server runs an asyncio event loop on a background thread of the analyser and shapes
+        its responses according to a network profile: the latency added to every new connection
+        and every response, the bandwidth to which responses are throttled, gzip compression,
+        the caching headers (max-age with ETag revalidation, or no-store) and HTTP keep-alive.
+
+        Args:
+            :network_profile: (str) - The name of one of NETWORK_PROFILES.
+            :directory: (str) - The directory with the files of the testing application.
+            :host: (str) - The loopback address on which the server listens.
+            :port: (int) - The port on which the server listens, 0 selects a free port.
+        """
+        self.network_profile = network_profile
+        self.profile = NETWORK_PROFILES[network_profile]
+        self.directory = os.path.realpath(directory)
+        self.host = host
+        self.port = port
+        self.loop = None
+        self.thread = None
+        self.server = None
+        self.stats = {"connections": 0, "requests": 0, "not_modified": 0, "bytes_sent": 0}
+
+    @property
+    def url(self):
+        """
+        The URL of the testing application served by the server.
+        """
+        return f"http://{self.host}:{self.port}/index.html"
+
+    def start(self):
+        """
+        Starts listening and serving requests on the background thread, and returns the server.
+        """
+        self.loop = asyncio.new_event_loop()
+        self.server = self.loop.run_until_complete(asyncio.start_server(self.handle_connection, self.host, self.port))
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops the server, closing the connections which are still kept alive.
+        """
+        asyncio.run_coroutine_threadsafe(self.shutdown(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+    async def shutdown(self):
+        """
+        Closes the listening socket and cancels the handlers of the open connections.
+        """
+        self.server.close()
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serves the requests of a single connection, until the client closes it, the keep-alive timeout
+        expires, or after the first response if keep-alive is disabled.
+
+        Args:
+            :reader: (asyncio.StreamReader) - The stream of the requests.
+            :writer: (asyncio.StreamWriter) - The stream of the responses.
+        """
+        self.stats["connections"] += 1
+        try:
+            await asyncio.sleep(self.profile["latency"])
+            while True:
+                request_line = await asyncio.wait_for(reader.readline(), SERVER_KEEP_ALIVE_TIMEOUT)
+                if not request_line.strip():
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                parts = request_line.decode("latin-1").split()
+                keep_alive = (
+                    self.profile["keep_alive"] and len(parts) == 3 and parts[2] == "HTTP/1.1"
+                    and headers.get("connection", "").lower() != "close"
+                )
+                if len(parts) == 3:
+                    status, response_headers, body = self.get_response(parts[0], parts[1], headers)
+                else:
+                    status, response_headers, body = 400, {}, b""
+                await self.send_response(writer, status, response_headers, body, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.CancelledError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def get_response(self, method, path, headers):
+        """
+        Returns the status, headers and body of the response to a request for a file of the testing application.
+
+        Args:
+            :method: (str) - The HTTP method of the request.
+            :path: (str) - The requested path.
+            :headers: (dict) - The request headers with lowercase names.
+        """
+        self.stats["requests"] += 1
+        if method not in ["GET", "HEAD"]:
+            return 405, {"Allow": "GET, HEAD"}, b""
+        path = unquote(urlsplit(path).path)
+        if path.endswith("/"):
+            path += "index.html"
+        file_path = os.path.realpath(os.path.join(self.directory, path.lstrip("/")))
+        if not file_path.startswith(self.directory + os.sep) or not os.path.isfile(file_path):
+            return 404, {"Content-Type": "text/plain"}, b"" if method == "HEAD" else b"Not Found"
+
+        file_stat = os.stat(file_path)
+        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        response_headers = {"Content-Type": content_type}
+        if self.profile["cache_max_age"]:
+            etag = f'"{file_stat.st_mtime_ns:x}-{file_stat.st_size:x}"'
+            response_headers["Cache-Control"] = f"public, max-age={self.profile['cache_max_age']}"
+            response_headers["ETag"] = etag
+            response_headers["Last-Modified"] = formatdate(file_stat.st_mtime, usegmt=True)
+            if headers.get("if-none-match") == etag:
+                self.stats["not_modified"] += 1
+                return 304, response_headers, b""
+        else:
+            response_headers["Cache-Control"] = "no-store"
+
+        with open(file_path, "rb") as file:
+            body = file.read()
+        if (
+            self.profile["compression"] and "gzip" in headers.get("accept-encoding", "")
+            and any(content_type.startswith(compressible_type) for compressible_type in COMPRESSIBLE_TYPES)
+        ):
+            body = gzip.compress(body)
+            response_headers["Content-Encoding"] = "gzip"
+            response_headers["Vary"] = "Accept-Encoding"
+        response_headers["Content-Length"] = str(len(body))
+        return 200, response_headers, b"" if method == "HEAD" else body
+
+    async def send_response(self, writer, status, headers, body, keep_alive):
+        """
+        Sends a response after the latency of the profile, throttled to the bandwidth of the profile.
+
+        Args:
+            :writer: (asyncio.StreamWriter) - The stream of the responses.
+            :status: (int) - The HTTP status code.
+            :headers: (dict) - The response headers.
+            :body: (bytes) - The response body.
+            :keep_alive: (bool) - Specifies whether the connection is kept open after the response.
+        """
+        headers.setdefault("Content-Length", str(len(body)))
+        headers["Connection"] = "keep-alive" if keep_alive else "close"
+        if keep_alive:
+            headers["Keep-Alive"] = f"timeout={SERVER_KEEP_ALIVE_TIMEOUT}"
+        head = f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in headers.items()) + "\r\n"
+        data = head.encode("latin-1") + body
+
+        await asyncio.sleep(self.profile["latency"])
+        bandwidth = self.profile["bandwidth"]
+        if not bandwidth:
+            writer.write(data)
+            await writer.drain()
+            self.stats["bytes_sent"] += len(data)
+        else:
+            chunk_size = max(int(bandwidth * SERVER_THROTTLE_INTERVAL), 1)
+            for offset in range(0, len(data), chunk_size):
+                chunk = data[offset:offset + chunk_size]
+                writer.write(chunk)
+                await writer.drain()
+                self.stats["bytes_sent"] += len(chunk)
+                await asyncio.sleep(len(chunk) / bandwidth)
+
+    def get_summary(self):
+        """
+        Returns a line describing the profile and the traffic served by the server.
+        """
+        return (
+            f"Network profile {self.network_profile}: {self.stats['connections']} connections, "
+            f"{self.stats['requests']} requests ({self.stats['not_modified']} not modified), "
+            f"{self.stats['bytes_sent']} bytes sent"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serves the testing application over HTTP with a network profile.")
+    parser.add_argument("--network-profile", choices=list(NETWORK_PROFILES), default=NETWORK_PROFILE_DEFAULT,
+                        help=f"latency, bandwidth, compression, caching and keep-alive profile (default: {NETWORK_PROFILE_DEFAULT})")
+    parser.add_argument("--port", type=int, default=SERVER_PORT, help=f"port of the server (default: {SERVER_PORT})")
+    arguments = parser.parse_args()
+
+    server = TestingAppServer(arguments.network_profile, port=arguments.port).start()
+    print(f"Testing application is served at {server.url}")
+    print("Press Ctrl+C to stop the server.")
+    try:
+        server.thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+        print(server.get_summary())
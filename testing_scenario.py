@@ -0,0 +1,1008 @@
+import os
+import sys
+import time
+import json
+import base64
+import signal
+import inspect
+import threading
+import statistics
+import faulthandler
+from test_settings import *
+from test_case_profiler import TestCaseProfiler
+from screenshot_pipeline import ScreenshotPipeline
+from wait_strategy import all_changed, create_wait_strategy
+from datetime import datetime as dt
+
+ELEMENT_METHODS = [
+    "click", "hover", "type_text", "drag", "select_option", "is_visible", "is_checked",
+    "get_text", "get_value", "get_attribute", "get_css_property",
+]
+
+READ_STATES_SCRIPT = """(properties) => {
+    const states = {};
+    for (const [selector, names] of Object.entries(properties)) {
+        const element = document.querySelector(selector);
+        states[selector] = {};
+        for (const name of names) {
+            if (name === "text") {
+                states[selector][name] = element.innerText.trim();
+            } else if (name === "value") {
+                states[selector][name] = String(element.value);
+            } else if (name === "checked") {
+                states[selector][name] = element.checked;
+            } else {
+                states[selector][name] = getComputedStyle(element).getPropertyValue(name);
+            }
+        }
+    }
+    return states;
+}"""
+
+SET_ATTRIBUTE_LATER_SCRIPT = """(change) => {
+    setTimeout(() => document.body.setAttribute(change.name, change.value), change.delay);
+}"""
+
+
+class TestingScenario:
+    framework = None
+    logs_directory = None
+    screenshots_directory = None
+
+    def __init__(self, headless_mode, browser_endpoint=None, profile_test_cases=False,
+                 screenshot_mode=SCREENSHOT_MODE_PNG, screenshot_quality=SCREENSHOT_QUALITY, app_url=None,
+                 batched_reads=False, element_cache=False, wait_strategy=WAIT_STRATEGY_DEFAULT,
+                 wait_interval=WAIT_INTERVAL, wait_timeout=WAIT_TIMEOUT):
+        """
+        This class holds the single definition of all test cases of the testing application.
+        Every step is expressed through a small set of driver methods (find, click, hover,
+        type_text, get_value, ...), which each testing framework implements in its own adapter
+        subclass, so all frameworks execute exactly the same steps and a new backend only
+        needs a new adapter.
+
+        Args:
+            :headless_mode: (str) - Specifies whether the script should run in headless mode.
+            :browser_endpoint: (str) - Optional remote debugging endpoint of an already running Chrome,
+                to which the adapter attaches instead of launching a new browser.
+            :profile_test_cases: (bool) - Specifies whether every test case is timed and its resource usage is reported.
+            :screenshot_mode: (str) - One of SCREENSHOT_MODES, specifies how screenshots are captured and saved.
+            :screenshot_quality: (int) - The quality of JPEG and WebP screenshots.
+            :app_url: (str) - Optional URL of the testing application, e.g. served by testing_app_server.py,
+                TESTING_APP_URL (the file:// page) by default.
+            :batched_reads: (bool) - Specifies whether the states of groups of elements are read
+                in a single script round-trip instead of one driver call per property.
+            :element_cache: (bool) - Specifies whether the element handles returned by find are cached
+                per page and reused until the page is reloaded.
+            :wait_strategy: (str) - One of WAIT_STRATEGIES, specifies how the test cases wait
+                for the state of the page to change after an action.
+            :wait_interval: (float) - The polling interval, or the first interval of the backoff, in seconds.
+            :wait_timeout: (float) - Maximum time to wait for a single state change, in seconds.
+        """
+        self.app_url = app_url or TESTING_APP_URL
+        self.batched_reads = batched_reads
+        self.state_read_calls = 0
+        self.element_cache_enabled = element_cache
+        self.element_cache = {}
+        self.cached_elements = {}
+        self.element_cache_stats = {"lookups": 0, "hits": 0, "stale": 0, "invalidations": 0}
+        self.element_cache_lock = threading.Lock()
+        if element_cache:
+            for name in ELEMENT_METHODS:
+                setattr(self, name, self.recover_stale_elements(getattr(self, name)))
+        self.waits = create_wait_strategy(wait_strategy, self, wait_interval, wait_timeout)
+        self.run_time = 0
+        self.screenshots = ScreenshotPipeline(self.screenshots_directory, screenshot_mode, screenshot_quality)
+
+        if not os.path.exists(self.logs_directory):
+            os.makedirs(self.logs_directory)
+        current_datetime = dt.now().strftime('%Y%m%d-%H%M%S')
+        log_filename = f"{self.logs_directory}/{self.framework}_test_data_{current_datetime}.txt"
+        self.log_file = open(log_filename, "w", encoding="utf-8")
+        self.profiler = TestCaseProfiler(self.log, profile_test_cases)
+
+        self.watchdog_expired = False
+        self.final_screenshot_taken = False
+        if hasattr(signal, WATCHDOG_SIGNAL):
+            signal.signal(getattr(signal, WATCHDOG_SIGNAL), self.handle_watchdog_signal)
+            faulthandler.register(getattr(signal, WATCHDOG_SIGNAL), all_threads=True, chain=True)
+
+        self.browser_endpoint = browser_endpoint
+        launch_start_time = time.perf_counter()
+        self.launch_browser(headless_mode == "True", browser_endpoint)
+        self.log(f"Browser launch time: {time.perf_counter() - launch_start_time:.3f} s")
+
+    def log(self, message):
+        """
+        Prints given message to console and log file.
+
+        Args:
+            :message: (str) - A message to display.
+        """
+        timestamp = dt.now().strftime("[%Y-%m-%d %H:%M:%S]")
+        log_message = f"{timestamp} {message}"
+        print(log_message)
+        self.log_file.write(f"{log_message}\n")
+        self.log_file.flush()
+
+    def handle_watchdog_signal(self, signum, frame):
+        """
+        Called when the watchdog of the performance analyser has expired, after the stacks of all
+        threads have been dumped to the standard error. The handler may interrupt a driver call
+        (sync Playwright) or a write to the standard output or the log file, none of which can be
+        reentered, so it only marks the run as expired. The expiry is logged and the final screenshot is taken
+        after the current test case, if it returns before the kill.
+
+        Args:
+            :signum: (int) - The number of the received signal.
+            :frame: (frame) - The frame interrupted by the signal.
+        """
+        self.watchdog_expired = True
+
+    def take_final_screenshot(self):
+        """
+        Saves a screenshot of the page after the watchdog has expired, which is not possible
+        if the browser itself does not respond.
+        """
+        self.final_screenshot_taken = True
+        self.log("Watchdog expired, taking the final screenshot.")
+        try:
+            data = self.capture_screenshot(SCREENSHOT_MODE_PNG, self.screenshots.quality)
+            if not os.path.exists(self.screenshots_directory):
+                os.makedirs(self.screenshots_directory)
+            file_path = f"{self.screenshots_directory}/timeout_{dt.now().strftime('%Y%m%d-%H%M%S')}.png"
+            with open(file_path, "wb") as file:
+                file.write(base64.b64decode(data) if isinstance(data, str) else data)
+            self.log(f"{WATCHDOG_SCREENSHOT_PREFIX} {file_path}")
+        except Exception as e:
+            self.log(f"Final screenshot failed: {e}")
+
+    def get_test_cases(self):
+        """
+        Returns the names of all test case methods, i.e. the ones whose names start with 'test_case_'.
+        """
+        return [
+            method_name
+            for method_name, _ in inspect.getmembers(self, predicate=inspect.ismethod)
+            if method_name.startswith('test_case_')
+        ]
+
+    def run_test_case(self, test_case):
+        """
+        Executes a single test case method and logs its failure. After the watchdog has expired,
+        the final screenshot is taken as soon as the test case returns.
+
+        Args:
+            :test_case: (str) - The name of the test case method.
+        """
+        method = getattr(self, test_case)
+        try:
+            with self.profiler.profile(test_case):
+                method()
+        except AssertionError as e:
+            self.log(f"{test_case.replace('_', ' ').replace('test', 'Test')}: FAILED! {str(e)}")
+        finally:
+            if self.watchdog_expired and not self.final_screenshot_taken:
+                self.take_final_screenshot()
+
+    def run_all_test_cases(self):
+        """
+        Executes all test case methods whose names start with 'test_case_'.
+        """
+        for test_case in self.get_test_cases():
+            self.run_test_case(test_case)
+
+    def run_repetitions(self, repetitions):
+        """
+        Executes all test cases the given number of times in the same browser,
+        with a clean page for every repetition, and logs the duration of each repetition.
+
+        Args:
+            :repetitions: (int) - The number of repetitions of all test cases.
+        """
+        for repetition in range(1, repetitions + 1):
+            repetition_start_time = time.perf_counter()
+            self.profiler.repetition = repetition
+            self.invalidate_element_cache()
+            self.reset_page()
+            self.run_all_test_cases()
+            repetition_time = time.perf_counter() - repetition_start_time
+            self.run_time += repetition_time
+            self.log(f"Repetition {repetition}: {repetition_time:.3f} s")
+
+    def run_dom_benchmark(self, iterations):
+        """
+        Measures the operations whose cost grows with the size of the DOM: looking up an element
+        and checking that it is visible, reading the text of the header and of the whole page,
+        and capturing a screenshot. Every operation is repeated the given number of times
+        and the median durations in milliseconds are logged as a single JSON record.
+
+        Args:
+            :iterations: (int) - The number of repetitions of every operation.
+        """
+        operations = {
+            "lookup": lambda: self.is_visible(self.locate(f"#{SLIDER_ID}")),
+            "header_text": lambda: self.get_text(self.locate(HEADER_TAG)),
+            "page_text": lambda: self.get_text(self.locate("body")),
+            "screenshot": lambda: self.capture_screenshot(SCREENSHOT_MODE_PNG, self.screenshots.quality),
+        }
+        record = {"iterations": iterations}
+        for name, operation in operations.items():
+            durations = []
+            for _ in range(iterations):
+                start_time = time.perf_counter_ns()
+                operation()
+                durations.append((time.perf_counter_ns() - start_time) / 1e6)
+            record[name] = round(statistics.median(durations), 3)
+        self.log(f"{DOM_BENCHMARK_PREFIX} " + json.dumps(record))
+
+    def run_wait_benchmark(self, iterations):
+        """
+        Measures how quickly every wait strategy notices a state change made by the page itself
+        WAIT_BENCHMARK_DELAY after it is triggered. The polling strategies are measured with every
+        interval of WAIT_BENCHMARK_INTERVALS. For every strategy, the median and maximum latency
+        after the change in milliseconds, the checks per wait and the timeouts are logged as a JSON record.
+
+        Args:
+            :iterations: (int) - The number of state changes waited for with every strategy.
+        """
+        body = self.locate("body")
+        configurations = [
+            (name, interval) for name in [WAIT_STRATEGY_POLL, WAIT_STRATEGY_BACKOFF] for interval in WAIT_BENCHMARK_INTERVALS
+        ] + [(WAIT_STRATEGY_OBSERVER, WAIT_OBSERVER_FALLBACK_INTERVAL), (WAIT_STRATEGY_AUTO, WAIT_AUTO_INTERVALS[0])]
+        for name, interval in configurations:
+            strategy = create_wait_strategy(name, self, interval, self.waits.timeout)
+            latencies = []
+            for iteration in range(iterations):
+                token = f"{name}-{interval}-{iteration}"
+                start_time = time.perf_counter_ns()
+                self.evaluate(SET_ATTRIBUTE_LATER_SCRIPT, {
+                    "name": WAIT_BENCHMARK_ATTRIBUTE, "value": token, "delay": WAIT_BENCHMARK_DELAY * 1000,
+                })
+                strategy.wait_for(lambda: self.get_attribute(body, WAIT_BENCHMARK_ATTRIBUTE), lambda value: value == token)
+                latencies.append((time.perf_counter_ns() - start_time) / 1e6 - WAIT_BENCHMARK_DELAY * 1000)
+            self.log(f"{WAIT_BENCHMARK_PREFIX} " + json.dumps({
+                "strategy": name,
+                "interval": interval,
+                "iterations": iterations,
+                "median_latency": round(statistics.median(latencies), 3),
+                "max_latency": round(max(latencies), 3),
+                "checks_per_wait": round(strategy.stats["checks"] / iterations, 2),
+                "timeouts": strategy.stats["timeouts"],
+            }))
+
+    def wait_for(self, read, predicate):
+        """
+        Reads a state of the page which is expected to change after an action, waiting for the change
+        with the wait strategy of the run, and returns the last state read.
+
+        Args:
+            :read: (callable) - Function which reads the state through the driver.
+            :predicate: (callable) - Function which returns whether the state is the expected one.
+        """
+        return self.waits.wait_for(read, predicate)
+
+    def read_states(self, properties, elements):
+        """
+        Returns the states of a group of elements as a dictionary {selector: {property: value}}.
+        With batched reads, all properties are collected by a single script executed in the page,
+        otherwise every property is read with its own driver call, and the number of calls is counted.
+
+        Args:
+            :properties: (dict) - The names of the properties to read, keyed by the CSS selectors of the elements.
+                Supported properties: TEXT, VALUE, CHECKED and CSS properties such as COLOR.
+            :elements: (dict) - The element handles returned by find, keyed by the same selectors.
+        """
+        if self.batched_reads:
+            self.state_read_calls += 1
+            return self.evaluate(READ_STATES_SCRIPT, properties)
+
+        readers = {TEXT: self.get_text, VALUE: self.get_value, CHECKED: self.is_checked}
+        states = {}
+        for selector, names in properties.items():
+            element = elements[selector]
+            states[selector] = {
+                name: readers[name](element) if name in readers else self.get_css_property(element, name)
+                for name in names
+            }
+            self.state_read_calls += len(names)
+        return states
+
+    def find(self, selector):
+        """
+        Returns the handle of the first element matching the CSS selector. With the element cache,
+        the handle found first is reused for the same selector on the same page, until the cache
+        is invalidated by navigation, so later lookups cost no round-trip to the driver.
+
+        Args:
+            :selector: (str) - The CSS selector of the element.
+        """
+        if not self.element_cache_enabled:
+            return self.locate(selector)
+        with self.element_cache_lock:
+            self.element_cache_stats["lookups"] += 1
+        key = (self.get_page_key(), selector)
+        element = self.element_cache.get(key)
+        if element is None:
+            element = self.locate(selector)
+            self.element_cache[key] = element
+            self.cached_elements[id(element)] = (element, key)
+        else:
+            with self.element_cache_lock:
+                self.element_cache_stats["hits"] += 1
+        return element
+
+    def recover_stale_elements(self, method):
+        """
+        Returns the driver method wrapped so that when it fails on a stale cached element,
+        the element is looked up again, cached, and the call is repeated with the new handle.
+
+        Args:
+            :method: (callable) - A driver method whose first argument is an element handle.
+        """
+        def call(element, *args):
+            try:
+                return method(element, *args)
+            except Exception as exception:
+                cached_element, key = self.cached_elements.get(id(element), (None, None))
+                if cached_element is not element or not self.is_stale_error(exception):
+                    raise
+                with self.element_cache_lock:
+                    self.element_cache_stats["stale"] += 1
+                element = self.locate(key[1])
+                self.element_cache[key] = element
+                self.cached_elements[id(element)] = (element, key)
+                return method(element, *args)
+        return call
+
+    def invalidate_element_cache(self):
+        """
+        Forgets the cached elements of all pages after navigation, which is counted as an invalidation.
+        """
+        if not self.element_cache_enabled:
+            return
+        with self.element_cache_lock:
+            self.element_cache_stats["invalidations"] += 1
+        self.evict_cached_elements()
+
+    def evict_cached_elements(self, page_key=None):
+        """
+        Forgets the cached elements of all pages or only of the given page, e.g. when the page is closed,
+        without counting an invalidation.
+
+        Args:
+            :page_key: (object) - Optional key of the page returned by get_page_key.
+        """
+        if not self.element_cache_enabled:
+            return
+        for key in list(self.element_cache):
+            if page_key is None or key[0] == page_key:
+                self.element_cache.pop(key, None)
+        for element_id, (_, key) in list(self.cached_elements.items()):
+            if page_key is None or key[0] == page_key:
+                self.cached_elements.pop(element_id, None)
+
+    def close(self):
+        """
+        Closes the log file and the browser. A browser which was only attached
+        through its endpoint is left running for the next runs.
+        """
+        if self.element_cache_enabled:
+            self.log(f"{ELEMENT_CACHE_PREFIX} " + json.dumps(self.element_cache_stats))
+        wait_time = self.waits.stats["wait_time_ns"] / 1e9
+        self.log(f"{WAIT_STATS_PREFIX} " + json.dumps({
+            "strategy": self.waits.name,
+            "interval": self.waits.interval,
+            "waits": self.waits.stats["waits"],
+            "immediate": self.waits.stats["immediate"],
+            "timeouts": self.waits.stats["timeouts"],
+            "checks": self.waits.stats["checks"],
+            "wait_time": round(wait_time, 3),
+            "work_time": round(max(self.run_time - wait_time, 0), 3),
+        }))
+        self.log(f"{STATE_READS_PREFIX} " + json.dumps({"batched": self.batched_reads, "calls": self.state_read_calls}))
+        self.log(self.screenshots.close())
+        self.log_file.close()
+        self.quit_browser()
+
+    def take_screenshot(self):
+        """
+        The method is used to capture a screenshot and hand it to the screenshot pipeline,
+        which saves it on a background thread. The name of the calling test case is read
+        from the caller's frame.
+        """
+        self.screenshots.capture(sys._getframe(1).f_code.co_name, self.capture_screenshot)
+
+    def launch_browser(self, headless_mode, browser_endpoint):
+        """
+        Launches the browser, or attaches to the one running at the given endpoint.
+
+        Args:
+            :headless_mode: (bool) - Specifies whether the browser should run in headless mode.
+            :browser_endpoint: (str) - Optional remote debugging endpoint of an already running Chrome.
+        """
+        raise NotImplementedError
+
+    def quit_browser(self):
+        """
+        Closes the browser, or only detaches from it if it was attached through its endpoint.
+        """
+        raise NotImplementedError
+
+    def reset_page(self):
+        """
+        Prepares a clean state of the testing application for the next repetition
+        in the already running browser.
+        """
+        raise NotImplementedError
+
+    def capture_screenshot(self, image_format, quality):
+        """
+        Captures the visible part of the page in the given format, as bytes or a base64 encoded string.
+
+        Args:
+            :image_format: (str) - The image format: png, jpeg or webp.
+            :quality: (int) - The quality of JPEG and WebP screenshots.
+        """
+        raise NotImplementedError
+
+    def get_title(self):
+        """
+        Returns the title of the current page.
+        """
+        raise NotImplementedError
+
+    def reload(self):
+        """
+        Reloads the current page.
+        """
+        raise NotImplementedError
+
+    def wait_for_visible(self, selector, timeout):
+        """
+        Waits until the element matching the CSS selector is visible.
+
+        Args:
+            :selector: (str) - The CSS selector of the element.
+            :timeout: (float) - Maximum time to wait, in seconds.
+        """
+        raise NotImplementedError
+
+    def wait_natively(self, check, timeout):
+        """
+        Repeats the check with the framework's own waiting mechanism and returns whether
+        it was satisfied before the timeout. Used by the auto wait strategy.
+
+        Args:
+            :check: (callable) - Function which reads the state and returns whether it is the expected one.
+            :timeout: (float) - Maximum time to wait, in seconds.
+        """
+        raise NotImplementedError
+
+    def locate(self, selector):
+        """
+        Returns the framework's handle of the first element matching the CSS selector.
+
+        Args:
+            :selector: (str) - The CSS selector of the element.
+        """
+        raise NotImplementedError
+
+    def is_stale_error(self, exception):
+        """
+        Returns whether the exception was raised because the element is no longer attached to the page.
+        Locators of frameworks which resolve them on every action never become stale.
+
+        Args:
+            :exception: (Exception) - The exception raised by a driver method.
+        """
+        return False
+
+    def get_page_key(self):
+        """
+        Returns the key of the page used by the current thread, which separates the cached elements of different pages.
+        """
+        return None
+
+    def click(self, element):
+        """
+        Clicks the centre of the element.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+        """
+        raise NotImplementedError
+
+    def hover(self, element):
+        """
+        Moves the mouse over the centre of the element.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+        """
+        raise NotImplementedError
+
+    def move_mouse_away(self):
+        """
+        Moves the mouse to the top left corner of the page.
+        """
+        raise NotImplementedError
+
+    def type_text(self, element, text):
+        """
+        Clears the text field and types the given text key by key. Raises an error
+        if the element is not editable.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+            :text: (str) - The text to type.
+        """
+        raise NotImplementedError
+
+    def drag(self, element, x_offset):
+        """
+        Presses the mouse on the centre of the element, moves it horizontally
+        by the given offset and releases it.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+            :x_offset: (int) - The horizontal offset in pixels.
+        """
+        raise NotImplementedError
+
+    def select_option(self, element, value):
+        """
+        Selects the option with the given value in the select element.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+            :value: (str) - The value of the option.
+        """
+        raise NotImplementedError
+
+    def is_visible(self, element):
+        """
+        Returns whether the element is visible.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+        """
+        raise NotImplementedError
+
+    def is_checked(self, element):
+        """
+        Returns whether the checkbox or radio button is checked.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+        """
+        raise NotImplementedError
+
+    def get_text(self, element):
+        """
+        Returns the rendered text of the element.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+        """
+        raise NotImplementedError
+
+    def get_value(self, element):
+        """
+        Returns the current value property of the element as a string.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+        """
+        raise NotImplementedError
+
+    def get_attribute(self, element, name):
+        """
+        Returns the value of the HTML attribute of the element.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+            :name: (str) - The name of the attribute.
+        """
+        raise NotImplementedError
+
+    def get_css_property(self, element, name):
+        """
+        Returns the computed value of the CSS property of the element.
+
+        Args:
+            :element: (object) - The element handle returned by find.
+            :name: (str) - The name of the CSS property.
+        """
+        raise NotImplementedError
+
+    def evaluate(self, script, argument):
+        """
+        Executes a JavaScript function in the page with a single round-trip and returns its result.
+
+        Args:
+            :script: (str) - The source of a function with one parameter, e.g. "(argument) => ...".
+            :argument: (object) - A JSON-serializable value passed to the function.
+        """
+        raise NotImplementedError
+
+    def test_case_01(self):
+        """
+        Assert the title of the testing web application.
+        """
+        actual_title = self.get_title()
+        assert PAGE_TITLE == actual_title, \
+            f"Expected title: {PAGE_TITLE}, Actual title: {actual_title}."
+
+        self.log("Test case 01: PASSED")
+
+    def test_case_02(self):
+        """
+        Assert the presence of the main table on the page.
+        """
+        main_table = self.find(f"#{TABLE_ID}")
+        assert self.is_visible(main_table), \
+            "Main table is not displayed."
+
+        self.log("Test case 02: PASSED")
+
+    def test_case_03(self):
+        """
+        Assert the content of the header.
+        """
+        header = self.find(HEADER_TAG)
+        actual_header_text = self.get_text(header)
+        assert HEADER_TEXT == actual_header_text, \
+            f"Expected header: {HEADER_TEXT}, Actual header: {actual_header_text}."
+
+        self.log("Test case 03: PASSED")
+
+    def test_case_04(self):
+        """
+        Assert the dropdown functionality: display and hide.
+        """
+        dropdown_button = self.find(f"#{HOVER_DROPDOWN_LIST_ID}")
+        dropdown_content = self.find(f".{HOVER_DROPDOWN_LIST_CONTENT_CLASS}")
+
+        self.hover(dropdown_button)
+        self.take_screenshot()
+        assert self.wait_for(lambda: self.is_visible(dropdown_content), bool), \
+            "Dropdown content is not displayed after hovering."
+
+        self.move_mouse_away()
+        self.take_screenshot()
+        assert not self.wait_for(lambda: self.is_visible(dropdown_content), lambda visible: not visible), \
+            "Dropdown content is still displayed after moving away."
+
+        self.log("Test case 04: PASSED")
+
+    def test_case_05(self):
+        """
+        Assert that selecting options from the dropdown list changes the default text.
+        """
+        dropdown_button = self.find(f"#{HOVER_DROPDOWN_LIST_ID}")
+        dropdown_option_1 = self.find(f"#{HOVER_DROPROWN_OPTION_1_ID}")
+        dropdown_option_2 = self.find(f"#{HOVER_DROPROWN_OPTION_2_ID}")
+        dropdown_option_3 = self.find(f"#{HOVER_DROPROWN_OPTION_3_ID}")
+
+        default_text_element = self.find(TEXT_AT_TOP_TAG)
+        initial_default_text = self.get_text(default_text_element)
+
+        self.hover(dropdown_button)
+        self.click(dropdown_option_1)
+        actual_text = self.wait_for(lambda: self.get_text(default_text_element), lambda text: text == TEXT_1)
+        self.take_screenshot()
+        assert actual_text == TEXT_1, \
+            f"Default text not changed after selecting option 1, Actual text: {actual_text}."
+
+        self.hover(dropdown_button)
+        self.click(dropdown_option_2)
+        actual_text = self.wait_for(lambda: self.get_text(default_text_element), lambda text: text == TEXT_2)
+        self.take_screenshot()
+        assert actual_text == TEXT_2, \
+            f"Default text not changed after selecting option 2, Actual text: {actual_text}."
+
+        self.hover(dropdown_button)
+        self.click(dropdown_option_3)
+        actual_text = self.wait_for(lambda: self.get_text(default_text_element), lambda text: text == TEXT_3)
+        self.take_screenshot()
+        assert actual_text == TEXT_3, \
+            f"Default text not changed after selecting option 3, Actual text: {actual_text}."
+
+        self.click(dropdown_button)
+        self.take_screenshot()
+        actual_text = self.wait_for(lambda: self.get_text(default_text_element), lambda text: text == initial_default_text)
+        assert actual_text == initial_default_text, \
+            "Default text not reset after closing dropdown."
+
+        self.log("Test case 05: PASSED")
+
+    def test_case_06(self):
+        """
+        Assert that entering text in text fields sets the correct values.
+        """
+        single_line_textbox = self.find(f"#{SINGLE_LINE_TEXTBOX_ID}")
+        expected_single_line_text = AUTHOR_NAME
+        self.type_text(single_line_textbox, expected_single_line_text)
+        actual_single_line_text = self.wait_for(
+            lambda: self.get_value(single_line_textbox), lambda value: value == expected_single_line_text
+        )
+        self.take_screenshot()
+        assert actual_single_line_text == expected_single_line_text, \
+            f"Incorrect value in single-line textbox, Actual text: {actual_single_line_text}."
+
+        multi_line_textbox = self.find(f"#{MULTI_LINE_TEXTBOX_ID}")
+        expected_multi_line_text = f"{AUTHOR_NAME}\n{AUTHOR_NAME}"
+        self.type_text(multi_line_textbox, expected_multi_line_text)
+        actual_multi_line_text = self.wait_for(
+            lambda: self.get_value(multi_line_textbox), lambda value: value == expected_multi_line_text
+        )
+        self.take_screenshot()
+        assert actual_multi_line_text == expected_multi_line_text, \
+            f"Incorrect value in multi-line textbox, Actual text: {actual_multi_line_text}."
+
+        self.log("Test case 06: PASSED")
+
+    def test_case_07(self):
+        """
+        Assert the text in the placeholder of the textbox.
+        """
+        placeholder_textbox = self.find(f"#{PLACEHOLDER_TEXTBOX_ID}")
+        actual_placeholder_text = self.get_attribute(placeholder_textbox, PLACEHOLDER)
+
+        assert actual_placeholder_text == EXPECTED_PLACEHOLDER_TEXT, \
+            (f"Placeholder text is not equal to expected text, "
+             f"Expected: {EXPECTED_PLACEHOLDER_TEXT}, Actual: {actual_placeholder_text}.")
+
+        self.log("Test case 07: PASSED")
+
+    def test_case_08(self):
+        """
+        Assert that clicking the button changes text and colour in button, text field, and paragraph.
+        """
+        button, read_only_textbox, paragraph = \
+            f"#{BUTTON_CHANGING_COLOUR_ID}", f"#{READ_ONLY_TEXTBOX_ID}", f"#{PARAGRAPH_ID}"
+        elements = {selector: self.find(selector) for selector in [button, read_only_textbox, paragraph]}
+        properties = {button: [COLOR], read_only_textbox: [VALUE, COLOR], paragraph: [TEXT, COLOR]}
+
+        initial_states = self.read_states(properties, elements)
+
+        self.click(elements[button])
+        self.take_screenshot()
+        states = self.wait_for(lambda: self.read_states(properties, elements), all_changed(initial_states))
+
+        assert states[button][COLOR] != initial_states[button][COLOR], \
+            "Button colour not changed after clicking."
+
+        assert states[read_only_textbox][VALUE] != initial_states[read_only_textbox][VALUE], \
+            "Read only text value not changed after clicking."
+
+        assert states[read_only_textbox][COLOR] != initial_states[read_only_textbox][COLOR], \
+            "Read only colour value not changed after clicking."
+
+        assert states[paragraph][TEXT] != initial_states[paragraph][TEXT], \
+            "Paragraph text not changed after clicking."
+
+        assert states[paragraph][COLOR] != initial_states[paragraph][COLOR], \
+            "Paragraph colour not changed after clicking."
+
+        self.log("Test case 08: PASSED")
+
+    def test_case_09(self):
+        """
+        Assert that the read-only text field is not editable.
+        """
+        read_only_text_field = self.find(f"#{READ_ONLY_TEXTBOX_ID}")
+        try:
+            self.type_text(read_only_text_field, AUTHOR_NAME)
+        except Exception:
+            pass
+        assert self.get_value(read_only_text_field) != AUTHOR_NAME, \
+            "Read-only text field is editable."
+
+        self.log("Test case 09: PASSED")
+
+    def test_case_10(self):
+        """
+        Assert that the pre-filled textbox retains its value after editing other textboxes.
+        """
+        pre_filled_textbox = self.find(f"#{PREFILLED_TEXTBOX_ID}")
+        other_textbox = self.find(f"#{SINGLE_LINE_TEXTBOX_ID}")
+
+        initial_pre_filled_value = self.get_value(pre_filled_textbox)
+        self.type_text(other_textbox, AUTHOR_NAME)
+        self.take_screenshot()
+        assert self.get_value(pre_filled_textbox) == initial_pre_filled_value, \
+            "Pre-filled textbox value changed after editing another textbox."
+
+        self.log("Test case 10: PASSED")
+
+    def test_case_11(self):
+        """
+        Assert that clicking the radio button selects it.
+        """
+        radio_button_1 = self.find(f"#{RADIO_BUTTON_1_ID}")
+        radio_button_2 = self.find(f"#{RADIO_BUTTON_2_ID}")
+        initial_state_radio_button_2 = self.is_checked(radio_button_2)
+
+        self.click(radio_button_1)
+        assert not initial_state_radio_button_2, \
+            "Radio button 2 is not deselected by default."
+        assert self.wait_for(lambda: self.is_checked(radio_button_1), bool), \
+            "Radio button 1 is not selected after clicking."
+        assert not self.is_checked(radio_button_2), \
+            "Radio button 2 is selected after clicking on radio button 1."
+
+        self.click(radio_button_2)
+        self.take_screenshot()
+        radio_button_2_checked = self.wait_for(lambda: self.is_checked(radio_button_2), bool)
+        assert not self.is_checked(radio_button_1), \
+            "Radio button 1 is still selected after clicking on radio button 2."
+        assert radio_button_2_checked, \
+            "Radio button 2 is not selected after clicking."
+
+        self.log("Test case 11: PASSED")
+
+    def test_case_12(self):
+        """
+        Assert that the predefined checkbox is initially checked.
+        """
+        predefined_checkbox = self.find(f"#{CHECKBOX_0_ID}")
+        assert self.is_checked(predefined_checkbox), \
+            "Predefined checkbox is not checked by default."
+
+        self.log("Test case 12: PASSED")
+
+    def test_case_13(self):
+        """
+        Assert that clicking the checkbox sets it as checked.
+        """
+        example_checkbox = self.find(f"#{CHECKBOX_2_ID}")
+        initial_state_checkbox = self.is_checked(example_checkbox)
+
+        self.click(example_checkbox)
+        self.take_screenshot()
+        assert not initial_state_checkbox, \
+            "Example checkbox is not deselected by default."
+        assert self.wait_for(lambda: self.is_checked(example_checkbox), bool), \
+            "Example checkbox is not checked after clicking."
+
+        self.log("Test case 13: PASSED")
+
+    def test_case_14(self):
+        """
+        Assert that the checkbox is unchecked after clicking it twice.
+        """
+        example_checkbox = self.find(f"#{CHECKBOX_1_ID}")
+        initial_state_checkbox = self.is_checked(example_checkbox)
+
+        self.click(example_checkbox)
+        self.take_screenshot()
+        checked = self.wait_for(lambda: self.is_checked(example_checkbox), lambda checked: checked != initial_state_checkbox)
+        assert checked != initial_state_checkbox, \
+            "Checkbox state not changed after the first click."
+
+        self.click(example_checkbox)
+        self.take_screenshot()
+        checked = self.wait_for(lambda: self.is_checked(example_checkbox), lambda checked: checked == initial_state_checkbox)
+        assert checked == initial_state_checkbox, \
+            "Checkbox state not changed back after the second click."
+
+        self.log("Test case 14: PASSED")
+
+    def test_case_15(self):
+        """
+        Assert that clicking multiple checkboxes simultaneously checks them.
+        """
+        checkboxes = [f"#{CHECKBOX_1_ID}", f"#{CHECKBOX_2_ID}", f"#{CHECKBOX_3_ID}"]
+        elements = {selector: self.find(selector) for selector in checkboxes}
+        properties = {selector: [CHECKED] for selector in checkboxes}
+        initial_states = self.read_states(properties, elements)
+
+        for selector in checkboxes:
+            self.click(elements[selector])
+        self.take_screenshot()
+        states = self.wait_for(lambda: self.read_states(properties, elements), all_changed(initial_states))
+        for number, selector in enumerate(checkboxes, 1):
+            assert states[selector][CHECKED] != initial_states[selector][CHECKED], \
+                f"Checkbox {number} state not changed after simultaneous clicking."
+
+        self.log("Test case 15: PASSED")
+
+    def test_case_16(self):
+        """
+        Assert that moving the slider changes the progress bar.
+        """
+        slider = self.find(f"#{SLIDER_ID}")
+        progress_bar = self.find(f"#{PROGRESS_BAR_ID}")
+
+        initial_slider_value = self.get_value(slider)
+        initial_progress_bar_value = self.get_value(progress_bar)
+        assert initial_slider_value == initial_progress_bar_value, \
+            (f"Slider value not equal to progress bar value, "
+             f"Slider: {initial_slider_value}, Progress bar: {initial_progress_bar_value}.")
+
+        self.drag(slider, SLIDER_DRAG_OFFSET)
+        self.take_screenshot()
+        progress_bar_value = self.wait_for(
+            lambda: self.get_value(progress_bar), lambda value: value != initial_progress_bar_value
+        )
+        assert progress_bar_value != initial_progress_bar_value, \
+            "Progress bar value not changed after moving the slider."
+
+        self.log("Test case 16: PASSED")
+
+    def test_case_17(self):
+        """
+        Assert that the progress bar value is updated when the slider is clicked.
+        """
+        slider = self.find(f"#{SLIDER_ID}")
+        progress_bar = self.find(f"#{PROGRESS_BAR_ID}")
+        initial_progress_bar_value = self.get_value(progress_bar)
+
+        self.click(slider)
+        self.take_screenshot()
+        progress_bar_value = self.wait_for(
+            lambda: self.get_value(progress_bar), lambda value: value != initial_progress_bar_value
+        )
+        assert progress_bar_value != initial_progress_bar_value, \
+            ("Progress bar value not changed after clicking the slider, "
+             f"Current value: {progress_bar_value}, Initial value: {initial_progress_bar_value}.")
+
+        self.log("Test case 17: PASSED")
+
+    def test_case_18(self):
+        """
+        Assert that selecting an option in the select dropdown list changes the percentage indicator.
+        """
+        select_dropdown_list = self.find(f"#{SELECT_DROPDOWN_LIST_ID}")
+        meter_bar, meter_label = f"#{PERCENTAGE_INDICATOR_BAR_ID}", f"#{PERCENTAGE_INDICATOR_LABEL_ID}"
+        elements = {meter_bar: self.find(meter_bar), meter_label: self.find(meter_label)}
+        properties = {meter_bar: [VALUE], meter_label: [TEXT]}
+
+        initial_states = self.read_states(properties, elements)
+
+        self.select_option(select_dropdown_list, OPTION_50_PERCENT)
+        self.take_screenshot()
+        states = self.wait_for(lambda: self.read_states(properties, elements), all_changed(initial_states))
+        assert states[meter_bar][VALUE] != initial_states[meter_bar][VALUE], \
+            "Meter bar value not changed after selecting an option."
+        assert states[meter_label][TEXT] != initial_states[meter_label][TEXT], \
+            "Meter label text not changed after selecting an option."
+
+        self.log("Test case 18: PASSED")
+
+    def test_case_19(self):
+        """
+        Assert that the percentage indicator value is not updated after clicking on the indicator.
+        """
+        meter_bar, meter_label = f"#{PERCENTAGE_INDICATOR_BAR_ID}", f"#{PERCENTAGE_INDICATOR_LABEL_ID}"
+        elements = {meter_bar: self.find(meter_bar), meter_label: self.find(meter_label)}
+        properties = {meter_bar: [VALUE], meter_label: [TEXT]}
+
+        initial_states = self.read_states(properties, elements)
+
+        self.click(elements[meter_bar])
+        self.take_screenshot()
+        states = self.read_states(properties, elements)
+        assert states[meter_bar][VALUE] == initial_states[meter_bar][VALUE], \
+            "Meter bar value not changed after clicking on the meter."
+        assert states[meter_label][TEXT] == initial_states[meter_label][TEXT], \
+            "Meter label text not changed after clicking on the meter."
+
+        self.log("Test case 19: PASSED")
+
+    def test_case_20(self):
+        """
+        Assert that refreshing the page displays the testing web application.
+        """
+        self.reload()
+        self.invalidate_element_cache()
+
+        self.wait_for_visible(f"#{TABLE_ID}", PAGE_LOAD_TIMEOUT)
+        main_table_after_refresh = self.find(f"#{TABLE_ID}")
+
+        self.take_screenshot()
+        assert self.is_visible(main_table_after_refresh), \
+            "Main table is not displayed after refreshing the page."
+
+        self.log("Test case 20: PASSED")
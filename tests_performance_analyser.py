@@ -1,8 +1,21 @@
 from test_settings import *
+from resource_sampler import ResourceMonitor, SAMPLE_KEYS
+from sample_writer import SampleWriter, read_samples
+from environment_guard import EnvironmentGuard
+from run_isolation import RunIsolation
+from run_watchdog import RunWatchdog
+from output_capture import OutputCapture
+from result_store import ResultStore
+from interpreter_pool import WarmInterpreterPool, get_script_command, get_script_environment
+from testing_app_server import TestingAppServer
+from page_generator import generate_page, count_elements
+from browser_session import positive_int
 from datetime import datetime as dt
 import subprocess
+import argparse
 import platform
 import psutil
+import shutil
 import time
 import csv
 import os
@@ -28,70 +41,141 @@ def get_current_datetime():
     current_datetime = dt.now()
     return current_datetime.strftime(f"%Y-%m-%d %H:%M:%S"), current_datetime.strftime(f"%Y%m%d_%H%M%S")
 
-def run_script(script_path, headless_mode):
+def run_script(
+    script_path, headless_mode, output_log_filename, sampling_interval=SAMPLING_INTERVAL, on_event=None,
+    cpu_affinity=None, interpreter_pool=None, script_arguments=(), samples_filename=None, environment_guard=None,
+    run_timeout=RUN_TIMEOUT, test_case_timeout=TEST_CASE_TIMEOUT,
+):
     """
     Executes the specified script and monitors its resource usage in real-time.
+    Samples are streamed to the samples file while the script is running, and the complete
+    series are read back from it only after the script has exited.
 
     Args:
         :script_path: (str) - The path to the script to be executed.
         :headless_mode: (bool) - Specifies whether the script should run in headless mode.
+        :output_log_filename: (str) - The path of the file for the captured script output.
+        :sampling_interval: (float) - Time between two consecutive resource samples, in seconds.
+        :on_event: (callable) - Optional function called with every test case result reported by the script.
+        :cpu_affinity: (list) - Optional list of CPUs to which the script and its children are pinned.
+        :interpreter_pool: (WarmInterpreterPool) - Optional pool of interpreters with the frameworks already imported,
+            which excludes the interpreter startup cost from the measurement.
+        :script_arguments: (list) - Additional command line arguments of the script.
+        :samples_filename: (str) - Optional path of the file to which the samples are streamed,
+            without it all samples are kept in memory.
+        :environment_guard: (EnvironmentGuard) - Optional guard which waits for a quiet environment and measures
+            the baseline before the script is started, without it the baseline is a single 1-second snapshot.
+        :run_timeout: (float) - Maximum duration of the script in seconds, 0 disables it.
+        :test_case_timeout: (float) - Maximum time without any output of the script in seconds, 0 disables it.
     """
-    cpu_percentages = []
-    cpu_context_switches = []
-    cpu_interrupts = []
-    memory_percentages = []
-    memory_resident_set_size_bytes = []
-    disk_io_read_bytes = []
-    disk_io_write_bytes = []
-    cpu_usage_before = round(psutil.cpu_percent(interval=1), 1)
-    memory_usage_before = round(psutil.virtual_memory().percent, 1)
-    command = f"python3 {script_path} {headless_mode}"
-
-    start_time = time.time()
-    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
+    interpreter = interpreter_pool.acquire(script_path) if interpreter_pool else None
+    if environment_guard:
+        environment = environment_guard.prepare()
+    else:
+        environment = {
+            "cpu_usage_before": round(psutil.cpu_percent(interval=1), 1),
+            "memory_usage_before": round(psutil.virtual_memory().percent, 1),
+            "baseline_cpu_percentages": [], "baseline_memory_percentages": [], "idle_wait_time": "",
+            "stray_processes": [], "contamination_reasons": [],
+        }
+
+    isolation = RunIsolation()
+    start_time = time.perf_counter()
+    if interpreter:
+        isolation.attach(interpreter.process)
+        process = interpreter.run(headless_mode, script_arguments)
+    else:
+        process = subprocess.Popen(
+            isolation.wrap_command(get_script_command(script_path, headless_mode, script_arguments)),
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=get_script_environment(), start_new_session=True,
+        )
+        isolation.attach(process)
+    if cpu_affinity:
+        os.sched_setaffinity(process.pid, cpu_affinity)
+    output_capture = OutputCapture(process, output_log_filename, start_time, on_event)
+    output_capture.start()
+    writer = SampleWriter(samples_filename) if samples_filename else None
+    monitor = ResourceMonitor(process.pid, sampling_interval, writer, buffer_size=SAMPLE_BUFFER_SIZE if writer else None)
+    monitor.start()
+    watchdog = RunWatchdog(
+        process, isolation, output_capture, start_time, run_timeout, test_case_timeout,
+        stack_dump_filename=f"{os.path.splitext(output_log_filename)[0]}_stacks.txt",
+    )
+    watchdog.start()
     try:
-        while process.poll() is None:
-            current_cpu_percentage = round(psutil.cpu_percent(interval=1), 1)
-            cpu_percentages.append(current_cpu_percentage)
-
-            cpu_context_switches.append(psutil.cpu_stats().ctx_switches)
-
-            cpu_interrupts.append(psutil.cpu_stats().interrupts)
-
-            current_memory_percentage = round(psutil.virtual_memory().percent, 1)
-            memory_percentages.append(current_memory_percentage)
-
-            process_memory = psutil.Process(os.getpid())
-            memory_resident_set_size_bytes.append(process_memory.memory_info().rss)
-
-            disk_io_counters = psutil.disk_io_counters()
-            disk_io_read_bytes.append(disk_io_counters.read_bytes)
-            disk_io_write_bytes.append(disk_io_counters.write_bytes)
-    except Exception as e:
-        process.terminate()
         process.wait()
+    except Exception as e:
+        watchdog.stop()
+        monitor.stop()
+        isolation.kill(list(monitor.sampler.processes.values()))
+        isolation.remove_cgroup()
+        output_capture.join()
+        if interpreter_pool:
+            interpreter_pool.replenish(script_path)
         print(f"Error: {e}")
         return
-    end_time = time.time()
-
-    execution_time = round(end_time - start_time, 1)
-    disk_io_read_diff = disk_io_read_bytes[-1] - disk_io_read_bytes[0]
-    disk_io_write_diff = disk_io_write_bytes[-1] - disk_io_write_bytes[0]
+    end_time = time.perf_counter()
+    watchdog.stop()
+    monitor.stop()
+    orphan_processes_killed = isolation.kill(list(monitor.sampler.processes.values()))
+    output_capture.join()
+    cgroup_totals = isolation.read_totals()
+    isolation.remove_cgroup()
+    if interpreter_pool:
+        interpreter_pool.replenish(script_path)
+
+    execution_time = round(end_time - start_time, 3)
+    disk_io_read_diff, disk_io_write_diff = monitor.disk_io_difference()
+    process_tree = monitor.process_tree
+    samples = (
+        read_samples(samples_filename, SAMPLE_KEYS) if writer
+        else {key: list(values) for key, values in monitor.samples.items()}
+    )
 
     return {
-        "cpu_usage_before": cpu_usage_before,
-        "memory_usage_before": memory_usage_before,
+        **environment,
+        "contaminated": bool(environment["contamination_reasons"]),
         "execution_time": execution_time,
-        "cpu_percentage": cpu_percentages,
-        "cpu_context_switches": cpu_context_switches,
-        "cpu_interrupts": cpu_interrupts,
-        "memory_percentage": memory_percentages,
-        "memory_resident_set_size_bytes": memory_resident_set_size_bytes,
+        "sampling_interval": sampling_interval,
+        "cpu_affinity": list(cpu_affinity or []),
+        "interpreter_startup_time": interpreter.startup_time if interpreter else "",
+        "interpreter_import_time": interpreter.import_time if interpreter else "",
+        **samples,
+        "recent_samples": {key: list(values) for key, values in monitor.samples.items()},
+        "sample_count": monitor.sample_count,
+        "samples_filename": samples_filename or "",
         "disk_io_read_bytes": disk_io_read_diff,
         "disk_io_write_bytes": disk_io_write_diff,
+        "process_tree_cpu_time": round(process_tree["cpu_time"] - monitor.initial_tree_cpu_time, 2),
+        "process_tree_io_read_bytes": process_tree["io_read_bytes"],
+        "process_tree_io_write_bytes": process_tree["io_write_bytes"],
+        **cgroup_totals,
+        "orphan_processes_killed": orphan_processes_killed,
+        "processes": monitor.sampler.process_summary(),
+        "browser_launch_time": output_capture.browser_launch_time,
+        "repetition_times": output_capture.repetition_times,
+        "test_case_events": output_capture.events,
+        "test_case_profiles": output_capture.test_case_profiles,
+        "throughputs": output_capture.throughputs,
+        "dom_benchmark": output_capture.dom_benchmark,
+        "state_reads": output_capture.state_reads,
+        "element_cache": output_capture.element_cache,
+        "waits": output_capture.wait_stats,
+        "wait_benchmark": output_capture.wait_benchmark,
+        "screenshot_mode": output_capture.screenshot_stats.get("mode", ""),
+        "screenshot_count": output_capture.screenshot_stats.get("count", 0),
+        "screenshot_bytes": output_capture.screenshot_stats.get("bytes", 0),
+        "screenshot_capture_time": round(output_capture.screenshot_stats.get("capture_time_ns", 0) / 1e9, 3),
+        "screenshot_write_time": round(output_capture.screenshot_stats.get("write_time_ns", 0) / 1e9, 3),
+        "screenshot_write_errors": output_capture.screenshot_stats.get("write_errors", 0),
+        "timed_out": bool(watchdog.timeout_reason),
+        "timeout_reason": watchdog.timeout_reason,
+        "timeout_screenshot": output_capture.timeout_screenshot,
+        "test_cases_passed": sum(event["status"] == "PASSED" for event in output_capture.events),
+        "test_cases_failed": sum(event["status"] == "FAILED" for event in output_capture.events),
     }
 
-def print_test_info(script, headless_mode, start_time):
+def print_test_info(script, headless_mode, start_time, network_profile=""):
     """
     Displays information before starting the test, such as the script name, headless mode, and start time.
 
@@ -99,14 +183,17 @@ def print_test_info(script, headless_mode, start_time):
         :script: (str) - The name of the script.
         :headless_mode: (bool) - Specifies whether the script is executed in headless mode.
         :start_time: (str) - Start time of test execution.
+        :network_profile: (str) - The network profile of the served testing application, empty for the file:// page.
     """
-    separator_width = os.get_terminal_size().columns 
+    separator_width = shutil.get_terminal_size().columns
     print("-" * separator_width)
 
     print(f"Running script: {script}")
     print(f"{'with' if headless_mode else 'without'} headless mode\n")
     print(f"Operating System: {get_operating_system_name()}\n") 
     print(f"Start time: {start_time}\n")
+    if network_profile:
+        print(f"Network profile: {network_profile}\n")
 
 def print_test_result(stats):
     """
@@ -117,27 +204,260 @@ def print_test_result(stats):
     """
     print(f"CPU usage before running test: {stats['cpu_usage_before']}%\n")
     print(f"Memory usage before running test: {stats['memory_usage_before']}%\n")
+    if stats["baseline_cpu_percentages"]:
+        print(
+            f"Baseline measured after waiting {stats['idle_wait_time']} seconds for a quiet environment, "
+            f"CPU usage: {', '.join(f'{percentage}%' for percentage in stats['baseline_cpu_percentages'])}\n"
+        )
+    if stats["contaminated"]:
+        print(f"WARNING: the run is contaminated - {'; '.join(stats['contamination_reasons'])}\n")
 
     print(f"Duration time: {stats['execution_time']} seconds\n")
+    print(f"Browser launch time: {stats['browser_launch_time']} seconds\n")
+    if len(stats["repetition_times"]) > 1:
+        repetition_times_formatted = ", ".join([f"{value} s" for value in stats["repetition_times"]])
+        print(f"Repetitions in the same browser: {repetition_times_formatted}\n")
+    if stats["interpreter_startup_time"] != "":
+        print(
+            f"Warm interpreter startup time (excluded from duration): {stats['interpreter_startup_time']} seconds, "
+            f"including {stats['interpreter_import_time']} seconds of imports\n"
+        )
+
+    interval = f"every {stats['sampling_interval']} seconds"
+    samples = stats["recent_samples"]
+    if stats["sample_count"] > len(samples["sample_times"]):
+        interval += f", last {len(samples['sample_times'])} of {stats['sample_count']} samples"
 
-    cpu_usage_formatted = ", ".join([f"{percentage}%" for percentage in stats["cpu_percentage"]])
-    print(f"CPU usage (measured every second): {cpu_usage_formatted}\n")
+    cpu_usage_formatted = ", ".join([f"{percentage}%" for percentage in samples["cpu_percentage"]])
+    print(f"CPU usage (measured {interval}): {cpu_usage_formatted}\n")
 
-    cpu_context_switches_formatted = ", ".join([str(value) for value in stats["cpu_context_switches"]])
-    print(f"CPU context switches per second (measured every second): {cpu_context_switches_formatted}\n")
+    cpu_context_switches_formatted = ", ".join([str(value) for value in samples["cpu_context_switches"]])
+    print(f"CPU context switches (measured {interval}): {cpu_context_switches_formatted}\n")
 
-    cpu_interrupts_formatted = ", ".join([str(value) for value in stats["cpu_interrupts"]])
-    print(f"CPU interrupts (measured every second): {cpu_interrupts_formatted}\n")
+    cpu_interrupts_formatted = ", ".join([str(value) for value in samples["cpu_interrupts"]])
+    print(f"CPU interrupts (measured {interval}): {cpu_interrupts_formatted}\n")
 
-    memory_usage_formatted = ", ".join([f"{percentage}%" for percentage in stats["memory_percentage"]])
-    print(f"Memory usage (measured every second): {memory_usage_formatted}\n")
+    memory_usage_formatted = ", ".join([f"{percentage}%" for percentage in samples["memory_percentage"]])
+    print(f"Memory usage (measured {interval}): {memory_usage_formatted}\n")
 
-    memory_resident_set_size_bytes_formatted = ", ".join([f"{value} bytes" for value in stats["memory_resident_set_size_bytes"]])
-    print(f"Memory resident set size (measured every second): {memory_resident_set_size_bytes_formatted}\n")
+    memory_resident_set_size_bytes_formatted = ", ".join([f"{value} bytes" for value in samples["memory_resident_set_size_bytes"]])
+    print(f"Memory resident set size (measured {interval}): {memory_resident_set_size_bytes_formatted}\n")
 
     print(f"Disk IO read bytes difference: {stats['disk_io_read_bytes']} bytes\n")
     print(f"Disk IO write bytes difference: {stats['disk_io_write_bytes']} bytes\n")
 
+    print(f"Process tree CPU time: {stats['process_tree_cpu_time']} seconds\n")
+    print(f"Process tree IO read bytes: {stats['process_tree_io_read_bytes']} bytes\n")
+    print(f"Process tree IO write bytes: {stats['process_tree_io_write_bytes']} bytes\n")
+    if stats["cgroup_cpu_time"] != "":
+        print(
+            f"Cgroup totals: {stats['cgroup_cpu_time']} s CPU, peak memory {stats['cgroup_memory_peak_bytes']} bytes, "
+            f"IO read {stats['cgroup_io_read_bytes']} bytes, IO write {stats['cgroup_io_write_bytes']} bytes\n"
+        )
+    if stats["timed_out"]:
+        print(
+            f"WARNING: the run timed out ({stats['timeout_reason']}), the results are partial"
+            f"{f', final screenshot: ' + stats['timeout_screenshot'] if stats['timeout_screenshot'] else ''}\n"
+        )
+    if stats["orphan_processes_killed"]:
+        print(f"WARNING: {stats['orphan_processes_killed']} processes left by the script were killed\n")
+
+    print(f"Test cases passed: {stats['test_cases_passed']}, failed: {stats['test_cases_failed']}\n")
+    if stats["state_reads"]:
+        print(
+            f"State reads: {stats['state_reads']['calls']} "
+            f"{'batched script calls' if stats['state_reads']['batched'] else 'driver calls'}\n"
+        )
+    if stats["waits"]:
+        print(
+            f"Waits ({stats['waits']['strategy']}, interval {stats['waits']['interval']} s): {stats['waits']['waits']} waits, "
+            f"{stats['waits']['immediate']} settled immediately, {stats['waits']['timeouts']} timed out, "
+            f"{stats['waits']['checks']} checks, {stats['waits']['wait_time']} s waiting, {stats['waits']['work_time']} s working\n"
+        )
+    if stats["element_cache"]:
+        print(
+            f"Element cache: {stats['element_cache']['hits']} hits of {stats['element_cache']['lookups']} lookups, "
+            f"{stats['element_cache']['stale']} stale elements located again, "
+            f"{stats['element_cache']['invalidations']} invalidations\n"
+        )
+
+    print(
+        f"Screenshots ({stats['screenshot_mode']}): {stats['screenshot_count']} taken, {stats['screenshot_bytes']} bytes, "
+        f"{stats['screenshot_capture_time']} s capturing, {stats['screenshot_write_time']} s writing in background\n"
+    )
+    if stats["screenshot_write_errors"]:
+        print(f"WARNING: {stats['screenshot_write_errors']} screenshots could not be saved\n")
+
+    if stats["test_case_profiles"]:
+        print("Slowest test cases:")
+        for profile in sorted(stats["test_case_profiles"], key=lambda profile: profile["duration_ns"], reverse=True)[:5]:
+            print(
+                f"  Test case {profile['test_case']:02d} (repetition {profile['repetition']}): "
+                f"{profile['duration_ns'] / 1e6:.1f} ms, {profile['cpu_time']} s CPU, "
+                f"RSS delta {profile['rss_delta_bytes']} bytes"
+            )
+        print()
+
+    for throughput in stats["throughputs"]:
+        print(
+            f"Throughput (repetition {throughput['repetition']}, {throughput['concurrent_pages']} pages): "
+            f"{throughput['concurrent_cases_per_second']} concurrent / {throughput['sequential_cases_per_second']} sequential "
+            f"test cases per second, {throughput['concurrent_cpu_time_per_case']} / {throughput['sequential_cpu_time_per_case']} "
+            f"s CPU per test case"
+        )
+    if stats["throughputs"]:
+        print()
+    if stats["dom_benchmark"]:
+        print(
+            f"DOM benchmark ({stats['dom_variant'] or 'original page'}, median of {stats['dom_benchmark']['iterations']}): "
+            f"lookup {stats['dom_benchmark']['lookup']} ms, header text {stats['dom_benchmark']['header_text']} ms, "
+            f"page text {stats['dom_benchmark']['page_text']} ms, screenshot {stats['dom_benchmark']['screenshot']} ms\n"
+        )
+
+    if stats["wait_benchmark"]:
+        print(f"Wait benchmark (latency after a change made {WAIT_BENCHMARK_DELAY} s after the trigger):")
+        for result in stats["wait_benchmark"]:
+            print(
+                f"  {result['strategy']:<10} interval {result['interval']:<6} median {result['median_latency']} ms, "
+                f"max {result['max_latency']} ms, {result['checks_per_wait']} checks per wait, {result['timeouts']} timeouts"
+            )
+        print()
+
+    print("Processes (sorted by CPU time):")
+    for process in stats["processes"]:
+        print(
+            f"  {process['pid']} {process['name']}: {process['cpu_time']} s CPU, "
+            f"peak RSS {process['peak_rss_bytes']} bytes, peak USS {process['peak_uss_bytes']} bytes"
+        )
+    print()
+
+def get_results_filename(script, headless_mode, start_time, directory=PERFORMANCE_LOGS_DIRECTORY, extension="csv"):
+    """
+    Returns the path of the file with the results of a single test script execution.
+
+    Args:
+        :script: (str) - The name of the script.
+        :headless_mode: (bool) - Specifies whether the script is executed in headless mode.
+        :start_time: (str) - Start time of test execution.
+        :directory: (str) - The directory in which the file is placed.
+        :extension: (str) - The extension of the file.
+    """
+    return (
+        f"{directory}/{script.replace('.py', '')}_"
+        f"{HEADLESS if headless_mode else NOHEADLESS}_"
+        f"{get_operating_system_name(separator='-')}_{start_time}.{extension}"
+    )
+
+def print_test_case_event(event):
+    """
+    Displays the result of a single test case as soon as it is reported by the script.
+
+    Args:
+        :event: (dict) - The test case event parsed from the script output.
+    """
+    print(f"Test case {event['test_case']:02d}: {event['status']} (+{event['time']} s)")
+
+def get_result_record(stats):
+    """
+    Returns the results of a single script execution as names and values (numbers, strings
+    or lists), in the order in which they are saved in the CSV file and the result store.
+
+    Args:
+        :stats: (dict) - Resource usage statistics during the script's execution.
+    """
+    return {
+        "cpu_usage_before": stats["cpu_usage_before"],
+        "memory_usage_before": stats["memory_usage_before"],
+        "baseline_cpu_percentages": stats["baseline_cpu_percentages"],
+        "baseline_memory_percentages": stats["baseline_memory_percentages"],
+        "idle_wait_time": stats["idle_wait_time"],
+        "stray_processes": stats["stray_processes"],
+        "contaminated": int(stats["contaminated"]),
+        "contamination_reasons": "; ".join(stats["contamination_reasons"]),
+        "duration_time": stats["execution_time"],
+        "network_profile": stats["network_profile"],
+        "dom_variant": stats["dom_variant"],
+        "dom_element_count": stats["dom_element_count"],
+        "sampling_interval": stats["sampling_interval"],
+        "sample_times": stats["sample_times"],
+        "cpu_affinity": stats["cpu_affinity"],
+        "interpreter_startup_time": stats["interpreter_startup_time"],
+        "interpreter_import_time": stats["interpreter_import_time"],
+
+        "cpu_percentages": stats["cpu_percentage"],
+        "cpu_context_switches": stats["cpu_context_switches"],
+        "cpu_interrupts": stats["cpu_interrupts"],
+
+        "memory_percentages": stats["memory_percentage"],
+        "memory_resident_set_size_bytes": stats["memory_resident_set_size_bytes"],
+
+        "disk_io_read_bytes": stats['disk_io_read_bytes'],
+        "disk_io_write_bytes": stats['disk_io_write_bytes'],
+
+        "memory_unique_set_size_bytes": stats["memory_unique_set_size_bytes"],
+        "memory_proportional_set_size_bytes": stats["memory_proportional_set_size_bytes"],
+
+        "process_tree_cpu_percentages": stats["process_tree_cpu_percentage"],
+        "process_tree_cpu_time": stats["process_tree_cpu_time"],
+        "process_tree_context_switches": stats["process_tree_context_switches"],
+        "process_tree_threads": stats["process_tree_threads"],
+        "process_tree_fds": stats["process_tree_fds"],
+        "process_tree_processes": stats["process_tree_processes"],
+        "process_tree_io_read_bytes": stats["process_tree_io_read_bytes"],
+        "process_tree_io_write_bytes": stats["process_tree_io_write_bytes"],
+
+        "cgroup_cpu_time": stats["cgroup_cpu_time"],
+        "cgroup_memory_peak_bytes": stats["cgroup_memory_peak_bytes"],
+        "cgroup_io_read_bytes": stats["cgroup_io_read_bytes"],
+        "cgroup_io_write_bytes": stats["cgroup_io_write_bytes"],
+        "orphan_processes_killed": stats["orphan_processes_killed"],
+
+        "browser_launch_time": stats["browser_launch_time"],
+        "repetition_times": stats["repetition_times"],
+
+        "screenshot_mode": stats["screenshot_mode"],
+        "screenshot_count": stats["screenshot_count"],
+        "screenshot_bytes": stats["screenshot_bytes"],
+        "screenshot_capture_time": stats["screenshot_capture_time"],
+        "screenshot_write_time": stats["screenshot_write_time"],
+        "screenshot_write_errors": stats["screenshot_write_errors"],
+
+        "concurrent_pages": stats["throughputs"][0]["concurrent_pages"] if stats["throughputs"] else "",
+        "concurrent_cases_per_second": [throughput["concurrent_cases_per_second"] for throughput in stats["throughputs"]],
+        "sequential_cases_per_second": [throughput["sequential_cases_per_second"] for throughput in stats["throughputs"]],
+        "concurrent_cpu_time_per_case": [throughput["concurrent_cpu_time_per_case"] for throughput in stats["throughputs"]],
+        "sequential_cpu_time_per_case": [throughput["sequential_cpu_time_per_case"] for throughput in stats["throughputs"]],
+
+        "dom_lookup_time": stats["dom_benchmark"].get("lookup", ""),
+        "dom_header_text_time": stats["dom_benchmark"].get("header_text", ""),
+        "dom_page_text_time": stats["dom_benchmark"].get("page_text", ""),
+        "dom_screenshot_time": stats["dom_benchmark"].get("screenshot", ""),
+
+        "batched_reads": int(stats["state_reads"].get("batched", False)),
+        "state_read_calls": stats["state_reads"].get("calls", ""),
+        "element_cache": int(bool(stats["element_cache"])),
+        "element_cache_lookups": stats["element_cache"].get("lookups", ""),
+        "element_cache_hits": stats["element_cache"].get("hits", ""),
+        "element_cache_stale": stats["element_cache"].get("stale", ""),
+        "element_cache_invalidations": stats["element_cache"].get("invalidations", ""),
+        "wait_strategy": stats["waits"].get("strategy", ""),
+        "wait_interval": stats["waits"].get("interval", ""),
+        "waits": stats["waits"].get("waits", ""),
+        "waits_immediate": stats["waits"].get("immediate", ""),
+        "wait_timeouts": stats["waits"].get("timeouts", ""),
+        "wait_checks": stats["waits"].get("checks", ""),
+        "wait_time": stats["waits"].get("wait_time", ""),
+        "work_time": stats["waits"].get("work_time", ""),
+
+        "timed_out": int(stats["timed_out"]),
+        "timeout_reason": stats["timeout_reason"],
+        "test_cases_passed": stats["test_cases_passed"],
+        "test_cases_failed": stats["test_cases_failed"],
+        "test_case_numbers": [event["test_case"] for event in stats["test_case_events"]],
+        "test_case_statuses": [event["status"] for event in stats["test_case_events"]],
+        "test_case_times": [event["time"] for event in stats["test_case_events"]],
+    }
+
 def write_to_csv(script, headless_mode, start_time, stats):
     """
     Writes the test results to a CSV file.
@@ -148,49 +468,354 @@ def write_to_csv(script, headless_mode, start_time, stats):
         :start_time: (str) - Start time of test execution.
         :stats: (dict) - Resource usage statistics during the script's execution.
     """
-    csv_filename = (
-        f"{PERFORMANCE_LOGS_DIRECTORY}/{script.replace('.py', '')}_"
-        f"{HEADLESS if headless_mode else NOHEADLESS}_"
-        f"{get_operating_system_name(separator='-')}_{start_time}.csv"
-    )
+    csv_filename = get_results_filename(script, headless_mode, start_time)
 
     with open(csv_filename, mode='w', newline='') as csv_file:
         writer = csv.writer(csv_file, delimiter=';')
+        for key, value in get_result_record(stats).items():
+            writer.writerow([key] + value if isinstance(value, list) else [key, value])
 
-        writer.writerow(["cpu_usage_before", stats["cpu_usage_before"]])
-        writer.writerow(["memory_usage_before", stats["memory_usage_before"]])
-        writer.writerow(["duration_time", stats["execution_time"]])
+    write_records_to_csv(script, headless_mode, start_time, stats["processes"], PROCESS_LOGS_DIRECTORY)
+    write_records_to_csv(script, headless_mode, start_time, stats["test_case_profiles"], TEST_CASE_LOGS_DIRECTORY)
+    write_records_to_csv(script, headless_mode, start_time, stats["wait_benchmark"], WAIT_BENCHMARK_LOGS_DIRECTORY)
 
-        writer.writerow(["cpu_percentages"] + stats["cpu_percentage"])
-        writer.writerow(["cpu_context_switches"] + stats["cpu_context_switches"])
-        writer.writerow(["cpu_interrupts"] + stats["cpu_interrupts"])
+def write_to_result_store(script, headless_mode, start_time, stats):
+    """
+    Appends the test results to the columnar result store. The path of the CSV file
+    is recorded as the source, so the file is not imported to the store again.
 
-        writer.writerow(["memory_percentages"] + stats["memory_percentage"])
-        writer.writerow(["memory_resident_set_size_bytes"] + stats["memory_resident_set_size_bytes"])
+    Args:
+        :script: (str) - The name of the script.
+        :headless_mode: (bool) - Specifies whether the script is executed in headless mode.
+        :start_time: (str) - Start time of test execution.
+        :stats: (dict) - Resource usage statistics during the script's execution.
+    """
+    ResultStore().append(
+        script.replace('_test.py', ''), HEADLESS if headless_mode else NOHEADLESS, platform.system(),
+        start_time, get_result_record(stats),
+        source=os.path.abspath(get_results_filename(script, headless_mode, start_time)),
+    )
 
-        writer.writerow(["disk_io_read_bytes", stats['disk_io_read_bytes']])
-        writer.writerow(["disk_io_write_bytes", stats['disk_io_write_bytes']])
+def write_records_to_csv(script, headless_mode, start_time, records, directory):
+    """
+    Writes a list of records (per-process summaries, test case profiles) to a separate CSV file.
+    The file is placed in a subdirectory, so it is not mixed with the files read by the plot creator.
 
-def performance_analyser(headless_mode):
+    Args:
+        :script: (str) - The name of the script.
+        :headless_mode: (bool) - Specifies whether the script is executed in headless mode.
+        :start_time: (str) - Start time of test execution.
+        :records: (list) - Dictionaries with the same keys, one per row.
+        :directory: (str) - The directory in which the file is placed.
+    """
+    if not records:
+        return
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    csv_filename = get_results_filename(script, headless_mode, start_time, directory=directory)
+    with open(csv_filename, mode='w', newline='') as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=list(records[0].keys()), delimiter=';')
+        writer.writeheader()
+        writer.writerows(records)
+
+def measure_script(
+    script, headless_mode, sampling_interval=SAMPLING_INTERVAL, run_suffix="", cpu_affinity=None, verbose=True,
+    interpreter_pool=None, script_arguments=(), environment_guard=None, run_timeout=RUN_TIMEOUT,
+    test_case_timeout=TEST_CASE_TIMEOUT, network_profile="", dom_variant="",
+):
     """
-    Conducts performance analysis for all testing scripts (Selenium, Playwright, Splinter).
+    Runs and measures a single test script and saves the results.
+
+    Args:
+        :script: (str) - The name of the script.
+        :headless_mode: (bool) - Specifies whether the script should be executed in headless mode.
+        :sampling_interval: (float) - Time between two consecutive resource samples, in seconds.
+        :run_suffix: (str) - Suffix added to the start time in filenames, keeps parallel runs apart.
+        :cpu_affinity: (list) - Optional list of CPUs to which the script is pinned.
+        :verbose: (bool) - Specifies whether the test information and results are displayed.
+        :interpreter_pool: (WarmInterpreterPool) - Optional pool of interpreters with the frameworks already imported.
+        :script_arguments: (list) - Additional command line arguments of the script.
+        :environment_guard: (EnvironmentGuard) - The guard run before the script, by default one which checks
+            the whole system and looks for stray browsers unless the script uses a shared browser.
+        :run_timeout: (float) - Maximum duration of the script in seconds, 0 disables it.
+        :test_case_timeout: (float) - Maximum time without any output of the script in seconds, 0 disables it.
+        :network_profile: (str) - The network profile of the served testing application passed to the script
+            with --app-url, empty for the file:// page.
+        :dom_variant: (str) - The variant of the testing application generated by page_generator.py
+            passed to the script with --app-url, empty for the original page.
+    """
+    script_path = os.path.join(script)
+    if not os.path.exists(script_path):
+        return None
+
+    start_time_readable, start_time_filename = get_current_datetime()
+    start_time_filename += run_suffix
+    if verbose:
+        print_test_info(script, headless_mode, start_time_readable, network_profile)
+    output_log_filename = get_results_filename(
+        script, headless_mode, start_time_filename, directory=OUTPUT_LOGS_DIRECTORY, extension="log"
+    )
+    samples_filename = get_results_filename(
+        script, headless_mode, start_time_filename, directory=SAMPLE_LOGS_DIRECTORY, extension="jsonl"
+    )
+    if environment_guard is None:
+        environment_guard = EnvironmentGuard(check_stray_processes="--browser-endpoint" not in script_arguments)
+    stats = run_script(
+        script_path, headless_mode, output_log_filename, sampling_interval,
+        on_event=print_test_case_event if verbose else None, cpu_affinity=cpu_affinity,
+        interpreter_pool=interpreter_pool, script_arguments=script_arguments, samples_filename=samples_filename,
+        environment_guard=environment_guard, run_timeout=run_timeout, test_case_timeout=test_case_timeout,
+    )
+    if stats:
+        stats["network_profile"] = network_profile
+        stats["dom_variant"] = dom_variant
+        stats["dom_element_count"] = count_elements(dom_variant) if dom_variant else ""
+        if verbose:
+            print_test_result(stats)
+        write_to_csv(script, headless_mode, start_time_filename, stats)
+        write_to_result_store(script, headless_mode, start_time_filename, stats)
+    return stats
+
+def performance_analyser(
+    headless_mode, sampling_interval=SAMPLING_INTERVAL, interpreter_pool=None, script_arguments=(),
+    run_timeout=RUN_TIMEOUT, test_case_timeout=TEST_CASE_TIMEOUT, network_profile="", dom_variant="",
+):
+    """
+    Conducts performance analysis for all testing scripts (Selenium, Playwright, Splinter)
+    and returns the statistics of every script.
 
     Args:
         :headless_mode: (bool) - Specifies whether scripts should be executed in headless mode.
+        :sampling_interval: (float) - Time between two consecutive resource samples, in seconds.
+        :interpreter_pool: (WarmInterpreterPool) - Optional pool of interpreters with the frameworks already imported.
+        :script_arguments: (list) - Additional command line arguments of the scripts.
+        :run_timeout: (float) - Maximum duration of every script in seconds, 0 disables it.
+        :test_case_timeout: (float) - Maximum time without any output of a script in seconds, 0 disables it.
+        :network_profile: (str) - The network profile of the served testing application, empty for the file:// page.
+        :dom_variant: (str) - The generated variant of the testing application, empty for the original page.
     """
+    results = {}
     for script in SCRIPTS_FILENAMES:
-        script_path = os.path.join(script)
-        if os.path.exists(script_path):
-            start_time_readable, start_time_filename = get_current_datetime()
-            print_test_info(script, headless_mode, start_time_readable)
-            stats = run_script(script_path, headless_mode)
-            if stats:
-                print_test_result(stats)
-                write_to_csv(script, headless_mode, start_time_filename, stats)
+        results[script] = measure_script(
+            script, headless_mode, sampling_interval, interpreter_pool=interpreter_pool,
+            script_arguments=script_arguments, run_timeout=run_timeout, test_case_timeout=test_case_timeout,
+            network_profile=network_profile, dom_variant=dom_variant,
+        )
+    return results
+
+def print_sweep(sweep_results):
+    """
+    Displays the duration time and the number of failed test cases of every script for every
+    network profile and DOM variant, showing how the waiting of each framework scales with
+    the network conditions and the size of the page.
+
+    Args:
+        :sweep_results: (dict) - The statistics of the runs keyed by headless mode, network profile,
+            DOM variant and script.
+    """
+    print("-" * shutil.get_terminal_size().columns)
+    print("Sweep (duration time in seconds / failed test cases):")
+    conditions = list(dict.fromkeys(
+        (network_profile, dom_variant) for _, network_profile, dom_variant, _ in sweep_results
+    ))
+    for headless_mode in dict.fromkeys(headless_mode for headless_mode, _, _, _ in sweep_results):
+        print(f"\n{'with' if headless_mode else 'without'} headless mode")
+        print(f"  {'script':<28}" + "".join(f"{' '.join(filter(None, condition)):>22}" for condition in conditions))
+        for script in SCRIPTS_FILENAMES:
+            cells = []
+            for network_profile, dom_variant in conditions:
+                stats = sweep_results.get((headless_mode, network_profile, dom_variant, script))
+                cells.append(f"{stats['execution_time']} / {stats['test_cases_failed']}" if stats else "-")
+            print(f"  {script:<28}" + "".join(f"{cell:>22}" for cell in cells))
+    print()
+
+def add_timeout_arguments(parser):
+    """
+    Adds the command line arguments with the timeouts enforced by the watchdog of every run.
+
+    Args:
+        :parser: (argparse.ArgumentParser) - The parser of the analyser or the scheduler.
+    """
+    parser.add_argument(
+        "--run-timeout", type=float, default=RUN_TIMEOUT,
+        help=f"maximum duration of a single run in seconds, 0 disables it (default: {RUN_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--test-case-timeout", type=float, default=TEST_CASE_TIMEOUT,
+        help=f"maximum time in seconds without any progress of a run, 0 disables it (default: {TEST_CASE_TIMEOUT})",
+    )
+
+def add_script_arguments(parser):
+    """
+    Adds the command line arguments which are passed through to every testing script.
+
+    Args:
+        :parser: (argparse.ArgumentParser) - The parser of the analyser or the scheduler.
+    """
+    parser.add_argument(
+        "--repetitions-per-browser", type=positive_int, default=1,
+        help="number of repetitions of all test cases in one browser within a single run (default: 1)",
+    )
+    parser.add_argument(
+        "--browser-endpoint",
+        help="remote debugging endpoint of a shared browser started with browser_session.py",
+    )
+    parser.add_argument(
+        "--profile-test-cases", action="store_true",
+        help="measure the duration and resource usage of every test case",
+    )
+    parser.add_argument(
+        "--screenshots", choices=SCREENSHOT_MODES, default=SCREENSHOT_MODE_PNG,
+        help=f"screenshot mode of the testing scripts (default: {SCREENSHOT_MODE_PNG})",
+    )
+    parser.add_argument(
+        "--screenshot-quality", type=int, default=SCREENSHOT_QUALITY,
+        help=f"quality of JPEG and WebP screenshots (default: {SCREENSHOT_QUALITY})",
+    )
+    parser.add_argument(
+        "--batched-reads", action="store_true",
+        help="read the states of groups of elements in a single script round-trip instead of one call per property",
+    )
+    parser.add_argument(
+        "--element-cache", action="store_true",
+        help="reuse the element handles found on a page until it is reset or reloaded instead of looking them up every time",
+    )
+    parser.add_argument(
+        "--wait-strategy", choices=WAIT_STRATEGIES, default=WAIT_STRATEGY_DEFAULT,
+        help=f"how the test cases wait for the state of the page to change after an action (default: {WAIT_STRATEGY_DEFAULT})",
+    )
+    parser.add_argument(
+        "--wait-interval", type=float, default=WAIT_INTERVAL,
+        help=f"polling interval, or first interval of the backoff, in seconds (default: {WAIT_INTERVAL})",
+    )
+    parser.add_argument(
+        "--wait-timeout", type=float, default=WAIT_TIMEOUT,
+        help=f"maximum time to wait for a single state change, in seconds (default: {WAIT_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--wait-benchmark-iterations", type=positive_int, default=0,
+        help="after the repetitions, measure how quickly every wait strategy and polling interval notices "
+             "a state change, with the given number of changes per strategy (default: off)",
+    )
+    parser.add_argument(
+        "--concurrent-pages", type=positive_int, default=CONCURRENT_PAGES,
+        help=f"number of pages running the read-only test cases at once in the async Playwright script (default: {CONCURRENT_PAGES})",
+    )
+
+def get_script_arguments(arguments):
+    """
+    Returns the additional command line arguments passed to every testing script.
+
+    Args:
+        :arguments: (argparse.Namespace) - Parsed arguments containing the ones added by add_script_arguments.
+    """
+    script_arguments = [
+        "--repetitions", str(arguments.repetitions_per_browser),
+        "--screenshots", arguments.screenshots,
+        "--screenshot-quality", str(arguments.screenshot_quality),
+        "--concurrent-pages", str(arguments.concurrent_pages),
+        "--wait-strategy", arguments.wait_strategy,
+        "--wait-interval", str(arguments.wait_interval),
+        "--wait-timeout", str(arguments.wait_timeout),
+    ]
+    if arguments.browser_endpoint:
+        script_arguments += ["--browser-endpoint", arguments.browser_endpoint]
+    if arguments.profile_test_cases:
+        script_arguments.append("--profile-test-cases")
+    if arguments.batched_reads:
+        script_arguments.append("--batched-reads")
+    if arguments.element_cache:
+        script_arguments.append("--element-cache")
+    if arguments.wait_benchmark_iterations:
+        script_arguments += ["--wait-benchmark", str(arguments.wait_benchmark_iterations)]
+    return script_arguments
+
+def validate_sampling_interval(parser, arguments):
+    """
+    Exits with an error if the sampling interval is outside the range supported by the resource monitor.
+
+    Args:
+        :parser: (argparse.ArgumentParser) - The parser which reports the error.
+        :arguments: (argparse.Namespace) - Parsed arguments containing sampling_interval.
+    """
+    if not MIN_SAMPLING_INTERVAL <= arguments.sampling_interval <= MAX_SAMPLING_INTERVAL:
+        parser.error(
+            f"sampling interval must be between {MIN_SAMPLING_INTERVAL} and {MAX_SAMPLING_INTERVAL} seconds"
+        )
+
+def parse_arguments():
+    """
+    Parses the command line arguments of the performance analyser.
+    """
+    parser = argparse.ArgumentParser(description="Runs and measures all testing scripts.")
+    parser.add_argument(
+        "--sampling-interval", type=float, default=SAMPLING_INTERVAL,
+        help=f"time between two consecutive resource samples in seconds (default: {SAMPLING_INTERVAL})",
+    )
+    parser.add_argument(
+        "--warm-pool", action="store_true",
+        help="run scripts in pre-started interpreters with the frameworks already imported",
+    )
+    parser.add_argument(
+        "--network-profiles", nargs="+", choices=list(NETWORK_PROFILES),
+        help="serve the testing application over HTTP on the loopback interface and measure the scripts "
+             "with every given network profile (default: the file:// page)",
+    )
+    parser.add_argument(
+        "--dom-variants", nargs="+", choices=list(DOM_SIZE_VARIANTS),
+        help="measure the scripts on every given variant of the testing application generated by page_generator.py, "
+             "with the DOM benchmark after the test cases (default: the original page)",
+    )
+    parser.add_argument(
+        "--dom-benchmark-iterations", type=positive_int, default=DOM_BENCHMARK_ITERATIONS,
+        help=f"repetitions of every operation of the DOM benchmark (default: {DOM_BENCHMARK_ITERATIONS})",
+    )
+    add_timeout_arguments(parser)
+    add_script_arguments(parser)
+    arguments = parser.parse_args()
+    validate_sampling_interval(parser, arguments)
+    return arguments
 
 
 if __name__ == "__main__":
+    arguments = parse_arguments()
     if not os.path.exists(PERFORMANCE_LOGS_DIRECTORY):
         os.makedirs(PERFORMANCE_LOGS_DIRECTORY)
-    for headless_mode in [True, False]:
-        performance_analyser(headless_mode)
+    interpreter_pool = WarmInterpreterPool(SCRIPTS_FILENAMES) if arguments.warm_pool else None
+    if interpreter_pool:
+        interpreter_pool.start()
+    script_arguments = get_script_arguments(arguments)
+    sweep_results = {}
+    try:
+        for network_profile in arguments.network_profiles or [""]:
+            for dom_variant in arguments.dom_variants or [""]:
+                directory = generate_page(dom_variant) if dom_variant else TESTING_APP_DIRECTORY
+                server = TestingAppServer(network_profile, directory).start() if network_profile else None
+                sweep_arguments = list(script_arguments)
+                if server:
+                    sweep_arguments += ["--app-url", server.url]
+                elif dom_variant:
+                    sweep_arguments += ["--app-url", "file://" + os.path.join(directory, "index.html")]
+                if dom_variant:
+                    sweep_arguments += ["--dom-benchmark", str(arguments.dom_benchmark_iterations)]
+                try:
+                    for headless_mode in [True, False]:
+                        results = performance_analyser(
+                            headless_mode, arguments.sampling_interval, interpreter_pool, sweep_arguments,
+                            arguments.run_timeout, arguments.test_case_timeout, network_profile, dom_variant,
+                        )
+                        for script, stats in results.items():
+                            sweep_results[(headless_mode, network_profile, dom_variant, script)] = stats
+                finally:
+                    if server:
+                        server.stop()
+                        print(server.get_summary())
+        if arguments.network_profiles or arguments.dom_variants:
+            print_sweep(sweep_results)
+        if arguments.dom_variants:
+            from plot_creator import plot_dom_size_scaling
+            plot_dom_size_scaling(sweep_results)
+    finally:
+        if interpreter_pool:
+            interpreter_pool.close()
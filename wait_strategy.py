@@ -0,0 +1,223 @@
+from test_settings import *
+import itertools
+import threading
+import time
+
+WAIT_FOR_CHANGE_SCRIPT = """(timeout) => new Promise((resolve) => {
+    const events = ["input", "change", "transitionend", "animationend"];
+    const observer = new MutationObserver(() => finish(true));
+    const timer = setTimeout(() => finish(false), timeout);
+    let finished = false;
+    function onEvent() {
+        finish(true);
+    }
+    function finish(changed) {
+        if (finished) {
+            return;
+        }
+        finished = true;
+        observer.disconnect();
+        clearTimeout(timer);
+        events.forEach((name) => document.removeEventListener(name, onEvent, true));
+        resolve(changed);
+    }
+    observer.observe(document, {attributes: true, childList: true, characterData: true, subtree: true});
+    events.forEach((name) => document.addEventListener(name, onEvent, true));
+})"""
+
+
+def retry(check, deadline_ns, delays, pause=time.sleep):
+    """
+    Pauses for the successive delays and repeats the check, until it is satisfied or the deadline passes.
+    Returns whether the check was satisfied.
+
+    Args:
+        :check: (callable) - Function which reads the state and returns whether it is the expected one.
+        :deadline_ns: (int) - The time.perf_counter_ns() value after which the check is not repeated.
+        :delays: (iterable) - The pauses before the successive checks, in seconds.
+        :pause: (callable) - Function which pauses for the given number of seconds.
+    """
+    for delay in delays:
+        remaining = (deadline_ns - time.perf_counter_ns()) / 1e9
+        if remaining <= 0:
+            return False
+        pause(min(delay, remaining))
+        if check():
+            return True
+    return False
+
+def auto_wait_delays():
+    """
+    Returns the pauses between the checks of Playwright's web-first assertions: a growing
+    schedule of WAIT_AUTO_INTERVALS, whose last interval is then repeated.
+    """
+    return itertools.chain(WAIT_AUTO_INTERVALS, itertools.repeat(WAIT_AUTO_INTERVALS[-1]))
+
+def all_changed(initial_states):
+    """
+    Returns a condition for read_states results, satisfied when every property differs from its initial value.
+
+    Args:
+        :initial_states: (dict) - The states read before the action, {selector: {property: value}}.
+    """
+    return lambda states: all(
+        states[selector][name] != value
+        for selector, properties in initial_states.items()
+        for name, value in properties.items()
+    )
+
+
+class WaitStrategy:
+    name = None
+
+    def __init__(self, app, interval=WAIT_INTERVAL, timeout=WAIT_TIMEOUT):
+        """
+        This class waits until a state read from the page after an action satisfies a condition,
+        so the test cases do not depend on how quickly each framework returns from the action.
+        The state is read once right away; only when it is not the expected one yet does the
+        strategy pause and read it again, until the timeout. The subclasses differ in how they
+        pause. The time spent after the first unsuccessful read is counted as waiting time,
+        so it can be compared with the time spent working.
+
+        Args:
+            :app: (TestingScenario) - The testing app whose driver methods read the state.
+            :interval: (float) - The polling interval, or the first interval of the backoff, in seconds.
+            :timeout: (float) - Maximum time to wait for a single condition, in seconds.
+        """
+        self.app = app
+        self.interval = interval
+        self.timeout = timeout
+        self.stats = {"waits": 0, "immediate": 0, "timeouts": 0, "checks": 0, "wait_time_ns": 0}
+        self.stats_lock = threading.Lock()
+
+    def wait_for(self, read, predicate):
+        """
+        Reads the state until the predicate is satisfied or the timeout expires, and returns the last state read,
+        so the caller asserts on it as before and reports the actual value if the wait timed out.
+
+        Args:
+            :read: (callable) - Function which reads the state through the driver.
+            :predicate: (callable) - Function which returns whether the state is the expected one.
+        """
+        values = []
+
+        def check():
+            values.append(read())
+            return predicate(values[-1])
+
+        start_time = time.perf_counter_ns()
+        immediate = satisfied = check()
+        first_check_time = time.perf_counter_ns()
+        if not satisfied:
+            satisfied = self.wait(check, start_time + int(self.timeout * 1e9))
+        with self.stats_lock:
+            self.stats["waits"] += 1
+            self.stats["immediate"] += immediate
+            self.stats["timeouts"] += not satisfied
+            self.stats["checks"] += len(values)
+            self.stats["wait_time_ns"] += time.perf_counter_ns() - first_check_time if not immediate else 0
+        return values[-1]
+
+    def wait(self, check, deadline_ns):
+        """
+        Repeats the check after the delays of the strategy and returns whether it was satisfied before the deadline.
+
+        Args:
+            :check: (callable) - Function which reads the state and returns whether it is the expected one.
+            :deadline_ns: (int) - The time.perf_counter_ns() value after which the check is not repeated.
+        """
+        return retry(check, deadline_ns, self.get_delays(), self.pause)
+
+    def get_delays(self):
+        """
+        Returns the pauses between the checks, in seconds.
+        """
+        raise NotImplementedError
+
+    def pause(self, seconds):
+        """
+        Pauses before the next check.
+
+        Args:
+            :seconds: (float) - The maximum duration of the pause.
+        """
+        time.sleep(seconds)
+
+
+class NoWait(WaitStrategy):
+    """
+    Reads the state only once, right after the action, as the test cases did before the wait layer.
+    """
+    name = WAIT_STRATEGY_NONE
+
+    def wait(self, check, deadline_ns):
+        return False
+
+
+class FixedPollWait(WaitStrategy):
+    """
+    Checks the state again after a constant interval.
+    """
+    name = WAIT_STRATEGY_POLL
+
+    def get_delays(self):
+        return itertools.repeat(self.interval)
+
+
+class BackoffWait(WaitStrategy):
+    """
+    Checks the state again after intervals growing by WAIT_BACKOFF_FACTOR up to WAIT_BACKOFF_MAX_INTERVAL,
+    which notices quick changes early without sending many commands while a slow change is pending.
+    """
+    name = WAIT_STRATEGY_BACKOFF
+
+    def get_delays(self):
+        delay = self.interval
+        while True:
+            yield delay
+            delay = min(delay * WAIT_BACKOFF_FACTOR, max(WAIT_BACKOFF_MAX_INTERVAL, self.interval))
+
+
+class MutationObserverWait(WaitStrategy):
+    """
+    Instead of sleeping, runs a script in the page which resolves as soon as the DOM is mutated or an input,
+    change or transition end event is dispatched, so the state is checked again right after the page changes.
+    Changes which produce neither, such as computed styles of pseudo-classes, are caught by the check
+    repeated every WAIT_OBSERVER_FALLBACK_INTERVAL.
+    """
+    name = WAIT_STRATEGY_OBSERVER
+
+    def get_delays(self):
+        return itertools.repeat(WAIT_OBSERVER_FALLBACK_INTERVAL)
+
+    def pause(self, seconds):
+        self.app.evaluate(WAIT_FOR_CHANGE_SCRIPT, int(seconds * 1000))
+
+
+class AutoWait(WaitStrategy):
+    """
+    Leaves the waiting to the framework itself: Playwright's auto-waiting retry schedule of its
+    web-first assertions, WebDriverWait for Selenium and Splinter.
+    """
+    name = WAIT_STRATEGY_AUTO
+
+    def wait(self, check, deadline_ns):
+        return self.app.wait_natively(check, max(deadline_ns - time.perf_counter_ns(), 0) / 1e9)
+
+
+WAIT_STRATEGY_CLASSES = {
+    strategy.name: strategy for strategy in [NoWait, FixedPollWait, BackoffWait, MutationObserverWait, AutoWait]
+}
+
+
+def create_wait_strategy(name, app, interval=WAIT_INTERVAL, timeout=WAIT_TIMEOUT):
+    """
+    Returns the wait strategy with the given name.
+
+    Args:
+        :name: (str) - One of WAIT_STRATEGIES.
+        :app: (TestingScenario) - The testing app whose driver methods read the state.
+        :interval: (float) - The polling interval, or the first interval of the backoff, in seconds.
+        :timeout: (float) - Maximum time to wait for a single condition, in seconds.
+    """
+    return WAIT_STRATEGY_CLASSES[name](app, interval, timeout)